@@ -0,0 +1,302 @@
+"""Backup and restore of the SyllaTech tables with binary COPY.
+
+Each table is streamed with asyncpg's binary COPY into its own gzip file,
+several tables at a time, next to a manifest.json recording columns, types and
+row counts. All tables are read from one exported snapshot, so the files are
+consistent with each other. Restores stream the files back the same way.
+
+    python backup.py export backups/2026-10-18
+    python backup.py export backups/bookings --table bookings --table contacts
+    python backup.py export backups/recent --visits-since 2026-09-01 --jobs 8 --level 1
+    python backup.py restore backups/2026-10-18 --database-url postgresql://localhost:5432/syllatech_staging
+    python backup.py archive
+
+DATABASE_URL from backend/.env is used unless --database-url is given. Binary
+COPY needs matching column types, so restore into a database created by the
+same (or a newer) version of server.py.
+"""
+import asyncio
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+import asyncpg
+import typer
+
+import server
+
+TABLES = (
+    "bookings",
+    "visits",
+    "newsletter_subscribers",
+    "contact_submissions",
+    "unsubscribed_emails",
+    "contacts",
+    "booking_config",
+    "admin_settings",
+    "calendar_feeds",
+)
+# contacts is derived from these; it is rebuilt when they are restored without it
+_CONTACT_SOURCES = {"newsletter_subscribers", "bookings", "contact_submissions"}
+_WRITE_BUFFER = 1024 * 1024
+_READ_CHUNK = 256 * 1024
+
+app = typer.Typer(help="Binary COPY backup and restore for the SyllaTech tables", no_args_is_help=True)
+
+
+def _database_url(database_url: Optional[str]) -> str:
+    url = database_url or os.environ.get("DATABASE_URL")
+    if not url:
+        raise typer.BadParameter("Set DATABASE_URL or pass --database-url")
+    return url
+
+
+def _select_tables(tables: Optional[List[str]]) -> List[str]:
+    if not tables:
+        return list(TABLES)
+    unknown = sorted(set(tables) - set(TABLES))
+    if unknown:
+        raise typer.BadParameter(f"Unknown table(s): {', '.join(unknown)}. Choose from {', '.join(TABLES)}")
+    return [t for t in TABLES if t in tables]
+
+
+async def _table_columns(conn, table: str) -> List[dict]:
+    """Stored (non-generated) columns in table order; generated columns cannot be COPYed in."""
+    rows = await conn.fetch(
+        """
+        SELECT attname AS name, format_type(atttypid, atttypmod) AS type
+        FROM pg_attribute
+        WHERE attrelid = $1::regclass AND attnum > 0 AND NOT attisdropped AND attgenerated = ''
+        ORDER BY attnum
+        """,
+        table,
+    )
+    return [dict(r) for r in rows]
+
+
+class _GzipSink:
+    """COPY output callback that batches chunks and compresses them off the event loop."""
+
+    def __init__(self, path: Path, level: int):
+        self.file = gzip.open(path, "wb", compresslevel=level)
+        self.buffer = bytearray()
+        self.bytes = 0
+
+    async def __call__(self, data: bytes):
+        self.buffer += data
+        self.bytes += len(data)
+        if len(self.buffer) >= _WRITE_BUFFER:
+            await self.flush()
+
+    async def flush(self):
+        if self.buffer:
+            chunk, self.buffer = bytes(self.buffer), bytearray()
+            await asyncio.to_thread(self.file.write, chunk)
+
+    async def close(self):
+        await self.flush()
+        await asyncio.to_thread(self.file.close)
+
+
+async def _gzip_source(path: Path):
+    f = gzip.open(path, "rb")
+    try:
+        while True:
+            chunk = await asyncio.to_thread(f.read, _READ_CHUNK)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        f.close()
+
+
+async def _export_table(db: asyncpg.Pool, table: str, out_dir: Path, level: int, since, until, snapshot: str) -> dict:
+    t0 = time.perf_counter()
+    async with db.acquire() as conn:
+        sink = _GzipSink(out_dir / f"{table}.bin.gz", level)
+        try:
+            # Every table is read from the snapshot exported by _export, so the files agree
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                await conn.execute(f"SET TRANSACTION SNAPSHOT '{snapshot}'")
+                columns = await _table_columns(conn, table)
+                names = ", ".join(f'"{c["name"]}"' for c in columns)
+                where, args = [], []
+                if table == "visits":
+                    if since:
+                        args.append(since)
+                        where.append(f"timestamp >= ${len(args)}")
+                    if until:
+                        args.append(until)
+                        where.append(f"timestamp < ${len(args)}")
+                sql = f"SELECT {names} FROM {table}" + (f" WHERE {' AND '.join(where)}" if where else "")
+                status = await conn.copy_from_query(sql, *args, output=sink, format="binary")
+        finally:
+            await sink.close()
+    rows = int(status.split()[-1])
+    typer.echo(f"  {table}: {rows:,} rows, {sink.bytes / 1e6:.1f} MB raw in {time.perf_counter() - t0:.1f}s")
+    return {"file": f"{table}.bin.gz", "columns": columns, "rows": rows}
+
+
+async def _restore_table(db: asyncpg.Pool, table: str, src_dir: Path, entry: dict, replace: bool) -> int:
+    t0 = time.perf_counter()
+    async with db.acquire() as conn:
+        current = {c["name"]: c["type"] for c in await _table_columns(conn, table)}
+        missing = [c["name"] for c in entry["columns"] if c["name"] not in current]
+        changed = [c["name"] for c in entry["columns"] if c["name"] in current and current[c["name"]] != c["type"]]
+        if missing or changed:
+            raise RuntimeError(f"{table}: columns missing {missing} or with changed types {changed} in target")
+        async with conn.transaction():
+            if replace:
+                await conn.execute(f"TRUNCATE {table}")
+            status = await conn.copy_to_table(
+                table,
+                source=_gzip_source(src_dir / entry["file"]),
+                columns=[c["name"] for c in entry["columns"]],
+                format="binary",
+            )
+        await conn.execute(f"ANALYZE {table}")
+    rows = int(status.split()[-1])
+    typer.echo(f"  {table}: {rows:,} rows in {time.perf_counter() - t0:.1f}s")
+    return rows
+
+
+async def _gather_limited(jobs: int, coros: dict) -> dict:
+    sem = asyncio.Semaphore(jobs)
+
+    async def run(coro):
+        async with sem:
+            return await coro
+
+    results = await asyncio.gather(*(run(c) for c in coros.values()), return_exceptions=True)
+    return dict(zip(coros, results))
+
+
+async def _export(url, tables, out_dir: Path, jobs, level, since, until):
+    out_dir.mkdir(parents=True, exist_ok=True)
+    db = await asyncpg.create_pool(url, min_size=1, max_size=jobs)
+    # Holds the exported snapshot open until every table has been copied
+    coordinator = await asyncpg.connect(url)
+    try:
+        server_version = await coordinator.fetchval("SHOW server_version")
+        async with coordinator.transaction(isolation="repeatable_read", readonly=True):
+            snapshot = await coordinator.fetchval("SELECT pg_export_snapshot()")
+            results = await _gather_limited(
+                jobs, {t: _export_table(db, t, out_dir, level, since, until, snapshot) for t in tables}
+            )
+        failed = {t: r for t, r in results.items() if isinstance(r, BaseException)}
+        manifest = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "server_version": server_version,
+            "visits_since": since.isoformat() if since else None,
+            "visits_until": until.isoformat() if until else None,
+            "tables": {t: r for t, r in results.items() if t not in failed},
+        }
+    finally:
+        await coordinator.close()
+        await db.close()
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n")
+    return failed
+
+
+async def _restore(url, tables, src_dir: Path, manifest: dict, jobs, replace):
+    db = await asyncpg.create_pool(url, min_size=1, max_size=jobs)
+    try:
+        async with db.acquire() as conn:
+            await server.init_db(conn)
+        results = await _gather_limited(
+            jobs, {t: _restore_table(db, t, src_dir, manifest["tables"][t], replace) for t in tables}
+        )
+        failed = {t: r for t, r in results.items() if isinstance(r, BaseException)}
+        restored = set(tables) - set(failed)
+        if replace and restored & _CONTACT_SOURCES and "contacts" not in tables:
+            # init_db rebuilds contacts from the submission tables when it is empty
+            async with db.acquire() as conn:
+                await conn.execute("TRUNCATE contacts")
+                await server.init_db(conn)
+            typer.echo("  contacts: rebuilt from restored submissions")
+    finally:
+        await db.close()
+    return failed
+
+
+def _report_failures(failed: dict):
+    for table, exc in failed.items():
+        typer.secho(f"  {table}: FAILED ({exc})", fg=typer.colors.RED, err=True)
+    if failed:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def export(
+    out_dir: Path = typer.Argument(..., help="Directory for the table files and manifest.json"),
+    table: Optional[List[str]] = typer.Option(None, "--table", "-t", help="Table to include (repeatable; default all)"),
+    visits_since: Optional[datetime] = typer.Option(None, help="Only visits at or after this date/time (UTC)"),
+    visits_until: Optional[datetime] = typer.Option(None, help="Only visits before this date/time (UTC)"),
+    jobs: int = typer.Option(4, min=1, help="Tables copied in parallel"),
+    level: int = typer.Option(6, min=1, max=9, help="gzip level; 1 is fastest"),
+    database_url: Optional[str] = typer.Option(None, help="Defaults to DATABASE_URL"),
+):
+    """Export tables to gzip-compressed binary COPY files."""
+    tables = _select_tables(table)
+    since, until = (d.replace(tzinfo=d.tzinfo or timezone.utc) if d else None for d in (visits_since, visits_until))
+    t0 = time.perf_counter()
+    failed = asyncio.run(_export(_database_url(database_url), tables, out_dir, jobs, level, since, until))
+    typer.echo(f"Exported {len(tables) - len(failed)} table(s) to {out_dir} in {time.perf_counter() - t0:.1f}s")
+    _report_failures(failed)
+
+
+@app.command()
+def restore(
+    src_dir: Path = typer.Argument(..., help="Directory written by export"),
+    table: Optional[List[str]] = typer.Option(None, "--table", "-t", help="Table to restore (repeatable; default all in the backup)"),
+    replace: bool = typer.Option(True, "--replace/--append", help="Truncate each table before loading it"),
+    jobs: int = typer.Option(4, min=1, help="Tables loaded in parallel"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Do not ask for confirmation"),
+    database_url: Optional[str] = typer.Option(None, help="Defaults to DATABASE_URL"),
+):
+    """Load tables from an export into the database."""
+    manifest_path = src_dir / "manifest.json"
+    if not manifest_path.exists():
+        raise typer.BadParameter(f"{manifest_path} not found")
+    manifest = json.loads(manifest_path.read_text())
+    tables = [t for t in _select_tables(table) if t in manifest["tables"]]
+    if table and len(tables) < len(set(table)):
+        raise typer.BadParameter("Some requested tables are not in this backup")
+    if not tables:
+        raise typer.BadParameter("Nothing to restore")
+    if replace and not yes:
+        typer.confirm(f"Replace the contents of {', '.join(tables)}?", abort=True)
+    t0 = time.perf_counter()
+    failed = asyncio.run(_restore(_database_url(database_url), tables, src_dir, manifest, jobs, replace))
+    typer.echo(f"Restored {len(tables) - len(failed)} table(s) from {src_dir} in {time.perf_counter() - t0:.1f}s")
+    _report_failures(failed)
+
+
+@app.command()
+def archive(database_url: Optional[str] = typer.Option(None, help="Defaults to DATABASE_URL")):
+    """Move old visits and contact submissions to the Parquet archive in ARCHIVE_DIR now."""
+    if not server.ARCHIVE_DIR:
+        raise typer.BadParameter("Set ARCHIVE_DIR in backend/.env")
+
+    async def run():
+        conn = await asyncpg.connect(_database_url(database_url))
+        try:
+            # Same lock as the server's retention job, so they never archive concurrently
+            if not await conn.fetchval("SELECT pg_try_advisory_lock($1)", server._RETENTION_LOCK_ID):
+                raise typer.BadParameter("Retention or archiving is already running")
+            return await server._archive_old_rows(conn)
+        finally:
+            await conn.close()
+
+    archived = asyncio.run(run())
+    for table, count in archived.items():
+        typer.echo(f"  {table}: {count:,} rows archived")
+    typer.echo(f"Archive up to date in {server.ARCHIVE_DIR}")
+
+
+if __name__ == "__main__":
+    app()
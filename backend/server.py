@@ -1,22 +1,41 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, BackgroundTasks, Request
-from fastapi.responses import HTMLResponse, Response
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Header, BackgroundTasks, Request, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
 import io
+import asyncio
+import base64
+import hashlib
+import heapq
+import importlib.util
 import csv
 import json
 import logging
+import random
+import re
+import secrets
+import threading
+import time
+import zlib
 import smtplib
 import requests
 from urllib.parse import quote
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from email.utils import formatdate, parsedate_to_datetime
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict, deque
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
-from pydantic import BaseModel, Field
+from zoneinfo import ZoneInfo
+from pydantic import BaseModel, Field, ValidationError
 from typing import List, Optional
 import uuid as uuid_module
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import asyncpg
 
 ROOT_DIR = Path(__file__).parent
@@ -28,20 +47,539 @@ DATABASE_URL = os.environ.get(
     'postgresql://localhost:5432/syllatech'
 )
 
+try:
+    import orjson
+except ImportError:  # falls back to the stdlib encoder
+    orjson = None
+
+
+# JSON responses. asyncpg values (datetime, date, UUID, Decimal) are encoded
+# natively instead of through jsonable_encoder / per-row Python loops; handlers
+# that let Postgres build the JSON (json_agg) pass the bytes straight through.
+def _json_default(value):
+    if isinstance(value, uuid_module.UUID):
+        return str(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, asyncpg.Record):
+        return dict(value)
+    return str(value)
+
+
+def _json_dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_json_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered with orjson; bytes content is sent as-is (pre-rendered JSON)."""
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return _json_dumps(content)
+
+
+def _json_object(raw: dict, **fields) -> FastJSONResponse:
+    """JSON object response; values in raw are JSON text (e.g. from json_agg) spliced in unparsed."""
+    parts = [_json_dumps(name) + b":" + text.encode("utf-8") for name, text in raw.items()]
+    parts += [_json_dumps(name) + b":" + _json_dumps(value) for name, value in fields.items()]
+    return FastJSONResponse(b"{" + b",".join(parts) + b"}")
+
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
 # Pool will be set on startup
-pool: Optional[asyncpg.Pool] = None
+pool: Optional["InstrumentedPool"] = None
+
+
+class _PoolStats:
+    """Acquire-wait tracking shared by load shedding and metrics."""
+
+    def __init__(self, primary: bool = True):
+        self.primary = primary
+        self.waiting = 0  # acquires currently queued for a connection
+        self.wait_ewma = 0.0  # seconds, smoothed over recent acquires
+        self.acquires = 0
+
+    def record(self, wait: float):
+        self.acquires += 1
+        self.wait_ewma += 0.2 * (wait - self.wait_ewma)
+        if self.primary:
+            _POOL_ACQUIRE_WAIT.observe(wait)
+
+
+_pool_stats = _PoolStats()
+
+
+class PoolAcquireTimeout(Exception):
+    """No pooled connection became free within DB_ACQUIRE_TIMEOUT; request handlers answer 503."""
+
+
+@app.exception_handler(PoolAcquireTimeout)
+async def _pool_timeout_handler(request: Request, exc: PoolAcquireTimeout):
+    return FastJSONResponse(
+        {"detail": "Server is busy. Please try again shortly."},
+        status_code=503,
+        headers={"Retry-After": "1"},
+    )
+
+
+class _TimedAcquire:
+    def __init__(self, pool, timeout, stats: _PoolStats):
+        self._cm = pool.acquire(timeout=DB_ACQUIRE_TIMEOUT if timeout is None else timeout)
+        self._stats = stats
+
+    async def __aenter__(self):
+        stats = self._stats
+        stats.waiting += 1
+        start = time.perf_counter()
+        try:
+            conn = await self._cm.__aenter__()
+        except asyncio.TimeoutError:
+            _POOL_ACQUIRE_TIMEOUTS.inc()
+            raise PoolAcquireTimeout()
+        finally:
+            stats.waiting -= 1
+            stats.record(time.perf_counter() - start)
+        return _ProfiledConnection(conn)
+
+    async def __aexit__(self, *exc):
+        return await self._cm.__aexit__(*exc)
+
+
+# Query profiling. Every statement run through a pooled connection is timed and
+# aggregated by fingerprint (SQL with literals and whitespace normalized).
+# DB_PROFILE=1 adds per-request query count and DB time to a Server-Timing
+# header and logs them; statements slower than SLOW_QUERY_MS go to the slow-query
+# log, with their EXPLAIN plan when SLOW_QUERY_EXPLAIN=1.
+DB_PROFILE = (os.environ.get("DB_PROFILE") or "").strip().lower() in ("1", "true", "yes")
+SLOW_QUERY_MS = float(os.environ.get("SLOW_QUERY_MS") or "500")
+SLOW_QUERY_EXPLAIN = (os.environ.get("SLOW_QUERY_EXPLAIN") or "").strip().lower() in ("1", "true", "yes")
+_QUERY_STATS_MAX_FINGERPRINTS = 1000
+_EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+
+
+class _RequestQueries:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+_request_queries: ContextVar[Optional[_RequestQueries]] = ContextVar("request_queries", default=None)
+# fingerprint -> [calls, total seconds, max seconds, rows]
+_query_stats: dict = {}
+_slow_queries: deque = deque(maxlen=100)
+
+
+@lru_cache(maxsize=2048)
+def _fingerprint(sql: str) -> str:
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"(?<![$\w])\d+(?:\.\d+)?\b", "?", sql)
+    return re.sub(r"\s+", " ", sql).strip()
+
+
+def _row_count(method: str, result) -> Optional[int]:
+    if method == "fetch":
+        return len(result)
+    if method in ("fetchrow", "fetchval"):
+        return 0 if result is None else 1
+    if method == "execute" and isinstance(result, str):
+        tail = result.rsplit(" ", 1)[-1]
+        return int(tail) if tail.isdigit() else None
+    return None
+
+
+class _ProfiledConnection:
+    """Connection proxy that times execute/fetch* and feeds the query profile."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    async def _run(self, method: str, sql: str, args, kwargs):
+        start = time.perf_counter()
+        result = await getattr(self._conn, method)(sql, *args, **kwargs)
+        elapsed = time.perf_counter() - start
+        rows = _row_count(method, result)
+        fingerprint = _fingerprint(sql)
+        stats = _query_stats.get(fingerprint)
+        if stats is None and len(_query_stats) < _QUERY_STATS_MAX_FINGERPRINTS:
+            stats = _query_stats[fingerprint] = [0, 0.0, 0.0, 0]
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] = max(stats[2], elapsed)
+            stats[3] += rows or 0
+        current = _request_queries.get()
+        if current is not None:
+            current.count += 1
+            current.seconds += elapsed
+        if SLOW_QUERY_MS and elapsed * 1000 >= SLOW_QUERY_MS:
+            await self._log_slow(sql, args, fingerprint, elapsed, rows)
+        return result
+
+    async def _log_slow(self, sql: str, args, fingerprint: str, elapsed: float, rows: Optional[int]):
+        plan = None
+        if SLOW_QUERY_EXPLAIN and sql.lstrip().lower().startswith(_EXPLAINABLE):
+            try:
+                plan = "\n".join(r[0] for r in await self._conn.fetch("EXPLAIN " + sql, *args))
+            except Exception as e:
+                plan = f"EXPLAIN failed: {e}"
+        _slow_queries.append({
+            "at": datetime.now(timezone.utc),
+            "fingerprint": fingerprint,
+            "ms": round(elapsed * 1000, 2),
+            "rows": rows,
+            "plan": plan,
+        })
+        logger.warning("Slow query %.1f ms rows=%s: %s%s", elapsed * 1000, rows, fingerprint, f"\n{plan}" if plan else "")
+
+    async def execute(self, sql: str, *args, **kwargs):
+        return await self._run("execute", sql, args, kwargs)
+
+    async def executemany(self, sql: str, args, **kwargs):
+        return await self._run("executemany", sql, (args,), kwargs)
+
+    async def fetch(self, sql: str, *args, **kwargs):
+        return await self._run("fetch", sql, args, kwargs)
+
+    async def fetchrow(self, sql: str, *args, **kwargs):
+        return await self._run("fetchrow", sql, args, kwargs)
+
+    async def fetchval(self, sql: str, *args, **kwargs):
+        return await self._run("fetchval", sql, args, kwargs)
+
+
+class QueryProfileMiddleware:
+    """Collects per-request query count and DB time; reported when DB_PROFILE is on."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        queries = _RequestQueries()
+        token = _request_queries.set(queries)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if DB_PROFILE:
+                    timing = f'db;dur={queries.seconds * 1000:.2f};desc="{queries.count} queries"'
+                    message = {**message, "headers": list(message.get("headers", [])) + [
+                        (b"server-timing", timing.encode("ascii")),
+                    ]}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _request_queries.reset(token)
+            if DB_PROFILE:
+                logger.info(
+                    "request method=%s path=%s status=%s queries=%d db_ms=%.2f total_ms=%.2f",
+                    scope["method"], scope["path"], status, queries.count,
+                    queries.seconds * 1000, (time.perf_counter() - start) * 1000,
+                )
+
+
+class InstrumentedPool:
+    """asyncpg pool wrapper: measures acquire wait and hands out profiled connections."""
+
+    def __init__(self, pool: asyncpg.Pool, stats: Optional[_PoolStats] = None):
+        self._pool = pool
+        self.stats = stats or _pool_stats
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _TimedAcquire:
+        return _TimedAcquire(self._pool, timeout, self.stats)
+
+    def __getattr__(self, name):
+        return getattr(self._pool, name)
+
+
+# Optional read replica for heavy admin reads (analytics, listings, search, exports,
+# recipients). Reads fall back to the primary when no replica is configured, when it
+# is unreachable, when its replay lag exceeds READ_REPLICA_MAX_LAG_SECONDS, or when
+# this worker handled an admin write more recently than the replica's lag (so an
+# admin sees their own edits).
+DATABASE_READ_URL = (os.environ.get("DATABASE_READ_URL") or "").strip()
+READ_REPLICA_MAX_LAG_SECONDS = float(os.environ.get("READ_REPLICA_MAX_LAG_SECONDS") or "5")
+READ_REPLICA_CHECK_SECONDS = float(os.environ.get("READ_REPLICA_CHECK_SECONDS") or "2")
+# Floor for the read-after-write window, covering lag that accrues between checks
+_READ_AFTER_WRITE_MIN_SECONDS = 1.0
+_CONNECTION_ERRORS = (
+    OSError, asyncio.TimeoutError, PoolAcquireTimeout, asyncpg.PostgresConnectionError, asyncpg.InterfaceError
+)
+
+read_pool: Optional[InstrumentedPool] = None
+
+
+class _ReplicaState:
+    def __init__(self):
+        self.healthy = False
+        self.lag = 0.0  # seconds behind the primary at the last check
+        self.last_write = float("-inf")  # monotonic time of this worker's last admin write
+
+
+_replica = _ReplicaState()
+
+
+def _read_pool() -> "InstrumentedPool":
+    """Pool for a read-only admin query: the replica when it is fresh enough, else the primary."""
+    if read_pool is None or not _replica.healthy or _replica.lag > READ_REPLICA_MAX_LAG_SECONDS:
+        return pool
+    if time.monotonic() - _replica.last_write < max(_replica.lag, _READ_AFTER_WRITE_MIN_SECONDS):
+        return pool
+    return read_pool
+
+
+class _ReadAcquire:
+    """Acquire from _read_pool(), falling back to the primary if the replica is unreachable or its pool is exhausted."""
+
+    def __init__(self, source: Optional["InstrumentedPool"] = None):
+        self.source = source or _read_pool()
+        self._cm = None
+
+    async def __aenter__(self):
+        self._cm = self.source.acquire()
+        try:
+            return await self._cm.__aenter__()
+        except _CONNECTION_ERRORS as e:
+            if self.source is pool:
+                raise
+            logger.warning("Read replica unavailable, using primary: %s", e)
+            _replica.healthy = False
+            self.source = pool
+            self._cm = pool.acquire()
+            return await self._cm.__aenter__()
+
+    async def __aexit__(self, *exc):
+        return await self._cm.__aexit__(*exc)
+
+
+async def _check_replica():
+    try:
+        async with read_pool.acquire(timeout=READ_REPLICA_CHECK_SECONDS) as conn:
+            lag = await conn.fetchval("""
+                SELECT CASE
+                    WHEN NOT pg_is_in_recovery() THEN 0
+                    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                    ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+                END
+            """)
+        _replica.lag = float(lag)
+        if not _replica.healthy:
+            logger.info("Read replica available (lag %.2fs)", _replica.lag)
+        _replica.healthy = True
+    except _CONNECTION_ERRORS as e:
+        if _replica.healthy:
+            logger.warning("Read replica check failed, using primary: %s", e)
+        _replica.healthy = False
+
+
+async def _replica_monitor_loop():
+    while True:
+        try:
+            await _check_replica()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Read replica check failed")
+            _replica.healthy = False
+        await asyncio.sleep(READ_REPLICA_CHECK_SECONDS)
+
+
+class ReadAfterWriteMiddleware:
+    """Records successful admin writes so the next reads on this worker go to the primary."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in ("GET", "HEAD", "OPTIONS") or not scope["path"].startswith("/api/admin/"):
+            return await self.app(scope, receive, send)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                _replica.last_write = time.monotonic()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# Metrics, rendered in Prometheus text format by GET /metrics. Values are per
+# worker process; counters only grow, so scrape each worker or sum in queries.
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(names: tuple, values: tuple) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class _Counter:
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] += amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for values, total in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.labels, values)} {total:g}")
+        return lines
+
+
+class _Histogram:
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = _LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        # label values -> per-bucket counts (+Inf last), sum, count
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        names = self.labels + ("le",)
+        for values, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                lines.append(f"{self.name}_bucket{_format_labels(names, values + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, values)} {total:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, values)} {count}")
+        return lines
+
+
+_HTTP_REQUESTS = _Counter("http_requests_total", "HTTP requests by route and status.", ("method", "route", "status"))
+_HTTP_LATENCY = _Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+)
+_POOL_ACQUIRE_WAIT = _Histogram("db_pool_acquire_wait_seconds", "Time spent waiting for a pool connection.")
+_POOL_ACQUIRE_TIMEOUTS = _Counter("db_pool_acquire_timeouts_total", "Pool acquires that hit DB_ACQUIRE_TIMEOUT.")
+_GEO_LATENCY = _Histogram("geo_lookup_duration_seconds", "IP geolocation lookup latency.")
+_EMAIL_LATENCY = _Histogram("email_send_duration_seconds", "SMTP send latency per message.")
+_EMAIL_FAILURES = _Counter("email_send_failures_total", "SMTP sends that raised.")
+_RATE_LIMITED = _Counter("rate_limited_requests_total", "Requests rejected by rate limiting or load shedding.", ("route", "reason"))
+_VISITS_DROPPED = _Counter("visits_dropped_total", "Tracked visits dropped at ingest (bot, duplicate, sampled).", ("reason",))
+_background_pending = defaultdict(int)  # task name -> queued or running BackgroundTasks
+
+
+def _add_task(background_tasks: BackgroundTasks, name: str, func, *args, **kwargs):
+    """BackgroundTasks.add_task that keeps the pending-task gauge for name up to date."""
+    _background_pending[name] += 1
+
+    async def run():
+        try:
+            if asyncio.iscoroutinefunction(func):
+                await func(*args, **kwargs)
+            else:
+                await run_in_threadpool(func, *args, **kwargs)
+        finally:
+            _background_pending[name] -= 1
+
+    background_tasks.add_task(run)
+
+
+class MetricsMiddleware:
+    """Counts requests and records latency per route template (not raw path, to bound cardinality)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        start = time.perf_counter()
+        status = 500
+        end = None
+
+        async def send_wrapper(message):
+            nonlocal status, end
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body"):
+                # Stop the clock here: BackgroundTasks run after the body is sent
+                end = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            _HTTP_REQUESTS.inc(scope["method"], path, str(status))
+            _HTTP_LATENCY.observe((end or time.perf_counter()) - start, scope["method"], path)
+
+
+def _render_metrics() -> str:
+    lines = []
+    for metric in (_HTTP_REQUESTS, _HTTP_LATENCY, _POOL_ACQUIRE_WAIT, _POOL_ACQUIRE_TIMEOUTS, _GEO_LATENCY, _EMAIL_LATENCY, _EMAIL_FAILURES, _RATE_LIMITED, _VISITS_DROPPED):
+        lines += metric.render()
+    gauges = [("db_pool_waiting", "Requests waiting for a pool connection.", _pool_stats.waiting)]
+    if pool is not None:
+        gauges += [
+            ("db_pool_size", "Open pool connections.", pool.get_size()),
+            ("db_pool_idle", "Idle pool connections.", pool.get_idle_size()),
+            ("db_pool_max_size", "Configured maximum pool size.", pool.get_max_size()),
+        ]
+    for name, help, value in gauges:
+        lines += [f"# HELP {name} {help}", f"# TYPE {name} gauge", f"{name} {value}"]
+    lines += ["# HELP background_tasks_pending Queued or running background tasks.", "# TYPE background_tasks_pending gauge"]
+    for name, value in sorted(_background_pending.items()):
+        lines.append(f'background_tasks_pending{{task="{name}"}} {value}')
+    return "\n".join(lines) + "\n"
 
 
 async def get_db():
     return pool
 
 
+async def _iter_cursor(conn, sql: str, *args, batch_size: int = 1000):
+    """Yield rows in batches from a server-side cursor."""
+    async with conn.transaction():
+        cur = await conn.cursor(sql, *args)
+        while True:
+            rows = await cur.fetch(batch_size)
+            if not rows:
+                break
+            yield rows
+
+
 async def _get_admin_secret():
     """Get admin secret: DB overrides env."""
     async with pool.acquire() as conn:
@@ -92,6 +630,137 @@ class ContactSubmit(BaseModel):
     message: str
 
 
+# Email normalization. email_norm is the lookup/dedup key on every table that
+# stores an email; it is lowercased and trimmed, and with EMAIL_FOLD_ALIASES=1
+# plus-tags and dots are folded for providers known to ignore them.
+EMAIL_FOLD_ALIASES = (os.environ.get("EMAIL_FOLD_ALIASES") or "").strip().lower() in ("1", "true", "yes")
+
+_EMAIL_DOMAIN_ALIASES = {"googlemail.com": "gmail.com"}
+_PLUS_TAG_DOMAINS = frozenset({
+    "gmail.com", "outlook.com", "hotmail.com", "live.com",
+    "icloud.com", "me.com", "fastmail.com", "protonmail.com", "proton.me",
+})
+_DOT_FOLD_DOMAINS = frozenset({"gmail.com"})
+
+
+def _normalize_email(email: Optional[str]) -> str:
+    e = (email or "").strip().lower()
+    if not EMAIL_FOLD_ALIASES or "@" not in e:
+        return e
+    local, _, domain = e.rpartition("@")
+    domain = _EMAIL_DOMAIN_ALIASES.get(domain, domain)
+    if domain in _PLUS_TAG_DOMAINS:
+        local = local.split("+", 1)[0]
+    if domain in _DOT_FOLD_DOMAINS:
+        local = local.replace(".", "")
+    return f"{local}@{domain}"
+
+
+def _sql_quote_list(values) -> str:
+    return ", ".join("'" + v.replace("'", "''") + "'" for v in sorted(values))
+
+
+def _normalize_email_sql(column: str) -> str:
+    """SQL expression equivalent to _normalize_email for a text column holding a single-@ address."""
+    e = f"LOWER(BTRIM({column}))"
+    if not EMAIL_FOLD_ALIASES:
+        return e
+    local = f"split_part({e}, '@', 1)"
+    domain = f"split_part({e}, '@', 2)"
+    domain = "CASE " + domain + "".join(
+        f" WHEN '{alias}' THEN '{target}'" for alias, target in _EMAIL_DOMAIN_ALIASES.items()
+    ) + f" ELSE {domain} END"
+    local = f"CASE WHEN {domain} IN ({_sql_quote_list(_PLUS_TAG_DOMAINS)}) THEN split_part({local}, '+', 1) ELSE {local} END"
+    local = f"CASE WHEN {domain} IN ({_sql_quote_list(_DOT_FOLD_DOMAINS)}) THEN replace({local}, '.', '') ELSE {local} END"
+    return f"{local} || '@' || {domain}"
+
+
+async def _backfill_email_norm(conn, table: str, key: str, key_type: str, batch_size: int = 5000):
+    """Fill email_norm for rows written before the column existed."""
+    while True:
+        rows = await conn.fetch(
+            f"SELECT {key} AS k, email FROM {table} WHERE email_norm IS NULL LIMIT {batch_size}"
+        )
+        if not rows:
+            break
+        await conn.execute(
+            f"""
+            UPDATE {table} t SET email_norm = v.norm
+            FROM UNNEST($1::{key_type}[], $2::text[]) AS v(k, norm)
+            WHERE t.{key} = v.k
+            """,
+            [r["k"] for r in rows],
+            [_normalize_email(r["email"]) for r in rows],
+        )
+
+
+async def _init_email_norm(conn):
+    """Add, backfill and index email_norm on the submission and unsubscribe tables."""
+    tables = (
+        ("newsletter_subscribers", "id", "uuid"),
+        ("bookings", "id", "uuid"),
+        ("contact_submissions", "id", "uuid"),
+        ("unsubscribed_emails", "email", "text"),
+    )
+    for table, key, key_type in tables:
+        await conn.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS email_norm VARCHAR(255)")
+        await _backfill_email_norm(conn, table, key, key_type)
+    # Duplicates can exist from before the unique indexes; keep the earliest row
+    if not await conn.fetchval("SELECT to_regclass('uq_newsletter_email_norm') IS NOT NULL"):
+        await conn.execute("""
+            DELETE FROM newsletter_subscribers a USING newsletter_subscribers b
+            WHERE a.email_norm = b.email_norm AND (a.timestamp, a.id) > (b.timestamp, b.id)
+        """)
+        await conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_newsletter_email_norm ON newsletter_subscribers(email_norm)"
+        )
+    if not await conn.fetchval("SELECT to_regclass('uq_unsubscribed_email_norm') IS NOT NULL"):
+        await conn.execute("""
+            DELETE FROM unsubscribed_emails a USING unsubscribed_emails b
+            WHERE a.email_norm = b.email_norm AND (a.timestamp, a.email) > (b.timestamp, b.email)
+        """)
+        await conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS uq_unsubscribed_email_norm ON unsubscribed_emails(email_norm)"
+        )
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_email_norm ON bookings(email_norm)")
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contact_submissions_email_norm ON contact_submissions(email_norm)"
+    )
+    # Superseded by the email_norm indexes
+    await conn.execute("DROP INDEX IF EXISTS idx_unsubscribed_email_norm")
+    for table in ("newsletter_subscribers", "bookings", "contact_submissions"):
+        await conn.execute(f"DROP INDEX IF EXISTS idx_{table}_email_lower")
+
+
+# Full-text search over bookings and contact submissions
+_SEARCH_TABLES = ("bookings", "contact_submissions")
+_search_trgm = False  # set by _init_search when pg_trgm is available
+
+
+async def _init_search(conn):
+    """Generated tsvector columns with GIN indexes, plus trigram indexes on email when possible."""
+    global _search_trgm
+    for table in _SEARCH_TABLES:
+        await conn.execute(f"""
+            ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_tsv tsvector GENERATED ALWAYS AS (
+                setweight(to_tsvector('simple', coalesce(name, '') || ' ' || coalesce(email, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(business, '')), 'B')
+                || setweight(to_tsvector('english', coalesce(message, '')), 'C')
+            ) STORED
+        """)
+        await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_search ON {table} USING gin (search_tsv)")
+    try:
+        await conn.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except asyncpg.PostgresError as e:
+        logging.getLogger(__name__).warning("pg_trgm unavailable, email search falls back to LIKE: %s", e)
+        return
+    for table in _SEARCH_TABLES:
+        await conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_email_trgm ON {table} USING gin (email_norm gin_trgm_ops)"
+        )
+    _search_trgm = True
+
+
 # Init database tables
 async def init_db(conn):
     await conn.execute("""
@@ -101,6 +770,24 @@ async def init_db(conn):
             timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW()
         )
     """)
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_status_checks_timestamp ON status_checks(timestamp)")
+    # Hourly per-client counts, maintained on insert; the summary view reads only these
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS status_check_rollups (
+            bucket TIMESTAMPTZ NOT NULL,
+            client_name VARCHAR(255) NOT NULL,
+            count INTEGER NOT NULL,
+            last_seen TIMESTAMPTZ NOT NULL,
+            PRIMARY KEY (bucket, client_name)
+        )
+    """)
+    await conn.execute("""
+        INSERT INTO status_check_rollups (bucket, client_name, count, last_seen)
+        SELECT date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', client_name, COUNT(*), MAX(timestamp)
+        FROM status_checks
+        WHERE NOT EXISTS (SELECT 1 FROM status_check_rollups)
+        GROUP BY 1, 2
+    """)
     await conn.execute("""
         CREATE TABLE IF NOT EXISTS newsletter_subscribers (
             id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -160,8 +847,85 @@ async def init_db(conn):
             timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW()
         )
     """)
+    # Sampled visits stand for 1/p visits; analytics sums weight instead of counting rows
+    await conn.execute("ALTER TABLE visits ADD COLUMN IF NOT EXISTS weight REAL NOT NULL DEFAULT 1")
     await conn.execute("CREATE INDEX IF NOT EXISTS idx_visits_timestamp ON visits(timestamp)")
     await conn.execute("CREATE INDEX IF NOT EXISTS idx_visits_country ON visits(country)")
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS contacts (
+            email_norm VARCHAR(255) PRIMARY KEY,
+            email VARCHAR(255) NOT NULL,
+            name VARCHAR(255),
+            in_newsletter BOOLEAN NOT NULL DEFAULT FALSE,
+            in_bookings BOOLEAN NOT NULL DEFAULT FALSE,
+            in_contact BOOLEAN NOT NULL DEFAULT FALSE,
+            first_seen TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+            last_seen TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        )
+    """)
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_contacts_last_seen ON contacts(last_seen DESC)")
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_newsletter ON contacts(last_seen DESC) WHERE in_newsletter"
+    )
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_bookings ON contacts(last_seen DESC) WHERE in_bookings"
+    )
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_contacts_contact ON contacts(last_seen DESC) WHERE in_contact"
+    )
+    await _init_email_norm(conn)
+    # One-off backfill of contacts from existing submissions
+    has_contacts = await conn.fetchval("SELECT EXISTS (SELECT 1 FROM contacts)")
+    if not has_contacts:
+        await conn.execute("""
+            INSERT INTO contacts (email_norm, email, name, in_newsletter, in_bookings, in_contact, first_seen, last_seen)
+            SELECT
+                email_norm,
+                (ARRAY_AGG(email ORDER BY timestamp DESC))[1],
+                (ARRAY_AGG(name ORDER BY timestamp DESC) FILTER (WHERE name IS NOT NULL AND name <> ''))[1],
+                BOOL_OR(source = 'newsletter'),
+                BOOL_OR(source = 'bookings'),
+                BOOL_OR(source = 'contact'),
+                MIN(timestamp),
+                MAX(timestamp)
+            FROM (
+                SELECT email_norm, TRIM(email) AS email, NULL::varchar AS name, 'newsletter' AS source, timestamp
+                FROM newsletter_subscribers
+                UNION ALL
+                SELECT email_norm, TRIM(email), TRIM(name), 'bookings', timestamp FROM bookings
+                UNION ALL
+                SELECT email_norm, TRIM(email), TRIM(name), 'contact', timestamp FROM contact_submissions
+            ) src
+            WHERE email_norm <> ''
+            GROUP BY email_norm
+            ON CONFLICT (email_norm) DO NOTHING
+        """)
+    # updated_at tracks admin edits for incremental exports
+    for table in ("newsletter_subscribers", "bookings", "contact_submissions"):
+        has_col = await conn.fetchval(
+            "SELECT 1 FROM information_schema.columns WHERE table_name = $1 AND column_name = 'updated_at'",
+            table,
+        )
+        if not has_col:
+            await conn.execute(f"ALTER TABLE {table} ADD COLUMN updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()")
+            await conn.execute(f"UPDATE {table} SET updated_at = timestamp")
+        await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_updated_at ON {table}(updated_at, id)")
+        # Row version for optimistic concurrency on admin edits (If-Match)
+        await conn.execute(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS version INTEGER NOT NULL DEFAULT 1")
+    # Keyset pagination and filters for /api/admin/submissions
+    for table in ("newsletter_subscribers", "bookings", "contact_submissions"):
+        await conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_timestamp_id ON {table}(timestamp, id)")
+    for table in ("newsletter_subscribers", "bookings", "contact_submissions", "unsubscribed_emails"):
+        await conn.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_email_prefix ON {table}(email_norm varchar_pattern_ops)"
+        )
+    await conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_unsubscribed_emails_timestamp ON unsubscribed_emails(timestamp, email)"
+    )
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_date_iso ON bookings(date_iso, timestamp, id)")
+    await _init_search(conn)
+    await _init_booking_schedule(conn)
+    await _init_calendar_feeds(conn)
     await conn.execute("""
         CREATE TABLE IF NOT EXISTS booking_config (
             key VARCHAR(50) PRIMARY KEY,
@@ -198,21 +962,438 @@ async def init_db(conn):
         )
 
 
+# Retention for status_checks: raw pings are kept for a few days, hourly rollups much longer.
+# 0 disables a purge. Workers coordinate through an advisory lock so only one purges at a time.
+STATUS_CHECK_RETENTION_DAYS = int(os.environ.get("STATUS_CHECK_RETENTION_DAYS") or "7")
+STATUS_ROLLUP_RETENTION_DAYS = int(os.environ.get("STATUS_ROLLUP_RETENTION_DAYS") or "365")
+RETENTION_INTERVAL_SECONDS = int(os.environ.get("RETENTION_INTERVAL_SECONDS") or "3600")
+RETENTION_BATCH_SIZE = 5000
+_RETENTION_LOCK_ID = 73050001
+_retention_task: Optional[asyncio.Task] = None
+_replica_task: Optional[asyncio.Task] = None
+
+
+async def _purge_status_checks(conn) -> int:
+    """Delete expired status checks in batches (short locks, bounded WAL bursts)."""
+    deleted = 0
+    if STATUS_CHECK_RETENTION_DAYS > 0:
+        while True:
+            result = await conn.execute(
+                """
+                DELETE FROM status_checks WHERE id IN (
+                    SELECT id FROM status_checks
+                    WHERE timestamp < NOW() - make_interval(days => $1)
+                    LIMIT $2
+                )
+                """,
+                STATUS_CHECK_RETENTION_DAYS,
+                RETENTION_BATCH_SIZE,
+            )
+            count = int(result.split()[-1])
+            deleted += count
+            if count < RETENTION_BATCH_SIZE:
+                break
+    if STATUS_ROLLUP_RETENTION_DAYS > 0:
+        await conn.execute(
+            "DELETE FROM status_check_rollups WHERE bucket < NOW() - make_interval(days => $1)",
+            STATUS_ROLLUP_RETENTION_DAYS,
+        )
+    return deleted
+
+
+async def _retention_loop():
+    while True:
+        try:
+            async with pool.acquire() as conn:
+                if await conn.fetchval("SELECT pg_try_advisory_lock($1)", _RETENTION_LOCK_ID):
+                    try:
+                        deleted = await _purge_status_checks(conn)
+                    finally:
+                        await conn.execute("SELECT pg_advisory_unlock($1)", _RETENTION_LOCK_ID)
+                    if deleted:
+                        logger.info("Retention: deleted %d status checks", deleted)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Status check retention failed")
+        if ARCHIVE_DIR:
+            try:
+                async with pool.acquire() as conn:
+                    if await conn.fetchval("SELECT pg_try_advisory_lock($1)", _RETENTION_LOCK_ID):
+                        try:
+                            archived = await _archive_old_rows(conn)
+                        finally:
+                            await conn.execute("SELECT pg_advisory_unlock($1)", _RETENTION_LOCK_ID)
+                        for table, count in archived.items():
+                            logger.info("Archive: moved %d %s rows to cold storage", count, table)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Cold-storage archive failed")
+        await asyncio.sleep(RETENTION_INTERVAL_SECONDS)
+
+
+# Cold-storage archive. Whole months of old visits and contact submissions are moved
+# to ARCHIVE_DIR/<table>/<YYYY-MM>.parquet (zstd) and listed in manifest.json. Each
+# table's boundary is the end of its newest archived month: rows before it are read
+# from the archive, rows from it onwards from Postgres, so nothing is counted twice.
+ARCHIVE_DIR = (os.environ.get("ARCHIVE_DIR") or "").strip()
+# Never less than a month, so today, the 14-day chart and recent visits stay in Postgres
+_ARCHIVE_TABLES = {
+    "visits": int(os.environ.get("ARCHIVE_VISITS_AFTER_DAYS") or "365"),
+    "contact_submissions": int(os.environ.get("ARCHIVE_CONTACT_AFTER_DAYS") or "730"),
+}
+_ARCHIVE_TABLES = {t: max(days, 31) if days > 0 else 0 for t, days in _ARCHIVE_TABLES.items()}
+ARCHIVE_ROW_GROUP_SIZE = 50000
+
+
+class _ArchiveManifest:
+    """manifest.json, re-read whenever another worker (or the CLI) rewrites it."""
+
+    def __init__(self):
+        self._mtime = None
+        self._data = {"tables": {}}
+
+    @property
+    def path(self) -> Path:
+        return Path(ARCHIVE_DIR) / "manifest.json"
+
+    def load(self) -> dict:
+        if not ARCHIVE_DIR:
+            return {"tables": {}}
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {"tables": {}}
+        if mtime != self._mtime:
+            self._data = json.loads(self.path.read_text())
+            self._mtime = mtime
+        return self._data
+
+    def save(self, data: dict):
+        tmp = self.path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp, self.path)
+
+    def boundary(self, table: str) -> Optional[datetime]:
+        value = self.load()["tables"].get(table, {}).get("boundary")
+        return datetime.fromisoformat(value) if value else None
+
+    def months(self, table: str) -> List[dict]:
+        return self.load()["tables"].get(table, {}).get("months", [])
+
+    def weighted_rows(self, table: str) -> float:
+        return sum(m.get("weight", m["rows"]) for m in self.months(table))
+
+
+_archive = _ArchiveManifest()
+
+
+def _month_start(ts: datetime) -> datetime:
+    return datetime(ts.year, ts.month, 1, tzinfo=timezone.utc)
+
+
+def _next_month(start: datetime) -> datetime:
+    return _month_start(start + timedelta(days=32))
+
+
+def _arrow_type(pg_type: str):
+    import pyarrow as pa
+
+    if pg_type == "timestamp with time zone":
+        return pa.timestamp("us", tz="UTC")
+    if pg_type in ("smallint", "integer", "bigint"):
+        return pa.int64()
+    if pg_type in ("real", "double precision"):
+        return pa.float64()
+    if pg_type == "boolean":
+        return pa.bool_()
+    return pa.string()
+
+
+async def _archive_month(conn, table: str, start: datetime, end: datetime) -> int:
+    """Copy one month to Parquet and delete it from Postgres in the same snapshot.
+
+    Repeatable read makes a concurrent edit or delete of an archived row fail the DELETE,
+    rolling back so the month is retried on the next run.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = await conn.fetch(
+        """
+        SELECT attname AS name, format_type(atttypid, atttypmod) AS type FROM pg_attribute
+        WHERE attrelid = $1::regclass AND attnum > 0 AND NOT attisdropped
+          AND attgenerated = '' AND atttypid <> 'tsvector'::regtype
+        ORDER BY attnum
+        """,
+        table,
+    )
+    names = [c["name"] for c in columns]
+    schema = pa.schema([(c["name"], _arrow_type(c["type"])) for c in columns])
+    relpath = f"{table}/{start:%Y-%m}.parquet"
+    path = Path(ARCHIVE_DIR) / relpath
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".parquet.tmp")
+    written, weight, last = 0, 0.0, None
+    async with conn.transaction(isolation="repeatable_read"):
+        writer = pq.ParquetWriter(tmp, schema, compression="zstd")
+        try:
+            async for rows in _iter_cursor(
+                conn,
+                f"SELECT {', '.join(names)} FROM {table} WHERE timestamp >= $1 AND timestamp < $2 ORDER BY timestamp, id",
+                start,
+                end,
+                batch_size=ARCHIVE_ROW_GROUP_SIZE,
+            ):
+                data = {n: [str(r[n]) if isinstance(r[n], uuid_module.UUID) else r[n] for r in rows] for n in names}
+                await asyncio.to_thread(writer.write_table, pa.table(data, schema=schema))
+                written += len(rows)
+                weight += sum(r["weight"] for r in rows) if "weight" in names else len(rows)
+                last = [rows[-1]["timestamp"].isoformat(), str(rows[-1]["id"])]
+        finally:
+            await asyncio.to_thread(writer.close)
+        delete = f"DELETE FROM {table} WHERE timestamp >= $1 AND timestamp < $2"
+        if "email" in names:
+            emails = [r["email"] for r in await conn.fetch(delete + " RETURNING email", start, end)]
+            deleted = len(emails)
+        else:
+            emails = []
+            deleted = int((await conn.execute(delete, start, end)).split()[-1])
+        if deleted != written:
+            tmp.unlink(missing_ok=True)
+            raise RuntimeError(f"{table} {start:%Y-%m} changed while archiving")
+        # contacts flags describe the hot tables only, like every other delete
+        await _refresh_contacts(conn, emails)
+        os.replace(tmp, path)
+        manifest = _archive.load()
+        entry = manifest["tables"].setdefault(table, {"months": []})
+        entry["months"] = [m for m in entry["months"] if m["file"] != relpath] + [
+            {"month": f"{start:%Y-%m}", "file": relpath, "rows": written, "weight": weight, "last": last}
+        ]
+        entry["boundary"] = end.isoformat()
+        entry["columns"] = names
+        _archive.save(manifest)
+    return written
+
+
+async def _archive_old_rows(conn) -> dict:
+    """Archive every whole month older than each table's cutoff, oldest first."""
+    archived = {}
+    for table, days in _ARCHIVE_TABLES.items():
+        if days <= 0:
+            continue
+        cutoff = _month_start(datetime.now(timezone.utc) - timedelta(days=days))
+        boundary = _archive.boundary(table)
+        if boundary:
+            # Left behind if a run stopped between writing the manifest and committing
+            result = await conn.execute(f"DELETE FROM {table} WHERE timestamp < $1", boundary)
+            if int(result.split()[-1]):
+                logger.warning("Archive: removed %s already-archived %s rows", result.split()[-1], table)
+        while True:
+            oldest = await conn.fetchval(f"SELECT MIN(timestamp) FROM {table}")
+            if oldest is None or oldest >= cutoff:
+                break
+            start = _month_start(oldest)
+            count = await _archive_month(conn, table, start, _next_month(start))
+            archived[table] = archived.get(table, 0) + count
+    return archived
+
+
+# Pool configuration. Connections older than DB_MAX_CONNECTION_LIFETIME are recycled
+# (the pool is expired and re-warmed), so server-side memory and plans don't grow forever.
+DB_POOL_MIN_SIZE = int(os.environ.get("DB_POOL_MIN_SIZE") or "1")
+DB_POOL_MAX_SIZE = max(DB_POOL_MIN_SIZE, int(os.environ.get("DB_POOL_MAX_SIZE") or "10"))
+DB_POOL_WARMUP = int(os.environ.get("DB_POOL_WARMUP") or str(DB_POOL_MIN_SIZE))
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE") or "100")
+DB_MAX_QUERIES = int(os.environ.get("DB_MAX_QUERIES") or "50000")
+DB_MAX_IDLE_SECONDS = float(os.environ.get("DB_MAX_IDLE_SECONDS") or "300")
+DB_MAX_CONNECTION_LIFETIME = float(os.environ.get("DB_MAX_CONNECTION_LIFETIME") or "3600")
+DB_ACQUIRE_TIMEOUT = float(os.environ.get("DB_ACQUIRE_TIMEOUT") or "5") or None
+
+# Statements on the public hot paths. Warmup runs each once per connection so they
+# are parsed, planned and sitting in asyncpg's statement cache before real traffic.
+_BOOKING_CONFIG_SQL = "SELECT key, value FROM booking_config WHERE key = ANY($1::text[])"
+_AVAILABILITY_SQL = """
+    SELECT (SELECT value FROM booking_config WHERE key = 'blocked_dates') AS blocked_dates,
+           (SELECT value FROM booking_config WHERE key = 'time_slots') AS time_slots,
+           ARRAY(SELECT time FROM bookings WHERE date_iso = $1 AND time IS NOT NULL) AS taken
+"""
+_SLOT_TAKEN_SQL = "SELECT 1 FROM bookings WHERE date_iso = $1 AND time = $2"
+_BOOKING_INSERT_SQL = """
+    INSERT INTO bookings (date, date_iso, time, name, email, phone, business, message, email_norm)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+"""
+_VISIT_INSERT_SQL = "INSERT INTO visits (path, country, region, city, weight) VALUES ($1, $2, $3, $4, $5)"
+_HOT_STATEMENTS = (
+    (_BOOKING_CONFIG_SQL, (["time_slots", "blocked_dates", "available_weekdays"],)),
+    (_AVAILABILITY_SQL, ("1970-01-01",)),
+    (_SLOT_TAKEN_SQL, ("1970-01-01", "")),
+    (_BOOKING_INSERT_SQL, ("", "1970-01-01", "", "", "", "", "", "", "")),
+    (_VISIT_INSERT_SQL, ("/", None, None, None, 1.0)),
+)
+_pool_recycle_task: Optional[asyncio.Task] = None
+
+
+async def _create_pool(dsn: str, stats: Optional[_PoolStats] = None) -> InstrumentedPool:
+    return InstrumentedPool(
+        await asyncpg.create_pool(
+            dsn,
+            min_size=DB_POOL_MIN_SIZE,
+            max_size=DB_POOL_MAX_SIZE,
+            max_queries=DB_MAX_QUERIES,
+            max_inactive_connection_lifetime=DB_MAX_IDLE_SECONDS,
+            statement_cache_size=DB_STATEMENT_CACHE_SIZE,
+            # UTC sessions so JSON built in Postgres matches Python's isoformat()
+            server_settings={"timezone": "UTC"},
+        ),
+        stats,
+    )
+
+
+async def _warm_pool(target: InstrumentedPool, size: int = DB_POOL_WARMUP, statements=_HOT_STATEMENTS):
+    """Open up to size connections and run the hot statements on each (writes are rolled back)."""
+    raw = target._pool
+    conns = []
+    try:
+        for _ in range(max(0, min(size, raw.get_max_size()))):
+            conns.append(await raw.acquire())
+
+        async def prepare(conn):
+            tr = conn.transaction()
+            await tr.start()
+            try:
+                for sql, args in statements:
+                    await conn.fetch(sql, *args)
+            finally:
+                await tr.rollback()
+
+        await asyncio.gather(*(prepare(c) for c in conns))
+    finally:
+        for conn in conns:
+            await raw.release(conn)
+    return len(conns)
+
+
+async def _pool_recycle_loop():
+    while True:
+        await asyncio.sleep(DB_MAX_CONNECTION_LIFETIME)
+        try:
+            for target in (pool, read_pool):
+                if target is not None:
+                    await target.expire_connections()
+            await _warm_pool(pool)
+            if read_pool is not None:
+                await _warm_pool(read_pool, statements=())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Connection recycle failed")
+
+
 @app.on_event("startup")
 async def startup():
-    global pool
-    pool = await asyncpg.create_pool(DATABASE_URL, min_size=1, max_size=10)
+    global pool, read_pool, _retention_task, _replica_task, _pool_recycle_task, _reminder_task
+    pool = await _create_pool(DATABASE_URL)
     async with pool.acquire() as conn:
         await init_db(conn)
+    warmed = await _warm_pool(pool)
+    logger.info("DB pool ready: %d warm connections (min %d, max %d)", warmed, DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE)
+    if RETENTION_INTERVAL_SECONDS > 0:
+        _retention_task = asyncio.create_task(_retention_loop())
+    if DATABASE_READ_URL:
+        try:
+            read_pool = await _create_pool(DATABASE_READ_URL, _PoolStats(primary=False))
+        except _CONNECTION_ERRORS as e:
+            logger.warning("Read replica unavailable at startup, admin reads use the primary: %s", e)
+        else:
+            await _check_replica()
+            _replica_task = asyncio.create_task(_replica_monitor_loop())
+    if DB_MAX_CONNECTION_LIFETIME > 0:
+        _pool_recycle_task = asyncio.create_task(_pool_recycle_loop())
+    # Always listen: the calendar feed cache is invalidated by the same notifications
+    _reminder_task = asyncio.create_task(_reminders.run())
 
 
 @app.on_event("shutdown")
 async def shutdown():
     global pool
+    for task in (_retention_task, _replica_task, _pool_recycle_task, _reminder_task):
+        if task:
+            task.cancel()
+    if read_pool:
+        await read_pool.close()
     if pool:
         await pool.close()
 
 
+# Contacts: one row per normalized email across newsletter, bookings and contact forms
+_CONTACT_ON_CONFLICT = """
+    ON CONFLICT (email_norm) DO UPDATE SET
+        email = EXCLUDED.email,
+        name = COALESCE(EXCLUDED.name, contacts.name),
+        in_newsletter = contacts.in_newsletter OR EXCLUDED.in_newsletter,
+        in_bookings = contacts.in_bookings OR EXCLUDED.in_bookings,
+        in_contact = contacts.in_contact OR EXCLUDED.in_contact,
+        last_seen = NOW()
+"""
+
+
+async def _upsert_contact(
+    conn,
+    email: str,
+    name: Optional[str] = None,
+    *,
+    newsletter: bool = False,
+    bookings: bool = False,
+    contact: bool = False,
+):
+    """Record that an email was seen from a source. Flags are only ever switched on here."""
+    key = _normalize_email(email)
+    if not key:
+        return
+    await conn.execute(
+        """
+        INSERT INTO contacts (email_norm, email, name, in_newsletter, in_bookings, in_contact)
+        VALUES ($1, $2, $3, $4, $5, $6)
+        """ + _CONTACT_ON_CONFLICT,
+        key,
+        email.strip(),
+        (name or "").strip() or None,
+        newsletter,
+        bookings,
+        contact,
+    )
+
+
+async def _refresh_contact(conn, email: Optional[str]):
+    """Recompute source flags for an email after a delete/update; drop it if no source remains."""
+    await _refresh_contacts(conn, [email])
+
+
+async def _refresh_contacts(conn, emails: List[Optional[str]]):
+    keys = sorted({_normalize_email(e) for e in emails} - {""})
+    if not keys:
+        return
+    await conn.execute(
+        """
+        UPDATE contacts c SET
+            in_newsletter = EXISTS (SELECT 1 FROM newsletter_subscribers s WHERE s.email_norm = c.email_norm),
+            in_bookings = EXISTS (SELECT 1 FROM bookings s WHERE s.email_norm = c.email_norm),
+            in_contact = EXISTS (SELECT 1 FROM contact_submissions s WHERE s.email_norm = c.email_norm)
+        WHERE c.email_norm = ANY($1::text[])
+        """,
+        keys,
+    )
+    await conn.execute(
+        """
+        DELETE FROM contacts
+        WHERE email_norm = ANY($1::text[]) AND NOT (in_newsletter OR in_bookings OR in_contact)
+        """,
+        keys,
+    )
+
+
 # Routes
 class TrackVisitBody(BaseModel):
     path: Optional[str] = None
@@ -226,6 +1407,120 @@ def _get_client_ip(request: Request) -> str:
     return request.client.host if request.client else ""
 
 
+# Rate limiting and load shedding for public write endpoints. Each (route, IP) gets
+# a token bucket; buckets live in an LRU table capped at RATE_LIMIT_MAX_KEYS.
+# Override limits with RATE_LIMITS="newsletter=5/60,track=120/60" (requests/seconds)
+# or disable them with RATE_LIMITS=off.
+_RATE_LIMIT_ROUTES = {
+    ("POST", "/api/track"): "track",
+    ("POST", "/api/submissions/newsletter"): "newsletter",
+    ("POST", "/api/submissions/bookings"): "bookings",
+    ("POST", "/api/submissions/contact"): "contact",
+    ("GET", "/api/unsubscribe"): "unsubscribe",
+    ("POST", "/api/unsubscribe"): "unsubscribe",
+    ("GET", "/api/calendar/bookings.ics"): "calendar",
+}
+_DEFAULT_RATE_LIMITS = {
+    "track": (60, 60),
+    "newsletter": (5, 60),
+    "bookings": (5, 60),
+    "contact": (5, 60),
+    "unsubscribe": (10, 60),
+    "calendar": (30, 60),
+}
+RATE_LIMIT_MAX_KEYS = int(os.environ.get("RATE_LIMIT_MAX_KEYS") or "50000")
+# Shed public writes while requests are queued for a pool connection and the
+# recent acquire wait is above this many milliseconds
+LOAD_SHED_WAIT_MS = float(os.environ.get("LOAD_SHED_WAIT_MS") or "250")
+
+
+def _parse_rate_limits(spec: Optional[str]) -> dict:
+    limits = dict(_DEFAULT_RATE_LIMITS)
+    spec = (spec or "").strip()
+    if spec.lower() == "off":
+        return {}
+    for item in filter(None, (p.strip() for p in spec.split(","))):
+        try:
+            name, rule = item.split("=", 1)
+            count, seconds = rule.split("/", 1)
+            limits[name.strip()] = (int(count), float(seconds))
+        except ValueError:
+            raise RuntimeError(f"Invalid RATE_LIMITS entry: {item!r}")
+    return limits
+
+
+_rate_limits = _parse_rate_limits(os.environ.get("RATE_LIMITS"))
+
+
+class _TokenBuckets:
+    """(route, ip) -> (tokens, last refill), least recently used evicted first."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()
+
+    def take(self, key, capacity: int, period: float, now: float) -> float:
+        """Consume one token; returns 0 when allowed, else seconds until a token is available."""
+        rate = capacity / period
+        entry = self._buckets.pop(key, None)
+        tokens = capacity if entry is None else min(capacity, entry[0] + (now - entry[1]) * rate)
+        retry_after = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+_rate_buckets = _TokenBuckets(RATE_LIMIT_MAX_KEYS)
+
+
+def _pool_saturated() -> bool:
+    return _pool_stats.waiting > 0 and _pool_stats.wait_ewma * 1000 > LOAD_SHED_WAIT_MS
+
+
+class RateLimitMiddleware:
+    """Rejects over-limit clients with 429 and sheds load with 503 before any DB work is queued."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            name = _RATE_LIMIT_ROUTES.get((scope["method"], scope["path"]))
+            if name is not None:
+                response = self._reject(name, Request(scope))
+                if response is not None:
+                    await response(scope, receive, send)
+                    return
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    def _reject(name: str, request: Request) -> Optional[Response]:
+        if _pool_saturated():
+            _RATE_LIMITED.inc(name, "load_shed")
+            return FastJSONResponse(
+                {"detail": "Server is busy. Please try again shortly."},
+                status_code=503,
+                headers={"Retry-After": "1"},
+            )
+        limit = _rate_limits.get(name)
+        if limit is None:
+            return None
+        retry_after = _rate_buckets.take((name, _get_client_ip(request)), limit[0], limit[1], time.monotonic())
+        if retry_after:
+            _RATE_LIMITED.inc(name, "rate_limit")
+            return FastJSONResponse(
+                {"detail": "Too many requests. Please try again later."},
+                status_code=429,
+                headers={"Retry-After": str(max(1, int(retry_after + 0.999)))},
+            )
+        return None
+
+
 def _fetch_geo(ip: str) -> tuple[str, str, str]:
     """Fetch country, region, city from IP. Returns (country, region, city)."""
     if not ip or ip in ("127.0.0.1", "localhost", "::1"):
@@ -248,18 +1543,113 @@ def _fetch_geo(ip: str) -> tuple[str, str, str]:
     return ("Unknown", "", "")
 
 
-async def _save_visit_task(ip: str, path: str):
+# Visit ingest filter, applied before a visit is queued. Known bots and monitors are
+# dropped by User-Agent, and a repeat of the same (IP, path) within VISIT_DEDUP_SECONDS
+# is dropped. Above VISIT_SAMPLE_THRESHOLD visits/minute (per worker) visits are kept
+# with probability threshold/rate and stored with weight rate/threshold.
+VISIT_BOT_FILTER = (os.environ.get("VISIT_BOT_FILTER") or "1").strip().lower() not in ("0", "false", "no")
+VISIT_DEDUP_SECONDS = float(os.environ.get("VISIT_DEDUP_SECONDS") or "1800")
+VISIT_DEDUP_MAX_KEYS = int(os.environ.get("VISIT_DEDUP_MAX_KEYS") or "100000")
+VISIT_SAMPLE_THRESHOLD = int(os.environ.get("VISIT_SAMPLE_THRESHOLD") or "0")
+
+# Regexes matched case-insensitively against the User-Agent. "bot" only counts in
+# crawler forms (Googlebot/2.1, AdsBot-Google, "Bot (", a trailing "bot", a +http
+# contact URL), so device names such as "CUBOT X30" are not treated as bots.
+_BOT_UA_PATTERNS = (
+    r"\bbot\b", r"bot[/\-_;)]", r"bot\s*\(", r"bot$", r"\+https?://",
+    r"crawl", r"spider", r"slurp", r"archiver", r"facebookexternalhit", r"embedly",
+    r"bingpreview", r"uripreview", r"web preview", r"linkpreview",
+    r"uptime", r"pingdom", r"statuscake", r"site24x7", r"checkly", r"datadog", r"newrelic",
+    r"headless", r"phantomjs", r"selenium", r"puppeteer", r"playwright", r"lighthouse", r"pagespeed",
+    r"curl/", r"wget/", r"python-requests", r"python-urllib", r"httpx", r"aiohttp", r"go-http-client",
+    r"okhttp", r"java/", r"libwww", r"scrapy", r"node-fetch",
+) + tuple(re.escape(t.strip()) for t in (os.environ.get("VISIT_BOT_PATTERNS") or "").split(",") if t.strip())
+_BOT_UA_RE = re.compile("|".join(_BOT_UA_PATTERNS), re.IGNORECASE)
+# Keys the IP hash per process, so raw IPs are never held in the dedup table
+_VISIT_HASH_KEY = os.urandom(16)
+
+
+def _is_bot(user_agent: str) -> bool:
+    return not user_agent or _BOT_UA_RE.search(user_agent) is not None
+
+
+class _RecentVisits:
+    """(IP hash, path) -> when last counted, least recently seen evicted first."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._seen: OrderedDict = OrderedDict()
+
+    def repeat(self, key, now: float, window: float) -> bool:
+        last = self._seen.get(key)
+        if last is not None and now - last < window:
+            self._seen.move_to_end(key)
+            return True
+        self._seen[key] = now
+        self._seen.move_to_end(key)
+        if len(self._seen) > self.max_keys:
+            self._seen.popitem(last=False)
+        return False
+
+
+class _VisitSampler:
+    """Visit rate over one-minute windows; above the threshold, keep with probability threshold/rate."""
+
+    def __init__(self, threshold: int):
+        self.threshold = threshold
+        self.window_start = 0.0
+        self.count = 0
+        self.previous = 0
+
+    def weight(self, now: float) -> Optional[float]:
+        """Weight to store the visit with (1/probability), or None when sampled out."""
+        elapsed = now - self.window_start
+        if elapsed >= 60:
+            self.previous = self.count if elapsed < 120 else 0
+            self.window_start, self.count = now, 0
+        self.count += 1
+        rate = max(self.previous, self.count)
+        if not self.threshold or rate <= self.threshold:
+            return 1.0
+        keep = self.threshold / rate
+        return 1.0 / keep if random.random() < keep else None
+
+
+_recent_visits = _RecentVisits(VISIT_DEDUP_MAX_KEYS)
+_visit_sampler = _VisitSampler(VISIT_SAMPLE_THRESHOLD)
+
+
+def _visit_weight(ip: str, path: str, user_agent: str) -> Optional[float]:
+    """Ingest filter: None drops the visit, otherwise the weight to store it with."""
+    if VISIT_BOT_FILTER and _is_bot(user_agent):
+        _VISITS_DROPPED.inc("bot")
+        return None
+    now = time.monotonic()
+    if VISIT_DEDUP_SECONDS > 0:
+        ip_hash = hashlib.blake2b(ip.encode(), digest_size=8, key=_VISIT_HASH_KEY).digest()
+        if _recent_visits.repeat((ip_hash, path), now, VISIT_DEDUP_SECONDS):
+            _VISITS_DROPPED.inc("duplicate")
+            return None
+    weight = _visit_sampler.weight(now)
+    if weight is None:
+        _VISITS_DROPPED.inc("sampled")
+    return weight
+
+
+async def _save_visit_task(ip: str, path: str, weight: float = 1.0):
     """Background task to fetch geo and save visit."""
-    import asyncio
     try:
+        start = time.perf_counter()
         country, region, city = await asyncio.to_thread(_fetch_geo, ip)
+        _GEO_LATENCY.observe(time.perf_counter() - start)
         async with pool.acquire() as conn:
             await conn.execute(
-                "INSERT INTO visits (path, country, region, city) VALUES ($1, $2, $3, $4)",
+                _VISIT_INSERT_SQL,
                 path,
                 country,
                 region or None,
                 city or None,
+                weight,
             )
     except Exception as e:
         logger.exception("Failed to save visit: %s", e)
@@ -270,7 +1660,9 @@ async def track_visit(data: TrackVisitBody, request: Request, background_tasks:
     """Record a page visit. Called by frontend on page load."""
     ip = _get_client_ip(request)
     path = (data.path or "/").strip()[:500]
-    background_tasks.add_task(_save_visit_task, ip, path)
+    weight = _visit_weight(ip, path, request.headers.get("user-agent") or "")
+    if weight is not None:
+        _add_task(background_tasks, "visit", _save_visit_task, ip, path, weight)
     return {"status": "ok"}
 
 
@@ -279,9 +1671,19 @@ async def create_status_check(input: StatusCheckCreate):
     async with pool.acquire() as conn:
         row = await conn.fetchrow(
             """
-            INSERT INTO status_checks (id, client_name, timestamp)
-            VALUES ($1, $2, $3)
-            RETURNING id, client_name, timestamp
+            WITH ins AS (
+                INSERT INTO status_checks (id, client_name, timestamp)
+                VALUES ($1, $2, $3)
+                RETURNING id, client_name, timestamp
+            ), rollup AS (
+                INSERT INTO status_check_rollups (bucket, client_name, count, last_seen)
+                SELECT date_trunc('hour', timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC', client_name, 1, timestamp
+                FROM ins
+                ON CONFLICT (bucket, client_name) DO UPDATE SET
+                    count = status_check_rollups.count + 1,
+                    last_seen = GREATEST(status_check_rollups.last_seen, EXCLUDED.last_seen)
+            )
+            SELECT * FROM ins
             """,
             str(uuid_module.uuid4()),
             input.client_name,
@@ -292,14 +1694,64 @@ async def create_status_check(input: StatusCheckCreate):
 
 @api_router.get("/status", response_model=List[StatusCheck])
 async def get_status_checks():
+    # Rendered by Postgres in StatusCheck's format: UTC with a Z suffix, microseconds only when non-zero
     async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            "SELECT id, client_name, timestamp FROM status_checks ORDER BY timestamp DESC LIMIT 1000"
+        body = await conn.fetchval(
+            """
+            SELECT COALESCE(json_agg(json_build_object(
+                'id', s.id::text,
+                'client_name', s.client_name,
+                'timestamp', to_char(
+                    s.timestamp AT TIME ZONE 'UTC',
+                    CASE WHEN date_trunc('second', s.timestamp) = s.timestamp
+                        THEN 'YYYY-MM-DD"T"HH24:MI:SS"Z"' ELSE 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"' END
+                )
+            ) ORDER BY s.timestamp DESC), '[]')::text FROM (
+                SELECT id, client_name, timestamp FROM status_checks ORDER BY timestamp DESC LIMIT 1000
+            ) s
+            """
+        )
+    return FastJSONResponse(body.encode("utf-8"))
+
+
+STATUS_SUMMARY_MAX_HOURS = 24 * 90
+
+
+@api_router.get("/status/summary")
+async def get_status_summary(hours: int = 24, bucket: str = "hour"):
+    """Per-client last seen and check counts per hour/day bucket, read from the hourly rollups."""
+    if bucket not in ("hour", "day"):
+        raise HTTPException(status_code=400, detail="Invalid bucket. Use hour or day")
+    hours = max(1, min(hours, STATUS_SUMMARY_MAX_HOURS))
+    async with pool.acquire() as conn:
+        body = await conn.fetchval(
+            """
+            WITH r AS (
+                SELECT * FROM status_check_rollups WHERE bucket >= NOW() - make_interval(hours => $1)
+            )
+            SELECT json_build_object(
+                'hours', $1::int,
+                'bucket', $2::text,
+                'clients', (
+                    SELECT COALESCE(json_agg(c ORDER BY c.last_seen DESC), '[]') FROM (
+                        SELECT client_name, MAX(last_seen) AS last_seen, SUM(count) AS checks
+                        FROM r GROUP BY client_name
+                    ) c
+                ),
+                'buckets', (
+                    SELECT COALESCE(json_agg(b ORDER BY b.bucket), '[]') FROM (
+                        SELECT date_trunc($2, bucket AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' AS bucket,
+                               SUM(count) AS checks,
+                               COUNT(DISTINCT client_name) AS clients
+                        FROM r GROUP BY 1
+                    ) b
+                )
+            )::text
+            """,
+            hours,
+            bucket,
         )
-    return [
-        StatusCheck(id=str(r['id']), client_name=r['client_name'], timestamp=r['timestamp'])
-        for r in rows
-    ]
+    return FastJSONResponse(body.encode("utf-8"))
 
 
 @api_router.post("/submissions/newsletter")
@@ -308,31 +1760,34 @@ async def submit_newsletter(data: NewsletterSubmit, background_tasks: Background
     if not email_clean:
         raise HTTPException(status_code=400, detail="Email is required")
     async with pool.acquire() as conn:
-        existing = await conn.fetchrow(
-            "SELECT 1 FROM newsletter_subscribers WHERE LOWER(email) = LOWER($1)",
-            email_clean,
-        )
-        if existing:
-            raise HTTPException(status_code=409, detail="This email is already subscribed.")
-        await conn.execute(
-            "INSERT INTO newsletter_subscribers (email) VALUES ($1)",
+        # Subscriber insert and contact upsert in one statement; no row back means duplicate
+        inserted = await conn.fetchval(
+            """
+            WITH ins AS (
+                INSERT INTO newsletter_subscribers (email, email_norm) VALUES ($1, $2)
+                ON CONFLICT (email_norm) DO NOTHING
+                RETURNING email, email_norm
+            )
+            INSERT INTO contacts (email_norm, email, in_newsletter)
+            SELECT email_norm, email, TRUE FROM ins
+            """ + _CONTACT_ON_CONFLICT + """
+            RETURNING 1
+            """,
             email_clean,
+            _normalize_email(email_clean),
         )
+    if not inserted:
+        raise HTTPException(status_code=409, detail="This email is already subscribed.")
 
     # Send welcome email (thank you for subscribing)
     from_email = (os.environ.get("EMAIL_FROM") or "").strip() or "noreply@example.com"
-    smtp_host = (os.environ.get("SMTP_HOST") or "").strip()
-    if smtp_host:
-        smtp_config = {
-            "host": smtp_host,
-            "port": int(os.environ.get("SMTP_PORT") or "587"),
-            "user": (os.environ.get("SMTP_USER") or "").strip() or None,
-            "password": (os.environ.get("SMTP_PASSWORD") or "").strip() or None,
-            "tls": True,
-        }
+    smtp_config = _smtp_config()
+    if smtp_config:
         html = _newsletter_welcome_html()
         subject = "Welcome to SyllaTech — You're In!"
-        background_tasks.add_task(
+        _add_task(
+            background_tasks,
+            "email",
             _send_email_sync,
             email_clean,
             subject,
@@ -356,37 +1811,37 @@ DEFAULT_TIME_SLOTS = [
 async def get_booking_config():
     """Public: Get available time slots and booking rules for the booking form."""
     async with pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT value FROM booking_config WHERE key = 'time_slots'")
-        time_slots = json.loads(row["value"]) if row and row["value"] else DEFAULT_TIME_SLOTS
-        blocked = await conn.fetchrow("SELECT value FROM booking_config WHERE key = 'blocked_dates'")
-        blocked_dates = json.loads(blocked["value"]) if blocked and blocked["value"] else []
-        weekdays = await conn.fetchrow("SELECT value FROM booking_config WHERE key = 'available_weekdays'")
-        available_weekdays = json.loads(weekdays["value"]) if weekdays and weekdays["value"] else [1, 2, 3, 4, 5]
-    return {"timeSlots": time_slots, "blockedDates": blocked_dates, "availableWeekdays": available_weekdays}
+        rows = await conn.fetch(_BOOKING_CONFIG_SQL, ["time_slots", "blocked_dates", "available_weekdays"])
+    config = {r["key"]: json.loads(r["value"]) for r in rows if r["value"]}
+    return {
+        "timeSlots": config.get("time_slots", DEFAULT_TIME_SLOTS),
+        "blockedDates": config.get("blocked_dates", []),
+        "availableWeekdays": config.get("available_weekdays", [1, 2, 3, 4, 5]),
+    }
 
 
 @api_router.get("/availability")
 async def get_availability(date: str):
     """Get taken time slots for a date. Query param: date=YYYY-MM-DD"""
     async with pool.acquire() as conn:
-        blocked = await conn.fetchrow("SELECT value FROM booking_config WHERE key = 'blocked_dates'")
-        blocked_dates = json.loads(blocked["value"]) if blocked and blocked["value"] else []
-        if date in blocked_dates:
-            row = await conn.fetchrow("SELECT value FROM booking_config WHERE key = 'time_slots'")
-            all_slots = json.loads(row["value"]) if row and row["value"] else DEFAULT_TIME_SLOTS
-            return {"taken": all_slots}
-        rows = await conn.fetch(
-            "SELECT time FROM bookings WHERE date_iso = $1",
-            date,
-        )
-    taken = [r["time"] for r in rows if r["time"]]
-    return {"taken": taken}
+        row = await conn.fetchrow(_AVAILABILITY_SQL, date)
+    blocked_dates = json.loads(row["blocked_dates"]) if row["blocked_dates"] else []
+    if date in blocked_dates:
+        return {"taken": json.loads(row["time_slots"]) if row["time_slots"] else DEFAULT_TIME_SLOTS}
+    return {"taken": [t for t in row["taken"] if t]}
 
 
 LOGO_BASE64 = "PHN2ZyB3aWR0aD0iMjAwIiBoZWlnaHQ9IjQwIiB2aWV3Qm94PSIwIDAgMjAwIDQwIiBmaWxsPSJub25lIiB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciPjxkZWZzPjxsaW5lYXJHcmFkaWVudCBpZD0iZyIgeDE9IjAlIiB5MT0iMCUiIHgyPSIxMDAlIiB5Mj0iMTAwJSI+PHN0b3Agb2Zmc2V0PSIwJSIgc3RvcC1jb2xvcj0iIzA2YjZkNCIvPjxzdG9wIG9mZnNldD0iMTAwJSIgc3RvcC1jb2xvcj0iIzNiODJmNiIvPjwvbGluZWFyR3JhZGllbnQ+PC9kZWZzPjxyZWN0IHg9IjAiIHk9IjQiIHdpZHRoPSIzMiIgaGVpZ2h0PSIzMiIgcng9IjgiIGZpbGw9InVybCgjZykiLz48cGF0aCBkPSJNMTYgMTBDMTIuNSAxMCAxMCAxMiAxMCAxNC41QzEwIDE3IDEyIDE4LjUgMTYgMTkuNUMyMCAyMC41IDIyIDIyIDIyIDI0LjVDMjIgMjcgMTkuNSAyOSAxNiAyOUMxMi41IDI5IDEwIDI3LjUgMTAgMjUiIHN0cm9rZT0id2hpdGUiIHN0cm9rZS13aWR0aD0iMi41IiBzdHJva2UtbGluZWNhcD0icm91bmQiIGZpbGw9Im5vbmUiLz48Y2lyY2xlIGN4PSIyMiIgY3k9IjEzIiByPSIyIiBmaWxsPSJ3aGl0ZSIgb3BhY2l0eT0iMC45Ii8+PHRleHQgeD0iNDIiIHk9IjI4IiBmb250LWZhbWlseT0ic2Fucy1zZXJpZiIgZm9udC1zaXplPSIyMiIgZm9udC13ZWlnaHQ9IjcwMCIgZmlsbD0iI2Y4ZmFmYyI+PHRzcGFuIGZpbGw9InVybCgjZykiPlN5bGxhPC90c3Bhbj48dHNwYW4gZmlsbD0iI2Y4ZmFmYyI+VGVjaDwvdHNwYW4+PC90ZXh0Pjwvc3ZnPg=="
 
 
-def _booking_confirmation_html(name: str, date: str, time: str) -> str:
+def _booking_confirmation_html(
+    name: str,
+    date: str,
+    time: str,
+    badge: str = "Booking Confirmed",
+    intro: str = "Your free consultation is confirmed.",
+    footer: str = "We'll send a calendar invite shortly. If you need to reschedule, reply to this email or contact us.",
+) -> str:
     """Build HTML email for booking confirmation with actual date and time."""
     date_display = date or "your chosen date"
     time_display = time or ""
@@ -409,9 +1864,9 @@ def _booking_confirmation_html(name: str, date: str, time: str) -> str:
           </tr>
           <tr>
             <td style="background-color: #0f172a; border: 1px solid #1e293b; border-radius: 24px; padding: 48px 40px;">
-              <span style="display: inline-block; background: rgba(6,182,212,0.15); border: 1px solid rgba(6,182,212,0.3); border-radius: 9999px; padding: 8px 16px; font-size: 13px; font-weight: 600; color: #22d3ee; margin-bottom: 24px;">Booking Confirmed</span>
+              <span style="display: inline-block; background: rgba(6,182,212,0.15); border: 1px solid rgba(6,182,212,0.3); border-radius: 9999px; padding: 8px 16px; font-size: 13px; font-weight: 600; color: #22d3ee; margin-bottom: 24px;">{_escape_html(badge)}</span>
               <h1 style="margin: 0 0 16px; font-size: 28px; font-weight: 700; color: #ffffff; line-height: 1.3;">Hi {_escape_html(name)}!</h1>
-              <p style="margin: 0 0 24px; font-size: 16px; color: #94a3b8; line-height: 1.6;">Your free consultation is confirmed.</p>
+              <p style="margin: 0 0 24px; font-size: 16px; color: #94a3b8; line-height: 1.6;">{_escape_html(intro)}</p>
               <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background: #1e293b; border-radius: 12px; margin-bottom: 32px;">
                 <tr>
                   <td style="padding: 24px;">
@@ -422,7 +1877,7 @@ def _booking_confirmation_html(name: str, date: str, time: str) -> str:
                   </td>
                 </tr>
               </table>
-              <p style="margin: 0; font-size: 15px; color: #cbd5e1; line-height: 1.6;">We'll send a calendar invite shortly. If you need to reschedule, reply to this email or contact us.</p>
+              <p style="margin: 0; font-size: 15px; color: #cbd5e1; line-height: 1.6;">{_escape_html(footer)}</p>
             </td>
           </tr>
           <tr>
@@ -444,7 +1899,16 @@ def _escape_html(s: str) -> str:
     return str(s).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
 
 
-def _owner_booking_notification_html(name: str, email: str, date: str, time: str, phone: str, business: str, message: str) -> str:
+def _owner_booking_notification_html(
+    name: str,
+    email: str,
+    date: str,
+    time: str,
+    phone: str,
+    business: str,
+    message: str,
+    intro: str = "A visitor just booked a consultation. Reminder details below.",
+) -> str:
     """Build HTML email for owner: new booking notification & reminder."""
     phone_display = _escape_html(phone or "—")
     business_display = _escape_html(business or "—")
@@ -472,7 +1936,7 @@ def _owner_booking_notification_html(name: str, email: str, date: str, time: str
             <td style="background-color: #0f172a; border: 1px solid #1e293b; border-radius: 24px; padding: 40px;">
               <span style="display: inline-block; background: rgba(34,197,94,0.15); border: 1px solid rgba(34,197,94,0.3); border-radius: 9999px; padding: 8px 16px; font-size: 13px; font-weight: 600; color: #22c55e; margin-bottom: 24px;">📅 New Booking</span>
               <h1 style="margin: 0 0 8px; font-size: 24px; font-weight: 700; color: #ffffff;">Consultation Scheduled</h1>
-              <p style="margin: 0 0 24px; font-size: 15px; color: #94a3b8;">A visitor just booked a consultation. Reminder details below.</p>
+              <p style="margin: 0 0 24px; font-size: 15px; color: #94a3b8;">{_escape_html(intro)}</p>
               <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background: #1e293b; border-radius: 12px; margin-bottom: 20px;">
                 <tr>
                   <td style="padding: 20px;">
@@ -563,50 +2027,21 @@ def _newsletter_welcome_html() -> str:
 </html>"""
 
 
-@api_router.post("/submissions/bookings")
-async def submit_booking(data: BookingSubmit, background_tasks: BackgroundTasks):
-    async with pool.acquire() as conn:
-        if data.date_iso and data.time:
-            existing = await conn.fetchrow(
-                "SELECT 1 FROM bookings WHERE date_iso = $1 AND time = $2",
-                data.date_iso,
-                data.time,
-            )
-            if existing:
-                raise HTTPException(status_code=409, detail="This time slot is no longer available. Please choose another.")
-        await conn.execute(
-            """
-            INSERT INTO bookings (date, date_iso, time, name, email, phone, business, message)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            """,
-            data.date,
-            data.date_iso,
-            data.time,
-            data.name,
-            data.email,
-            data.phone,
-            data.business,
-            data.message,
-        )
-
+def _queue_booking_emails(background_tasks: BackgroundTasks, data: BookingSubmit):
+    """Queue the customer confirmation and owner notification for a new booking."""
     # Send booking confirmation email (with actual date/time)
     from_email = (os.environ.get("EMAIL_FROM") or "").strip() or "noreply@example.com"
-    smtp_host = (os.environ.get("SMTP_HOST") or "").strip()
-    if smtp_host:
-        smtp_config = {
-            "host": smtp_host,
-            "port": int(os.environ.get("SMTP_PORT") or "587"),
-            "user": (os.environ.get("SMTP_USER") or "").strip() or None,
-            "password": (os.environ.get("SMTP_PASSWORD") or "").strip() or None,
-            "tls": True,
-        }
+    smtp_config = _smtp_config()
+    if smtp_config:
         html = _booking_confirmation_html(
             name=data.name,
             date=data.date or (data.date_iso or ""),
             time=data.time or "",
         )
         subject = "Your SyllaTech consultation is confirmed"
-        background_tasks.add_task(
+        _add_task(
+            background_tasks,
+            "email",
             _send_email_sync,
             data.email,
             subject,
@@ -627,7 +2062,9 @@ async def submit_booking(data: BookingSubmit, background_tasks: BackgroundTasks)
                 message=data.message or "",
             )
             owner_subject = f"New booking: {data.name} — {data.date or data.date_iso or ''} at {data.time or ''}"
-            background_tasks.add_task(
+            _add_task(
+                background_tasks,
+                "email",
                 _send_email_sync,
                 owner_email,
                 owner_subject,
@@ -636,107 +2073,893 @@ async def submit_booking(data: BookingSubmit, background_tasks: BackgroundTasks)
                 smtp_config,
             )
 
-    return {"status": "ok"}
-
 
-@api_router.post("/submissions/contact")
-async def submit_contact(data: ContactSubmit):
-    async with pool.acquire() as conn:
-        await conn.execute(
-            """
-            INSERT INTO contact_submissions (name, email, business, message)
-            VALUES ($1, $2, $3, $4)
-            """,
-            data.name,
-            data.email,
-            data.business,
-            data.message,
-        )
-    return {"status": "ok"}
+# Booking reminders. A BEFORE trigger parses date_iso + time (in BOOKING_TIMEZONE) into
+# the indexed bookings.starts_at, and an AFTER trigger NOTIFYs every change. Each
+# worker keeps upcoming reminders in a heap, reloads only the notified bookings, and
+# sleeps until the next one is due. Workers race to claim a reminder with one UPDATE
+# on the reminders_sent bitmask, so each reminder is sent once.
+BOOKING_REMINDERS = (os.environ.get("BOOKING_REMINDERS") or "1").strip().lower() not in ("0", "false", "no")
+BOOKING_TIMEZONE = (os.environ.get("BOOKING_TIMEZONE") or "UTC").strip()
+BOOKING_REMINDER_GRACE = timedelta(minutes=int(os.environ.get("BOOKING_REMINDER_GRACE_MINUTES") or "30"))
+_BOOKINGS_CHANNEL = "bookings_changed"
+# (bitmask flag, lead time, label)
+_REMINDERS = ((1, timedelta(hours=24), "24 hours"), (2, timedelta(hours=1), "1 hour"))
+# Delay before retrying a reminder whose email failed (until the booking starts)
+_REMINDER_RETRY = timedelta(minutes=5)
+_reminder_task: Optional[asyncio.Task] = None
+# Called with the booking id ("*" for all) on each change notification and whenever the
+# listener (re)connects; the reminder scheduler owns the LISTEN connection
+_booking_change_hooks: list = []
+
+
+async def _init_booking_schedule(conn):
+    """starts_at column, index and triggers; recomputes starts_at when BOOKING_TIMEZONE changes."""
+    ZoneInfo(BOOKING_TIMEZONE)  # fail fast on a typo
+    tz = BOOKING_TIMEZONE.replace("'", "''")
+    previous = await conn.fetchval("SELECT prosrc FROM pg_proc WHERE proname = 'bookings_parse_starts_at'")
+    await conn.execute("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS starts_at TIMESTAMPTZ")
+    await conn.execute("ALTER TABLE bookings ADD COLUMN IF NOT EXISTS reminders_sent SMALLINT NOT NULL DEFAULT 0")
+    await conn.execute("CREATE INDEX IF NOT EXISTS idx_bookings_starts_at ON bookings(starts_at)")
+    await conn.execute(f"""
+        CREATE OR REPLACE FUNCTION bookings_parse_starts_at(day TEXT, slot TEXT) RETURNS TIMESTAMPTZ AS $$
+        BEGIN
+            RETURN (day || ' ' || slot)::timestamp AT TIME ZONE '{tz}';
+        EXCEPTION WHEN others THEN
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql STABLE
+    """)
+    await conn.execute("""
+        CREATE OR REPLACE FUNCTION bookings_set_starts_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.starts_at := bookings_parse_starts_at(NEW.date_iso, NEW.time);
+            IF TG_OP = 'UPDATE' AND NEW.starts_at IS DISTINCT FROM OLD.starts_at THEN
+                NEW.reminders_sent := 0;
+            END IF;
+            RETURN NEW;
+        END $$ LANGUAGE plpgsql
+    """)
+    await conn.execute(f"""
+        CREATE OR REPLACE FUNCTION bookings_notify_change() RETURNS trigger AS $$
+        BEGIN
+            IF current_setting('syllatech.bookings_notify', true) = 'off' THEN
+                -- Bulk maintenance; it sends a single '*' itself
+                NULL;
+            ELSIF TG_OP = 'TRUNCATE' THEN
+                PERFORM pg_notify('{_BOOKINGS_CHANNEL}', '*');
+            ELSIF TG_OP = 'UPDATE' AND to_jsonb(NEW) - 'reminders_sent' = to_jsonb(OLD) - 'reminders_sent' THEN
+                -- Reminder claims and no-op updates change nothing listeners care about
+                NULL;
+            ELSE
+                PERFORM pg_notify('{_BOOKINGS_CHANNEL}', COALESCE(NEW.id, OLD.id)::text);
+            END IF;
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql
+    """)
+    # DROP + CREATE rather than CREATE OR REPLACE TRIGGER, which needs PostgreSQL 14
+    async with conn.transaction():
+        for name, definition in (
+            ("bookings_starts_at", "BEFORE INSERT OR UPDATE OF date_iso, time ON bookings FOR EACH ROW EXECUTE FUNCTION bookings_set_starts_at()"),
+            ("bookings_changed", "AFTER INSERT OR UPDATE OR DELETE ON bookings FOR EACH ROW EXECUTE FUNCTION bookings_notify_change()"),
+            ("bookings_truncated", "AFTER TRUNCATE ON bookings FOR EACH STATEMENT EXECUTE FUNCTION bookings_notify_change()"),
+        ):
+            await conn.execute(f"DROP TRIGGER IF EXISTS {name} ON bookings")
+            await conn.execute(f"CREATE TRIGGER {name} {definition}")
+    if previous is None or f"'{tz}'" not in previous:
+        # New column or new time zone: set starts_at directly, with one '*' notification
+        # instead of one per row
+        async with conn.transaction():
+            await conn.execute("SET LOCAL syllatech.bookings_notify = 'off'")
+            changed = await conn.execute("""
+                UPDATE bookings SET starts_at = s.starts_at, reminders_sent = 0
+                FROM (SELECT id, bookings_parse_starts_at(date_iso, time) AS starts_at FROM bookings) s
+                WHERE bookings.id = s.id AND bookings.starts_at IS DISTINCT FROM s.starts_at
+            """)
+            if changed != "UPDATE 0":
+                await conn.execute("SELECT pg_notify($1, '*')", _BOOKINGS_CHANNEL)
+
+
+def _booking_reminder_html(name: str, date: str, time: str, lead: str) -> str:
+    """Build HTML email reminding the customer of an upcoming consultation."""
+    return _booking_confirmation_html(
+        name,
+        date,
+        time,
+        badge=f"Starts in {lead}",
+        intro=f"A quick reminder: your free consultation starts in {lead}.",
+        footer="If you need to reschedule, reply to this email or contact us.",
+    )
 
 
-# CSV Export
-def _to_csv(rows: list, fieldnames: list) -> str:
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction="ignore")
-    writer.writeheader()
-    for r in rows:
-        writer.writerow({k: (r.get(k) or "") for k in fieldnames})
-    return output.getvalue()
-
+class _ReminderScheduler:
+    """Heap of (due, booking id, flag, generation); entries from an older load of the
+    booking are stale and skipped when popped."""
+
+    def __init__(self):
+        self._heap: list = []
+        self._starts: dict = {}  # booking id -> (generation, starts_at) of its live heap entries
+        self._generation = 0
+        self._changed: set = set()
+        self._wake = asyncio.Event()
+        self.listening = False
+
+    def _schedule(self, booking_id: str, starts_at: datetime, sent: int):
+        self._generation += 1
+        self._starts[booking_id] = (self._generation, starts_at)
+        for flag, lead, _ in _REMINDERS:
+            if not sent & flag:
+                heapq.heappush(self._heap, (starts_at - lead, booking_id, flag, self._generation))
+
+    async def _load(self, conn, ids: Optional[List[str]] = None):
+        """Full load, or reload only the given bookings (deleted ones simply drop out)."""
+        sql = "SELECT id::text AS id, starts_at, reminders_sent FROM bookings WHERE starts_at > NOW()"
+        if ids is None:
+            rows = await conn.fetch(sql)
+            self._heap.clear()
+            self._starts.clear()
+        else:
+            rows = await conn.fetch(sql + " AND id = ANY($1::uuid[])", ids)
+            for booking_id in ids:
+                self._starts.pop(booking_id, None)
+        for r in rows:
+            self._schedule(r["id"], r["starts_at"], r["reminders_sent"])
+
+    def _on_notify(self, conn, pid, channel, payload):
+        for hook in _booking_change_hooks:
+            hook(payload)
+        if BOOKING_REMINDERS:
+            self._changed.add(payload)
+            self._wake.set()
+
+    async def _reload_changed(self, conn):
+        changed, self._changed = self._changed, set()
+        if "*" in changed:
+            await self._load(conn)
+        elif changed:
+            await self._load(conn, list(changed))
+
+    async def _fire_due(self):
+        now = datetime.now(timezone.utc)
+        while self._heap and self._heap[0][0] <= now:
+            due, booking_id, flag, generation = heapq.heappop(self._heap)
+            live = self._starts.get(booking_id)
+            if live is None or live[0] != generation:
+                continue
+            starts_at = live[1]
+            if starts_at <= now or now - due > BOOKING_REMINDER_GRACE:
+                continue
+            # The 24-hour reminder is pointless once the 1-hour one is due too
+            if any(f > flag and starts_at - lead <= now for f, lead, _ in _REMINDERS):
+                continue
+            try:
+                await self._send(booking_id, flag, starts_at)
+            except Exception:
+                logger.exception("Booking reminder for %s failed; retrying in %s", booking_id, _REMINDER_RETRY)
+                heapq.heappush(self._heap, (now + _REMINDER_RETRY, booking_id, flag, generation))
+
+    async def _send(self, booking_id: str, flag: int, starts_at: datetime):
+        """Claim the reminder, email the customer and the owner; the claim is released if the
+        customer email fails, so it can be retried."""
+        smtp_config = _smtp_config()
+        if smtp_config is None:
+            return  # email is off; leave the reminder unclaimed
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                UPDATE bookings SET reminders_sent = reminders_sent | $2
+                WHERE id = $1 AND starts_at = $3 AND reminders_sent & $2 = 0
+                RETURNING date, date_iso, time, name, email, phone, business, message
+                """,
+                booking_id,
+                flag,
+                starts_at,
+            )
+        if row is None:
+            return  # another worker claimed it
+        lead = next(label for f, _, label in _REMINDERS if f == flag)
+        date = row["date"] or row["date_iso"] or ""
+        from_email = (os.environ.get("EMAIL_FROM") or "").strip() or "noreply@example.com"
+        try:
+            await asyncio.to_thread(
+                _send_email_sync,
+                row["email"],
+                f"Reminder: your SyllaTech consultation starts in {lead}",
+                _booking_reminder_html(row["name"], date, row["time"] or "", lead),
+                from_email,
+                smtp_config,
+            )
+        except Exception:
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    "UPDATE bookings SET reminders_sent = reminders_sent & ~$2::smallint WHERE id = $1", booking_id, flag
+                )
+            raise
+        owner_email = (os.environ.get("OWNER_NOTIFICATION_EMAIL") or "").strip() or from_email
+        try:
+            await asyncio.to_thread(
+                _send_email_sync,
+                owner_email,
+                f"Reminder: {row['name']} — {date} at {row['time'] or ''} (in {lead})",
+                _owner_booking_notification_html(
+                    name=row["name"],
+                    email=row["email"],
+                    date=date,
+                    time=row["time"] or "",
+                    phone=row["phone"] or "",
+                    business=row["business"] or "",
+                    message=row["message"] or "",
+                    intro=f"This consultation starts in {lead}.",
+                ),
+                from_email,
+                smtp_config,
+            )
+        except Exception:
+            # Not retried: that would send the customer a second reminder
+            logger.exception("Owner reminder for booking %s failed", booking_id)
 
-@api_router.get("/admin/export/newsletter")
-async def export_newsletter_csv(_: str = Depends(require_admin)):
-    """Export newsletter subscribers as CSV."""
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            "SELECT email, timestamp FROM newsletter_subscribers ORDER BY timestamp DESC"
+    async def run(self):
+        while True:
+            try:
+                # Dedicated connection: pooled connections drop their listeners on release
+                conn = await asyncpg.connect(DATABASE_URL)
+                try:
+                    await conn.add_listener(_BOOKINGS_CHANNEL, self._on_notify)
+                    self.listening = True
+                    # Anything changed while disconnected is picked up by a full load
+                    for hook in _booking_change_hooks:
+                        hook("*")
+                    self._changed.clear()
+                    if BOOKING_REMINDERS:
+                        await self._load(conn)
+                    while not conn.is_closed():
+                        self._wake.clear()
+                        await self._reload_changed(conn)
+                        await self._fire_due()
+                        timeout = 300.0
+                        if self._heap:
+                            timeout = min(timeout, (self._heap[0][0] - datetime.now(timezone.utc)).total_seconds())
+                        try:
+                            await asyncio.wait_for(self._wake.wait(), timeout=max(0.0, timeout))
+                        except asyncio.TimeoutError:
+                            pass
+                finally:
+                    self.listening = False
+                    await conn.close()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Booking change listener failed; reconnecting")
+                await asyncio.sleep(30)
+
+
+_reminders = _ReminderScheduler()
+
+
+# iCalendar feed of bookings for calendar subscriptions. Each booking's VEVENT is cached
+# per worker; the bookings_changed notifications mark single bookings dirty, so a
+# rebuild re-reads only those rows and re-joins the cached events. Polls with nothing
+# changed are answered from memory, with a 304 when the client's ETag or
+# Last-Modified matches. Feed tokens are stored as SHA-256 hashes in calendar_feeds.
+BOOKING_DURATION = timedelta(minutes=int(os.environ.get("BOOKING_DURATION_MINUTES") or "30"))
+CALENDAR_PAST_DAYS = int(os.environ.get("CALENDAR_PAST_DAYS") or "90")
+CALENDAR_REFRESH_MINUTES = int(os.environ.get("CALENDAR_REFRESH_MINUTES") or "15")
+_CALENDAR_TOKEN_TTL = 60.0
+# Full reload this often so bookings that fall out of the CALENDAR_PAST_DAYS window drop out
+_CALENDAR_FULL_RELOAD = 3600.0
+
+
+async def _init_calendar_feeds(conn):
+    await conn.execute("""
+        CREATE TABLE IF NOT EXISTS calendar_feeds (
+            id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+            name VARCHAR(100) NOT NULL,
+            token_hash CHAR(64) NOT NULL UNIQUE,
+            timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW()
         )
-    data = [{"email": r["email"], "timestamp": (r["timestamp"].isoformat() if r["timestamp"] else "")} for r in rows]
-    csv_content = _to_csv(data, ["email", "timestamp"])
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=newsletter-subscribers.csv"},
+    """)
+
+
+def _ics_escape(value: str) -> str:
+    """Escape a TEXT value (RFC 5545 3.3.11)."""
+    value = (value or "").replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+    return value.replace("\r\n", "\n").replace("\r", "\n").replace("\n", "\\n")
+
+
+def _ics_fold(line: str) -> str:
+    """Fold a content line at 75 octets (RFC 5545 3.1) without splitting a UTF-8 sequence."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line
+    parts, start, limit = [], 0, 75
+    while start < len(data):
+        end = min(start + limit, len(data))
+        while end < len(data) and data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end].decode("utf-8"))
+        start, limit = end, 74  # continuation lines start with a space
+    return "\r\n ".join(parts)
+
+
+def _ics_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ics_event(row) -> str:
+    details = [f"{label}: {row[key]}" for label, key in (("Email", "email"), ("Phone", "phone"), ("Business", "business")) if row[key]]
+    if row["message"]:
+        details += ["", row["message"]]
+    lines = (
+        "BEGIN:VEVENT",
+        f"UID:{row['id']}@syllatech",
+        f"DTSTAMP:{_ics_time(row['updated_at'])}",
+        f"LAST-MODIFIED:{_ics_time(row['updated_at'])}",
+        f"SEQUENCE:{row['version']}",
+        f"DTSTART:{_ics_time(row['starts_at'])}",
+        f"DTEND:{_ics_time(row['starts_at'] + BOOKING_DURATION)}",
+        f"SUMMARY:{_ics_escape('Consultation: ' + row['name'])}",
+        f"DESCRIPTION:{_ics_escape(chr(10).join(details))}",
+        "END:VEVENT",
     )
+    return "".join(_ics_fold(line) + "\r\n" for line in lines)
 
 
-@api_router.get("/admin/export/bookings")
-async def export_bookings_csv(_: str = Depends(require_admin)):
-    """Export bookings as CSV."""
+class _CalendarFeed:
+    """Cached VCALENDAR body; ETag is a content hash, so no-op rebuilds keep clients on 304s."""
+
+    _HEADER = (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//SyllaTech//Bookings//EN\r\n"
+        "CALSCALE:GREGORIAN\r\nMETHOD:PUBLISH\r\nX-WR-CALNAME:SyllaTech bookings\r\n"
+        f"X-PUBLISHED-TTL:PT{CALENDAR_REFRESH_MINUTES}M\r\n"
+        f"REFRESH-INTERVAL;VALUE=DURATION:PT{CALENDAR_REFRESH_MINUTES}M\r\n"
+    )
+
+    def __init__(self):
+        self._events: dict = {}  # booking id -> (starts_at, VEVENT text)
+        self._dirty: set = set()
+        self._full = True
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self.body = b""
+        self.etag = ""
+        # Time this worker first served the current body; never earlier than the change itself
+        self.last_modified = 0
+
+    def invalidate(self, booking_id: str):
+        if booking_id == "*":
+            self._full = True
+        else:
+            self._dirty.add(booking_id)
+
+    def _needs_full(self) -> bool:
+        # Without the listener, changes could be missed, so every poll reloads
+        return self._full or not _reminders.listening or time.monotonic() - self._loaded_at > _CALENDAR_FULL_RELOAD
+
+    async def refresh(self):
+        """Bring the body up to date; a no-op (no DB access) when nothing changed."""
+        if not self._dirty and not self._needs_full():
+            return
+        async with self._lock:
+            full = self._needs_full()
+            if not full and not self._dirty:
+                return  # another request rebuilt it while we waited
+            dirty, self._dirty = self._dirty, set()
+            self._full = False
+            sql = """
+                SELECT id::text AS id, starts_at, name, email, phone, business, message, version, updated_at
+                FROM bookings WHERE starts_at >= NOW() - make_interval(days => $1)
+            """
+            try:
+                async with pool.acquire() as conn:
+                    if full:
+                        rows = await conn.fetch(sql, CALENDAR_PAST_DAYS)
+                    else:
+                        rows = await conn.fetch(sql + " AND id = ANY($2::uuid[])", CALENDAR_PAST_DAYS, list(dirty))
+            except BaseException:
+                self._dirty |= dirty
+                self._full = self._full or full
+                raise
+            if full:
+                self._events.clear()
+                self._loaded_at = time.monotonic()
+            else:
+                for booking_id in dirty:
+                    self._events.pop(booking_id, None)
+            for r in rows:
+                self._events[r["id"]] = (r["starts_at"], _ics_event(r))
+            events = sorted(self._events.items(), key=lambda item: (item[1][0], item[0]))
+            body = (self._HEADER + "".join(e for _, (_, e) in events) + "END:VCALENDAR\r\n").encode("utf-8")
+            etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+            if etag != self.etag:
+                self.body, self.etag, self.last_modified = body, etag, int(time.time()) + 1
+
+    def not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+            return "*" in tags or self.etag in tags
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+_calendar = _CalendarFeed()
+_booking_change_hooks.append(_calendar.invalidate)
+# token hash -> (feed id, checked at); revoked tokens stop working within _CALENDAR_TOKEN_TTL
+_calendar_tokens: dict = {}
+
+
+def _calendar_token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def _check_calendar_token(token: str):
+    token_hash = _calendar_token_hash(token or "")
+    cached = _calendar_tokens.get(token_hash)
+    now = time.monotonic()
+    if cached and now - cached[1] < _CALENDAR_TOKEN_TTL:
+        return
     async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            """SELECT date, date_iso, time, name, email, phone, business, message, timestamp
-               FROM bookings ORDER BY timestamp DESC"""
+        feed_id = await conn.fetchval("SELECT id::text FROM calendar_feeds WHERE token_hash = $1", token_hash)
+    if feed_id is None:
+        _calendar_tokens.pop(token_hash, None)
+        raise HTTPException(status_code=404, detail="Not found")
+    _calendar_tokens[token_hash] = (feed_id, now)
+
+
+@api_router.get("/calendar/bookings.ics", include_in_schema=False)
+async def bookings_calendar(request: Request, token: str = ""):
+    """ICS feed of bookings for calendar subscriptions (token from the admin feed list)."""
+    await _check_calendar_token(token)
+    await _calendar.refresh()
+    headers = {
+        "ETag": _calendar.etag,
+        "Last-Modified": formatdate(_calendar.last_modified, usegmt=True),
+        "Cache-Control": "private, no-cache",
+    }
+    if _calendar.not_modified(request):
+        return Response(status_code=304, headers=headers)
+    return Response(_calendar.body, media_type="text/calendar; charset=utf-8", headers=headers)
+
+
+class CalendarFeedCreate(BaseModel):
+    name: str = "Bookings"
+
+
+@api_router.get("/admin/calendar/feeds")
+async def list_calendar_feeds(_: str = Depends(require_admin)):
+    async with pool.acquire() as conn:
+        rows = await conn.fetch("SELECT id::text AS id, name, timestamp FROM calendar_feeds ORDER BY timestamp")
+    return {"items": [{"id": r["id"], "name": r["name"], "timestamp": r["timestamp"].isoformat()} for r in rows]}
+
+
+@api_router.post("/admin/calendar/feeds")
+async def create_calendar_feed(data: CalendarFeedCreate, request: Request, _: str = Depends(require_admin)):
+    """Create a feed URL. The token is only shown here; delete the feed to revoke it."""
+    name = (data.name or "").strip()[:100] or "Bookings"
+    token = secrets.token_urlsafe(32)
+    async with pool.acquire() as conn:
+        feed_id = await conn.fetchval(
+            "INSERT INTO calendar_feeds (name, token_hash) VALUES ($1, $2) RETURNING id::text",
+            name,
+            _calendar_token_hash(token),
         )
-    data = [
-        {
-            "date": r["date"] or "",
-            "date_iso": r["date_iso"] or "",
-            "time": r["time"] or "",
-            "name": r["name"] or "",
-            "email": r["email"] or "",
-            "phone": r["phone"] or "",
-            "business": r["business"] or "",
-            "message": (r["message"] or "").replace("\n", " "),
-            "timestamp": (r["timestamp"].isoformat() if r["timestamp"] else ""),
-        }
-        for r in rows
-    ]
-    csv_content = _to_csv(
-        data,
+    url = str(request.url_for("bookings_calendar").include_query_params(token=token))
+    return {"id": feed_id, "name": name, "token": token, "url": url}
+
+
+@api_router.delete("/admin/calendar/feeds/{feed_id}")
+async def delete_calendar_feed(feed_id: str, _: str = Depends(require_admin)):
+    async with pool.acquire() as conn:
+        token_hash = await conn.fetchval("DELETE FROM calendar_feeds WHERE id = $1 RETURNING token_hash", feed_id)
+    if token_hash is None:
+        raise HTTPException(status_code=404, detail="Not found")
+    _calendar_tokens.pop(token_hash, None)
+    return {"status": "deleted"}
+
+
+@api_router.post("/submissions/bookings")
+async def submit_booking(data: BookingSubmit, background_tasks: BackgroundTasks):
+    async with pool.acquire() as conn:
+        if data.date_iso and data.time:
+            existing = await conn.fetchrow(
+                _SLOT_TAKEN_SQL,
+                data.date_iso,
+                data.time,
+            )
+            if existing:
+                raise HTTPException(status_code=409, detail="This time slot is no longer available. Please choose another.")
+        async with conn.transaction():
+            await conn.execute(
+                _BOOKING_INSERT_SQL,
+                data.date,
+                data.date_iso,
+                data.time,
+                data.name,
+                data.email,
+                data.phone,
+                data.business,
+                data.message,
+                _normalize_email(data.email),
+            )
+            await _upsert_contact(conn, data.email, data.name, bookings=True)
+
+    _queue_booking_emails(background_tasks, data)
+    return {"status": "ok"}
+
+
+@api_router.post("/submissions/contact")
+async def submit_contact(data: ContactSubmit):
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                """
+                INSERT INTO contact_submissions (name, email, business, message, email_norm)
+                VALUES ($1, $2, $3, $4, $5)
+                """,
+                data.name,
+                data.email,
+                data.business,
+                data.message,
+                _normalize_email(data.email),
+            )
+            await _upsert_contact(conn, data.email, data.name, contact=True)
+    return {"status": "ok"}
+
+
+# Admin exports. Rows are streamed from a server-side cursor and encoded batch
+# by batch (CSV, gzip-compressed CSV, JSON Lines or Parquet row groups), so
+# memory stays flat regardless of table size.
+EXPORT_BATCH_SIZE = int(os.environ.get("EXPORT_BATCH_SIZE") or "2000")
+# Incremental exports stop this far behind NOW(). updated_at/timestamp are set at
+# transaction start, so a row from a transaction still open when the cursor is handed
+# out would otherwise commit below it and never be exported.
+EXPORT_SYNC_LAG_SECONDS = float(os.environ.get("EXPORT_SYNC_LAG_SECONDS") or "60")
+
+# name -> (table, select list, columns, download basename, change-tracking column)
+_EXPORTS = {
+    "newsletter": (
+        "newsletter_subscribers",
+        "email, timestamp",
+        ["email", "timestamp"],
+        "newsletter-subscribers",
+        "updated_at",
+    ),
+    "bookings": (
+        "bookings",
+        "date, date_iso, time, name, email, phone, business, REPLACE(message, E'\\n', ' ') AS message, timestamp",
         ["date", "date_iso", "time", "name", "email", "phone", "business", "message", "timestamp"],
-    )
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=bookings.csv"},
+        "bookings",
+        "updated_at",
+    ),
+    "contact": (
+        "contact_submissions",
+        "name, email, business, REPLACE(message, E'\\n', ' ') AS message, timestamp",
+        ["name", "email", "business", "message", "timestamp"],
+        "contact-submissions",
+        "updated_at",
+    ),
+    "visits": (
+        "visits",
+        "path, country, region, city, timestamp",
+        ["path", "country", "region", "city", "timestamp"],
+        "visits",
+        "timestamp",
+    ),
+}
+
+# format -> (media type, file extension)
+_EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "csv.gz": ("application/gzip", "csv.gz"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+_TIMESTAMP_COLUMNS = {"timestamp", "updated_at"}
+
+_MAX_UUID = "ffffffff-ffff-ffff-ffff-ffffffffffff"
+
+
+def _encode_keyset_cursor(ts: datetime, key) -> str:
+    """Opaque cursor for keyset pagination over (timestamp, key)."""
+    raw = json.dumps([ts.isoformat(), str(key)]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_keyset_cursor(cursor: str, uuid_key: bool = True) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        ts, key = json.loads(raw)
+        ts = datetime.fromisoformat(ts)
+        return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc), str(uuid_module.UUID(key)) if uuid_key else str(key)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _parse_timestamp(value: str, param: str) -> datetime:
+    """Parse an ISO 8601 query parameter; naive values are taken as UTC."""
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {param}. Use an ISO 8601 timestamp")
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _csv_value(v):
+    if v is None:
+        return ""
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    return v
+
+
+def _json_value(v):
+    if hasattr(v, "isoformat"):
+        return v.isoformat()
+    if isinstance(v, uuid_module.UUID):
+        return str(v)
+    return v
+
+
+def _csv_chunk(rows, fieldnames: list, header: bool = False) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    if header:
+        writer.writerow(fieldnames)
+    for r in rows:
+        writer.writerow([_csv_value(r[k]) for k in fieldnames])
+    return output.getvalue()
+
+
+def _jsonl_chunk(rows, fieldnames: list) -> str:
+    return "".join(
+        json.dumps({k: _json_value(r[k]) for k in fieldnames}, ensure_ascii=False) + "\n" for r in rows
     )
 
 
-@api_router.get("/admin/export/contact")
-async def export_contact_csv(_: str = Depends(require_admin)):
-    """Export contact submissions as CSV."""
-    async with pool.acquire() as conn:
-        rows = await conn.fetch(
-            "SELECT name, email, business, message, timestamp FROM contact_submissions ORDER BY timestamp DESC"
+async def _export_batches(source, sql: str, *args):
+    async with _ReadAcquire(source) as conn:
+        async for rows in _iter_cursor(conn, sql, *args, batch_size=EXPORT_BATCH_SIZE):
+            yield rows
+
+
+async def _chain(*sources):
+    for source in sources:
+        async for item in source:
+            yield item
+
+
+# Export select lists rewrite message newlines; archived rows get the same treatment
+_ARCHIVE_EXPORT_FIXUPS = {"message": lambda v: v.replace("\n", " ") if v else v}
+
+
+async def _archive_batches(table: str, fieldnames: list, descending: bool = False, after=None, upto=None):
+    """Archived rows of table as batches of dicts, one Parquet row group at a time.
+
+    after/upto bound (timestamp, id) exclusively/inclusively for incremental exports.
+    """
+    import pyarrow.parquet as pq
+
+    months = _archive.months(table)
+    for month in reversed(months) if descending else months:
+        if after and month["last"] and (datetime.fromisoformat(month["last"][0]), month["last"][1]) <= after:
+            continue
+        pf = await asyncio.to_thread(pq.ParquetFile, Path(ARCHIVE_DIR) / month["file"])
+        groups = range(pf.num_row_groups)
+        for i in reversed(groups) if descending else groups:
+            group = await asyncio.to_thread(pf.read_row_group, i, columns=fieldnames)
+            rows = group.to_pylist()
+            if descending:
+                rows.reverse()
+            if after:
+                rows = [r for r in rows if after < (r["timestamp"], r["id"]) <= upto]
+            for r in rows:
+                for k, fix in _ARCHIVE_EXPORT_FIXUPS.items():
+                    if k in r:
+                        r[k] = fix(r[k])
+            if rows:
+                yield rows
+
+
+async def _encode_csv(batches, fieldnames: list):
+    yield _csv_chunk([], fieldnames, header=True).encode("utf-8")
+    async for rows in batches:
+        yield _csv_chunk(rows, fieldnames).encode("utf-8")
+
+
+async def _encode_jsonl(batches, fieldnames: list):
+    async for rows in batches:
+        yield _jsonl_chunk(rows, fieldnames).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object that hands written bytes back to the caller in chunks."""
+
+    def __init__(self):
+        self._chunks = []
+        self._pos = 0
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self._chunks.append(bytes(b))
+        self._pos += len(b)
+        return len(b)
+
+    def tell(self):
+        return self._pos
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _encode_parquet(batches, fieldnames: list):
+    """One Parquet row group per batch, built from a pandas DataFrame."""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (f, pa.timestamp("us", tz="UTC") if f in _TIMESTAMP_COLUMNS else pa.string()) for f in fieldnames
+    ])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        async for rows in batches:
+            df = pd.DataFrame.from_records([tuple(r[k] for k in fieldnames) for r in rows], columns=fieldnames)
+            writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+async def _gzip_stream(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # wbits=31: gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+async def _export_response(
+    name: str,
+    format: str,
+    request: Request,
+    since: Optional[str] = None,
+    cursor: Optional[str] = None,
+) -> StreamingResponse:
+    """Stream an export. csv/jsonl are gzip-encoded in transit when the client accepts it.
+
+    With since or cursor, only rows changed after that point are returned, ordered by
+    (change column, id), and X-Next-Cursor holds the cursor for the next sync.
+    """
+    if format not in _EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="Invalid format. Use csv, csv.gz, jsonl or parquet")
+    table, select, fieldnames, basename, watermark = _EXPORTS[name]
+    media_type, ext = _EXPORT_FORMATS[format]
+    headers = {"Content-Disposition": f"attachment; filename={basename}.{ext}"}
+    # One source for the bound query and the stream, so the cursor matches the rows sent.
+    # Both fall back to the primary if the replica is down (the primary is never behind).
+    source = _read_pool()
+    boundary = _archive.boundary(table)
+    if since is None and cursor is None:
+        if boundary is None:
+            batches = _export_batches(source, f"SELECT {select} FROM {table} ORDER BY timestamp DESC")
+        else:
+            # Newest first: the hot table, then archived months from newest to oldest
+            batches = _chain(
+                _export_batches(
+                    source, f"SELECT {select} FROM {table} WHERE timestamp >= $1 ORDER BY timestamp DESC", boundary
+                ),
+                _archive_batches(table, fieldnames, descending=True),
+            )
+    else:
+        lower = _decode_keyset_cursor(cursor) if cursor else (_parse_timestamp(since, "since"), _MAX_UUID)
+        # Snapshot the upper bound first so the next cursor is known before streaming
+        async with _ReadAcquire(source) as conn:
+            upper = await conn.fetchrow(
+                f"""
+                SELECT {watermark} AS ts, id FROM {table}
+                WHERE {watermark} <= NOW() - make_interval(secs => $1)
+                ORDER BY {watermark} DESC, id DESC LIMIT 1
+                """,
+                EXPORT_SYNC_LAG_SECONDS,
+            )
+        upper = (upper["ts"], str(upper["id"])) if upper else lower
+        # Archived rows never change, so only a timestamp watermark can reach back into them
+        from_archive = boundary is not None and watermark == "timestamp" and lower[0] < boundary
+        if from_archive:
+            last = _archive.months(table)[-1]["last"]
+            upper = max(upper, (datetime.fromisoformat(last[0]), last[1]) if last else lower)
+        headers["X-Next-Cursor"] = _encode_keyset_cursor(*max(lower, upper))
+        extra = f", {watermark}" if watermark not in fieldnames else ""
+        batches = _export_batches(
+            source,
+            f"""
+            SELECT id::text AS id, {select}{extra} FROM {table}
+            WHERE {watermark} >= $1 AND ({watermark}, id) > ($1, $2::uuid) AND ({watermark}, id) <= ($3, $4::uuid)
+            ORDER BY {watermark}, id
+            """,
+            *lower,
+            *upper,
         )
-    data = [
-        {
-            "name": r["name"] or "",
-            "email": r["email"] or "",
-            "business": r["business"] or "",
-            "message": (r["message"] or "").replace("\n", " "),
-            "timestamp": (r["timestamp"].isoformat() if r["timestamp"] else ""),
-        }
-        for r in rows
-    ]
-    csv_content = _to_csv(data, ["name", "email", "business", "message", "timestamp"])
-    return Response(
-        content=csv_content,
-        media_type="text/csv",
-        headers={"Content-Disposition": "attachment; filename=contact-submissions.csv"},
-    )
+        fieldnames = ["id"] + fieldnames + ([watermark] if extra else [])
+        if from_archive:
+            batches = _chain(_archive_batches(table, fieldnames, after=lower, upto=upper), batches)
+    if format == "parquet":
+        if importlib.util.find_spec("pyarrow") is None:
+            raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+        body = _encode_parquet(batches, fieldnames)
+    elif format == "jsonl":
+        body = _encode_jsonl(batches, fieldnames)
+    else:
+        body = _encode_csv(batches, fieldnames)
+    if format == "csv.gz":
+        body = _gzip_stream(body)
+    elif format != "parquet" and "gzip" in (request.headers.get("accept-encoding") or "").lower():
+        body = _gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@api_router.get("/admin/export/newsletter")
+async def export_newsletter_csv(
+    request: Request,
+    format: str = "csv",
+    since: Optional[str] = None,
+    cursor: Optional[str] = None,
+    _: str = Depends(require_admin),
+):
+    """Export newsletter subscribers (format=csv|csv.gz|jsonl|parquet; since/cursor for changes only)."""
+    return await _export_response("newsletter", format, request, since, cursor)
+
+
+@api_router.get("/admin/export/bookings")
+async def export_bookings_csv(
+    request: Request,
+    format: str = "csv",
+    since: Optional[str] = None,
+    cursor: Optional[str] = None,
+    _: str = Depends(require_admin),
+):
+    """Export bookings (format=csv|csv.gz|jsonl|parquet; since/cursor for changes only)."""
+    return await _export_response("bookings", format, request, since, cursor)
+
+
+@api_router.get("/admin/export/contact")
+async def export_contact_csv(
+    request: Request,
+    format: str = "csv",
+    since: Optional[str] = None,
+    cursor: Optional[str] = None,
+    _: str = Depends(require_admin),
+):
+    """Export contact submissions (format=csv|csv.gz|jsonl|parquet; since/cursor for changes only)."""
+    return await _export_response("contact", format, request, since, cursor)
+
+
+@api_router.get("/admin/export/visits")
+async def export_visits(
+    request: Request,
+    format: str = "csv",
+    since: Optional[str] = None,
+    cursor: Optional[str] = None,
+    _: str = Depends(require_admin),
+):
+    """Export page visits (format=csv|csv.gz|jsonl|parquet; since/cursor for changes only)."""
+    return await _export_response("visits", format, request, since, cursor)
 
 
 class BookingConfigUpdate(BaseModel):
@@ -805,118 +3028,293 @@ async def change_admin_password(data: ChangePasswordBody, _: str = Depends(requi
 
 
 # Admin endpoints
+# Counts are sums of visit weights (sampled visits weigh more than 1). {hot} restricts
+# totals and groupings to rows after the archive boundary ($2); with an archive the
+# groupings are returned in full ({top} empty) and merged with archived counts.
+_WEIGHTED_COUNT = "COALESCE(ROUND(SUM(weight)), 0)::bigint"
+_ANALYTICS_SQL = """
+    SELECT json_build_object(
+        'total_visits', (SELECT {weighted} FROM visits WHERE TRUE {hot}),
+        'visits_today', (SELECT {weighted} FROM visits WHERE timestamp::date = $1),
+        'by_country', (
+            SELECT COALESCE(json_agg(c ORDER BY c.count DESC), '[]') FROM (
+                SELECT country, {weighted} AS count
+                FROM visits
+                WHERE country IS NOT NULL AND country != '' {hot}
+                GROUP BY country
+                ORDER BY count DESC
+                {top}
+            ) c
+        ),
+        'by_region', (
+            SELECT COALESCE(json_agg(r ORDER BY r.count DESC), '[]') FROM (
+                SELECT country, region, {weighted} AS count
+                FROM visits
+                WHERE country IS NOT NULL AND (region IS NOT NULL AND region != '') {hot}
+                GROUP BY country, region
+                ORDER BY count DESC
+                {top}
+            ) r
+        ),
+        'visits_by_date', (
+            SELECT COALESCE(json_agg(d ORDER BY d.date), '[]') FROM (
+                SELECT timestamp::date::text AS date, {weighted} AS count
+                FROM visits
+                WHERE timestamp >= (CURRENT_DATE - INTERVAL '14 days')
+                GROUP BY timestamp::date
+            ) d
+        ),
+        'recent', (
+            SELECT COALESCE(json_agg(v ORDER BY v.timestamp DESC), '[]') FROM (
+                SELECT path, country, region, city, timestamp
+                FROM visits
+                ORDER BY timestamp DESC
+                LIMIT 20
+            ) v
+        )
+    )::text
+"""
+_ANALYTICS_TOP = 15
+
+
+@lru_cache(maxsize=512)
+def _archived_visit_counts(path: str, mtime_ns: int, keys: tuple):
+    """Weighted visit counts per keys group in one archived file; reads only the needed columns."""
+    import pyarrow.parquet as pq
+
+    weighted = "weight" in pq.read_schema(path).names
+    df = pq.read_table(path, columns=list(keys) + (["weight"] if weighted else [])).to_pandas()
+    if not weighted:
+        df["weight"] = 1.0
+    df = df[df["country"].notna()]
+    last = keys[-1]
+    df = df[df[last].notna() & (df[last] != "")]
+    return df.groupby(list(keys))["weight"].sum()
+
+
+def _archived_visit_groups(keys: tuple) -> dict:
+    counts = defaultdict(int)
+    for month in _archive.months("visits"):
+        path = Path(ARCHIVE_DIR) / month["file"]
+        series = _archived_visit_counts(str(path), path.stat().st_mtime_ns, keys)
+        for key, n in series.items():
+            counts[key if isinstance(key, tuple) else (key,)] += float(n)
+    return counts
+
+
+def _merge_top(hot_rows: list, archived: dict, keys: tuple) -> list:
+    counts = defaultdict(int, archived)
+    for r in hot_rows:
+        counts[tuple(r[k] for k in keys)] += r["count"]
+    top = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)[:_ANALYTICS_TOP]
+    return [{**dict(zip(keys, key)), "count": round(n)} for key, n in top]
+
+
 @api_router.get("/admin/analytics")
 async def get_analytics(_: str = Depends(require_admin)):
     """Return visit stats: total, today, by country, by region."""
     today_date = datetime.now(timezone.utc).date()
-    async with pool.acquire() as conn:
-        total = await conn.fetchval("SELECT COUNT(*) FROM visits")
-        today_count = await conn.fetchval(
-            "SELECT COUNT(*) FROM visits WHERE timestamp::date = $1", today_date
-        )
-        by_country = await conn.fetch(
-            """
-            SELECT country, COUNT(*) as count
-            FROM visits
-            WHERE country IS NOT NULL AND country != ''
-            GROUP BY country
-            ORDER BY count DESC
-            LIMIT 15
-            """
-        )
-        by_region = await conn.fetch(
-            """
-            SELECT country, region, COUNT(*) as count
-            FROM visits
-            WHERE country IS NOT NULL AND (region IS NOT NULL AND region != '')
-            GROUP BY country, region
-            ORDER BY count DESC
-            LIMIT 15
-            """
-        )
-        recent = await conn.fetch(
-            """
-            SELECT path, country, region, city, timestamp
-            FROM visits
-            ORDER BY timestamp DESC
-            LIMIT 20
-            """
-        )
-        visits_by_date = await conn.fetch(
-            """
-            SELECT timestamp::date as date, COUNT(*) as count
-            FROM visits
-            WHERE timestamp >= (CURRENT_DATE - INTERVAL '14 days')
-            GROUP BY timestamp::date
-            ORDER BY date ASC
-            """
-        )
-    return {
-        "total_visits": total or 0,
-        "visits_today": today_count or 0,
-        "by_country": [{"country": r["country"], "count": r["count"]} for r in by_country],
-        "by_region": [
-            {"country": r["country"], "region": r["region"], "count": r["count"]}
-            for r in by_region
-        ],
-        "visits_by_date": [
-            {"date": str(r["date"]), "count": r["count"]} for r in visits_by_date
-        ],
-        "recent": [
-            {
-                "path": r["path"],
-                "country": r["country"],
-                "region": r["region"],
-                "city": r["city"],
-                "timestamp": r["timestamp"].isoformat() if r["timestamp"] else None,
-            }
-            for r in recent
-        ],
-    }
+    boundary = _archive.boundary("visits")
+    # One round trip; Postgres assembles the whole document
+    async with _ReadAcquire() as conn:
+        if boundary is None:
+            body = await conn.fetchval(_ANALYTICS_SQL.format(weighted=_WEIGHTED_COUNT, hot="", top=f"LIMIT {_ANALYTICS_TOP}"), today_date)
+        else:
+            body = await conn.fetchval(_ANALYTICS_SQL.format(weighted=_WEIGHTED_COUNT, hot="AND timestamp >= $2", top=""), today_date, boundary)
+    if boundary is None:
+        return FastJSONResponse(body.encode("utf-8"))
+    # Archived months are scanned once per file (cached) and merged with the hot counts
+    data = json.loads(body)
+    by_country, by_region = await run_in_threadpool(
+        lambda: (_archived_visit_groups(("country",)), _archived_visit_groups(("country", "region")))
+    )
+    data["total_visits"] += round(_archive.weighted_rows("visits"))
+    data["by_country"] = _merge_top(data["by_country"], by_country, ("country",))
+    data["by_region"] = _merge_top(data["by_region"], by_region, ("country", "region"))
+    return data
+
+
+# type -> (table, select list, keyset key column)
+_SUBMISSION_TYPES = {
+    "newsletter": ("newsletter_subscribers", "id, email, timestamp, version", "id"),
+    "bookings": (
+        "bookings",
+        "id, date, date_iso, time, name, email, phone, business, message, timestamp, version",
+        "id",
+    ),
+    "contact": ("contact_submissions", "id, name, email, business, message, timestamp, version", "id"),
+    "unsubscribed": ("unsubscribed_emails", "email AS id, email, timestamp", "email"),
+}
+
+SUBMISSIONS_MAX_PAGE_SIZE = 1000
+
+
+def _submission_item(row) -> dict:
+    d = dict(row)
+    for k, v in d.items():
+        if hasattr(v, 'isoformat'):
+            d[k] = v.isoformat() if v else None
+        elif isinstance(v, uuid_module.UUID):
+            d[k] = str(v)
+    return d
+
+
+def _submission_filters(
+    args: list,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    email: Optional[str] = None,
+    date_iso: Optional[str] = None,
+) -> List[str]:
+    """WHERE clauses for the shared submission filters; parameters are appended to args."""
+    where = []
+
+    def arg(value) -> str:
+        args.append(value)
+        return f"${len(args)}"
+
+    if start:
+        where.append(f"timestamp >= {arg(_parse_timestamp(start, 'start'))}")
+    if end:
+        where.append(f"timestamp < {arg(_parse_timestamp(end, 'end'))}")
+    if email:
+        prefix = email.strip().lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        where.append(f"email_norm LIKE {arg(prefix + '%')}")
+    if date_iso is not None:
+        where.append(f"date_iso = {arg(date_iso)}")
+    return where
 
 
 @api_router.get("/admin/submissions")
 async def get_submissions(
     type: str,  # query param; use different name to avoid shadowing builtin
+    limit: int = SUBMISSIONS_MAX_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    order: str = "desc",
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    email: Optional[str] = None,
+    date_iso: Optional[str] = None,
     _: str = Depends(require_admin),
 ):
+    """Page through submissions by (timestamp, id). Pass next_cursor back as cursor for the next page.
+
+    Filters: start/end (ISO timestamps, end exclusive), email prefix, date_iso (bookings only).
+    """
     submission_type = type
-    if submission_type == "newsletter":
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                "SELECT id, email, timestamp FROM newsletter_subscribers ORDER BY timestamp DESC LIMIT 1000"
-            )
-    elif submission_type == "bookings":
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT id, date, date_iso, time, name, email, phone, business, message, timestamp
-                   FROM bookings ORDER BY timestamp DESC LIMIT 1000"""
-            )
-    elif submission_type == "contact":
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                """SELECT id, name, email, business, message, timestamp
-                   FROM contact_submissions ORDER BY timestamp DESC LIMIT 1000"""
-            )
-    elif submission_type == "unsubscribed":
-        async with pool.acquire() as conn:
-            rows = await conn.fetch(
-                "SELECT email as id, email, timestamp FROM unsubscribed_emails ORDER BY timestamp DESC LIMIT 1000"
-            )
-    else:
+    if submission_type not in _SUBMISSION_TYPES:
         raise HTTPException(status_code=400, detail="Invalid type")
-
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="Invalid order. Use asc or desc")
+    if date_iso is not None and submission_type != "bookings":
+        raise HTTPException(status_code=400, detail="date_iso filter only applies to bookings")
+    table, select, key = _SUBMISSION_TYPES[submission_type]
+    limit = max(1, min(limit, SUBMISSIONS_MAX_PAGE_SIZE))
+
+    args = []
+    where = _submission_filters(args, start, end, email, date_iso)
+    if cursor:
+        ts, last_key = _decode_keyset_cursor(cursor, uuid_key=(key == "id"))
+        op = "<" if order == "desc" else ">"
+        args.extend([ts, last_key])
+        key_param = f"${len(args)}" + ("::uuid" if key == "id" else "")
+        where.append(f"(timestamp, {key}) {op} (${len(args) - 1}, {key_param})")
+    direction = "DESC" if order == "desc" else "ASC"
+    sql = f"SELECT {select} FROM {table}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY timestamp {direction}, {key} {direction} LIMIT {limit + 1}"
+    # The page is rendered to JSON by Postgres; the extra row only signals a next page
+    columns = [c.split()[-1] for c in select.split(",")]
+    item = "json_build_object(" + ", ".join(f"'{c}', p.{c}" for c in columns) + ")"
+    page_sql = f"""
+        SELECT COALESCE(json_agg({item} ORDER BY p._rn) FILTER (WHERE p._rn <= {limit}), '[]')::text AS items,
+               COUNT(*) > {limit} AS has_more,
+               MAX(p.timestamp) FILTER (WHERE p._rn = {limit}) AS last_ts,
+               MAX(p.{key}::text) FILTER (WHERE p._rn = {limit}) AS last_key
+        FROM (SELECT s.*, row_number() OVER (ORDER BY s.timestamp {direction}, s.{key} {direction}) AS _rn FROM ({sql}) s) p
+    """
+
+    async with _ReadAcquire() as conn:
+        page = await conn.fetchrow(page_sql, *args)
+
+    next_cursor = None
+    if page["has_more"]:
+        next_cursor = _encode_keyset_cursor(page["last_ts"], page["last_key"])
+    return _json_object({"items": page["items"]}, next_cursor=next_cursor)
+
+
+SEARCH_MAX_PAGE_SIZE = 100
+# Private-use characters mark highlights so the snippet can be HTML-escaped safely
+_HL_START, _HL_STOP = "\ue000", "\ue001"
+
+
+@api_router.get("/admin/search")
+async def search_submissions(
+    q: str,
+    type: str = "all",  # all | bookings | contact
+    limit: int = 20,
+    offset: int = 0,
+    _: str = Depends(require_admin),
+):
+    """Ranked full-text search over booking and contact name, email, business and message."""
+    term = (q or "").strip()
+    if not term:
+        raise HTTPException(status_code=400, detail="Search query is required")
+    tables = {"all": _SEARCH_TABLES, "bookings": ("bookings",), "contact": ("contact_submissions",)}.get(type)
+    if tables is None:
+        raise HTTPException(status_code=400, detail="Invalid type")
+    limit = max(1, min(limit, SEARCH_MAX_PAGE_SIZE))
+    offset = max(0, offset)
+
+    like = "%" + term.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    args = [term, like, f"StartSel={_HL_START}, StopSel={_HL_STOP}, MaxFragments=2, MaxWords=20, MinWords=5"]
+    email_rank = "0"
+    if _search_trgm:
+        args.append(term.lower())
+        email_rank = "similarity(t.email_norm, $4)"
+    parts, messages = [], []
+    for table in tables:
+        label = "bookings" if table == "bookings" else "contact"
+        parts.append(f"""
+            SELECT '{label}' AS type, t.id, t.name, t.email, t.business, t.timestamp,
+                   ts_rank(t.search_tsv, q.tsq) + {email_rank} AS rank
+            FROM {table} t, q
+            WHERE t.search_tsv @@ q.tsq OR t.email_norm LIKE $2
+        """)
+        messages.append(f"WHEN '{label}' THEN (SELECT message FROM {table} WHERE id = p.id)")
+    # ts_headline is the expensive part, so it only runs for the rows on the page
+    sql = f"""
+        WITH q AS (
+            SELECT websearch_to_tsquery('english', $1) || websearch_to_tsquery('simple', $1) AS tsq
+        ),
+        p AS (
+            {" UNION ALL ".join(parts)}
+            ORDER BY rank DESC, timestamp DESC, id
+            LIMIT {limit + 1} OFFSET {offset}
+        )
+        SELECT p.*, ts_headline('english', coalesce(CASE p.type {" ".join(messages)} END, ''), q.tsq, $3) AS snippet
+        FROM p, q
+        ORDER BY p.rank DESC, p.timestamp DESC, p.id
+    """
+    async with _ReadAcquire() as conn:
+        rows = await conn.fetch(sql, *args)
+
+    has_more = len(rows) > limit
     items = []
-    for r in rows:
-        d = dict(r)
-        for k, v in d.items():
-            if hasattr(v, 'isoformat'):
-                d[k] = v.isoformat() if v else None
-            elif isinstance(v, uuid_module.UUID):
-                d[k] = str(v)
-        items.append(d)
-
-    return {"items": items}
+    for r in rows[:limit]:
+        snippet = _escape_html(r["snippet"]).replace(_HL_START, "<mark>").replace(_HL_STOP, "</mark>")
+        items.append({
+            "type": r["type"],
+            "id": str(r["id"]),
+            "name": r["name"],
+            "email": r["email"],
+            "business": r["business"],
+            "timestamp": r["timestamp"].isoformat() if r["timestamp"] else None,
+            "rank": round(float(r["rank"]), 4),
+            "snippet": snippet,
+        })
+    return {"items": items, "next_offset": offset + limit if has_more else None}
 
 
 @api_router.delete("/admin/submissions/unsubscribed/{email}")
@@ -924,7 +3322,7 @@ async def delete_unsubscribed(email: str, _: str = Depends(require_admin)):
     """Remove email from unsubscribed list (re-subscribe)."""
     async with pool.acquire() as conn:
         result = await conn.execute(
-            "DELETE FROM unsubscribed_emails WHERE email = $1", email
+            "DELETE FROM unsubscribed_emails WHERE email_norm = $1", _normalize_email(email)
         )
     if result == "DELETE 0":
         raise HTTPException(status_code=404, detail="Not found")
@@ -934,33 +3332,131 @@ async def delete_unsubscribed(email: str, _: str = Depends(require_admin)):
 @api_router.delete("/admin/submissions/newsletter/{item_id}")
 async def delete_newsletter(item_id: str, _: str = Depends(require_admin)):
     async with pool.acquire() as conn:
-        result = await conn.execute(
-            "DELETE FROM newsletter_subscribers WHERE id = $1", item_id
-        )
-    if result == "DELETE 0":
-        raise HTTPException(status_code=404, detail="Not found")
+        async with conn.transaction():
+            email = await conn.fetchval(
+                "DELETE FROM newsletter_subscribers WHERE id = $1 RETURNING email", item_id
+            )
+            if email is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            await _refresh_contact(conn, email)
     return {"status": "deleted"}
 
 
-@api_router.put("/admin/submissions/newsletter/{item_id}")
-async def update_newsletter(item_id: str, data: NewsletterSubmit, _: str = Depends(require_admin)):
-    async with pool.acquire() as conn:
-        result = await conn.execute(
-            "UPDATE newsletter_subscribers SET email = $1 WHERE id = $2",
-            data.email,
-            item_id,
+def _parse_if_match(if_match: Optional[str]) -> Optional[int]:
+    """Expected row version from an If-Match header ("3", W/"3"); None or * means unconditional."""
+    if if_match is None or if_match.strip() == "*":
+        return None
+    value = if_match.strip()
+    if value.startswith("W/"):
+        value = value[2:]
+    try:
+        return int(value.strip('"'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid If-Match header")
+
+
+async def _update_submission(
+    conn, submission_type: str, item_id: str, changes: dict, expected_version: Optional[int]
+) -> dict:
+    """Partial update in one statement: only the supplied columns are written, the contact row is
+    upserted in the same statement and the new row comes back via RETURNING. A stale
+    expected_version raises 409; with no changes the current row is returned as is."""
+    table, select, _ = _SUBMISSION_TYPES[submission_type]
+    if not changes:
+        row = await conn.fetchrow(f"SELECT {select} FROM {table} WHERE id = $1", item_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="Not found")
+        if expected_version is not None and row["version"] != expected_version:
+            _raise_version_conflict(row["version"])
+        return _submission_item(row)
+    flag = {"newsletter": "in_newsletter", "bookings": "in_bookings", "contact": "in_contact"}[submission_type]
+    args = [item_id]
+    sets = []
+    for column, value in changes.items():
+        args.append(value)
+        sets.append(f"{column} = ${len(args)}")
+    if "email" in changes:
+        args.append(_normalize_email(changes["email"]))
+        sets.append(f"email_norm = ${len(args)}")
+    sets += ["version = t.version + 1", "updated_at = NOW()"]
+    version_check = ""
+    if expected_version is not None:
+        args.append(expected_version)
+        version_check = f" AND t.version = ${len(args)}"
+    returning = ", ".join(f"t.{c.strip()}" for c in select.split(","))
+    name = "name" if submission_type != "newsletter" else "NULL"
+    # The update and the old address's contact refresh succeed or fail together
+    async with conn.transaction():
+        row = await conn.fetchrow(
+            f"""
+            WITH old AS (SELECT id, email FROM {table} WHERE id = $1),
+            upd AS (
+                UPDATE {table} t SET {", ".join(sets)}
+                FROM old WHERE t.id = old.id{version_check}
+                RETURNING {returning}, t.email_norm, old.email AS old_email
+            ),
+            c AS (
+                INSERT INTO contacts (email_norm, email, name, {flag})
+                SELECT email_norm, email, {name}, TRUE FROM upd
+                """ + _CONTACT_ON_CONFLICT + """
+            )
+            SELECT * FROM upd
+            """,
+            *args,
         )
-    if result == "UPDATE 0":
-        raise HTTPException(status_code=404, detail="Not found")
-    return {"status": "updated"}
+        if row is None:
+            current = await conn.fetchval(f"SELECT version FROM {table} WHERE id = $1", item_id)
+            if current is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            _raise_version_conflict(current)
+        if _normalize_email(row["old_email"]) != row["email_norm"]:
+            await _refresh_contact(conn, row["old_email"])
+    item = _submission_item(row)
+    del item["old_email"], item["email_norm"]
+    return item
+
+
+def _raise_version_conflict(current: int):
+    """409 carrying the current version as ETag, so the client can reload and retry."""
+    raise HTTPException(
+        status_code=409,
+        detail=f"This record was changed by someone else (now version {current}). Reload and try again.",
+        headers={"ETag": f'"{current}"'},
+    )
+
+
+def _require_fields(changes: dict, fields, detail: str):
+    for field in fields:
+        if field in changes and not (changes[field] or "").strip():
+            raise HTTPException(status_code=400, detail=detail)
+
+
+@api_router.put("/admin/submissions/newsletter/{item_id}")
+async def update_newsletter(
+    item_id: str,
+    data: NewsletterSubmit,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    _: str = Depends(require_admin),
+):
+    _require_fields({"email": data.email}, ("email",), "Email is required")
+    try:
+        async with pool.acquire() as conn:
+            item = await _update_submission(conn, "newsletter", item_id, {"email": data.email}, _parse_if_match(if_match))
+    except asyncpg.UniqueViolationError:
+        raise HTTPException(status_code=409, detail="This email is already subscribed.")
+    response.headers["ETag"] = f'"{item["version"]}"'
+    return {"status": "updated", "item": item}
 
 
 @api_router.delete("/admin/submissions/bookings/{item_id}")
 async def delete_booking(item_id: str, _: str = Depends(require_admin)):
     async with pool.acquire() as conn:
-        result = await conn.execute("DELETE FROM bookings WHERE id = $1", item_id)
-    if result == "DELETE 0":
-        raise HTTPException(status_code=404, detail="Not found")
+        async with conn.transaction():
+            email = await conn.fetchval("DELETE FROM bookings WHERE id = $1 RETURNING email", item_id)
+            if email is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            await _refresh_contact(conn, email)
     return {"status": "deleted"}
 
 
@@ -977,43 +3473,31 @@ class BookingUpdate(BaseModel):
 
 @api_router.put("/admin/submissions/bookings/{item_id}")
 async def update_booking(
-    item_id: str, data: BookingUpdate, _: str = Depends(require_admin)
+    item_id: str,
+    data: BookingUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    _: str = Depends(require_admin),
 ):
+    """Update only the supplied fields. Send If-Match: "<version>" to turn concurrent edits into 409s."""
+    changes = data.model_dump(exclude_unset=True)
+    _require_fields(changes, ("name", "email"), "Name and email are required")
     async with pool.acquire() as conn:
-        row = await conn.fetchrow("SELECT * FROM bookings WHERE id = $1", item_id)
-        if not row:
-            raise HTTPException(status_code=404, detail="Not found")
-        updates = dict(row)
-        for k, v in data.model_dump(exclude_unset=True).items():
-            updates[k] = v
-        if not (updates.get("name") or "").strip() or not (updates.get("email") or "").strip():
-            raise HTTPException(status_code=400, detail="Name and email are required")
-        await conn.execute(
-            """
-            UPDATE bookings SET date=$1, date_iso=$2, time=$3, name=$4, email=$5,
-                phone=$6, business=$7, message=$8 WHERE id=$9
-            """,
-            updates.get("date"),
-            updates.get("date_iso"),
-            updates.get("time"),
-            updates.get("name"),
-            updates.get("email"),
-            updates.get("phone"),
-            updates.get("business"),
-            updates.get("message"),
-            item_id,
-        )
-    return {"status": "updated"}
+        item = await _update_submission(conn, "bookings", item_id, changes, _parse_if_match(if_match))
+    response.headers["ETag"] = f'"{item["version"]}"'
+    return {"status": "updated", "item": item}
 
 
 @api_router.delete("/admin/submissions/contact/{item_id}")
 async def delete_contact(item_id: str, _: str = Depends(require_admin)):
     async with pool.acquire() as conn:
-        result = await conn.execute(
-            "DELETE FROM contact_submissions WHERE id = $1", item_id
-        )
-    if result == "DELETE 0":
-        raise HTTPException(status_code=404, detail="Not found")
+        async with conn.transaction():
+            email = await conn.fetchval(
+                "DELETE FROM contact_submissions WHERE id = $1 RETURNING email", item_id
+            )
+            if email is None:
+                raise HTTPException(status_code=404, detail="Not found")
+            await _refresh_contact(conn, email)
     return {"status": "deleted"}
 
 
@@ -1026,35 +3510,269 @@ class ContactUpdate(BaseModel):
 
 @api_router.put("/admin/submissions/contact/{item_id}")
 async def update_contact(
-    item_id: str, data: ContactUpdate, _: str = Depends(require_admin)
+    item_id: str,
+    data: ContactUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    _: str = Depends(require_admin),
 ):
+    """Update only the supplied fields. Send If-Match: "<version>" to turn concurrent edits into 409s."""
+    changes = {k: v for k, v in data.model_dump(exclude_unset=True).items() if v is not None}
+    _require_fields(changes, ("name", "email"), "Name and email are required")
+    _require_fields(changes, ("message",), "Message is required")
     async with pool.acquire() as conn:
-        row = await conn.fetchrow(
-            "SELECT name, email, business, message FROM contact_submissions WHERE id = $1",
-            item_id,
-        )
-        if not row:
-            raise HTTPException(status_code=404, detail="Not found")
-        merged = dict(row)
-        for k, v in data.model_dump(exclude_unset=True).items():
-            if v is not None:
-                merged[k] = v
-        if not (merged.get("name") or "").strip() or not (merged.get("email") or "").strip():
-            raise HTTPException(status_code=400, detail="Name and email are required")
-        if not (merged.get("message") or "").strip():
-            raise HTTPException(status_code=400, detail="Message is required")
-        await conn.execute(
-            """
-            UPDATE contact_submissions
-            SET name = $1, email = $2, business = $3, message = $4 WHERE id = $5
-            """,
-            merged["name"],
-            merged["email"],
-            merged["business"],
-            merged["message"],
-            item_id,
+        item = await _update_submission(conn, "contact", item_id, changes, _parse_if_match(if_match))
+    response.headers["ETag"] = f'"{item["version"]}"'
+    return {"status": "updated", "item": item}
+
+
+# Bulk admin mutations: many ids (or a filter) in one transaction
+ADMIN_BULK_MAX_BATCH = int(os.environ.get("ADMIN_BULK_MAX_BATCH") or "500")
+
+
+class SubmissionFilter(BaseModel):
+    start: Optional[str] = None
+    end: Optional[str] = None
+    email: Optional[str] = None  # prefix
+    date_iso: Optional[str] = None  # bookings only
+
+
+class BulkDeleteBody(BaseModel):
+    ids: Optional[List[str]] = None
+    filter: Optional[SubmissionFilter] = None
+
+
+class BulkUpdateBody(BaseModel):
+    ids: Optional[List[str]] = None
+    filter: Optional[SubmissionFilter] = None
+    changes: dict
+
+
+async def _resolve_bulk_targets(conn, submission_type: str, ids: Optional[List[str]], flt: Optional[SubmissionFilter]):
+    """Return (valid keys, per-id results for invalid ids). Enforces ADMIN_BULK_MAX_BATCH."""
+    table, _, key = _SUBMISSION_TYPES[submission_type]
+    if ids is not None:
+        if len(ids) > ADMIN_BULK_MAX_BATCH:
+            raise HTTPException(status_code=400, detail=f"At most {ADMIN_BULK_MAX_BATCH} ids per request")
+        if key != "id":
+            return list(dict.fromkeys(i.strip() for i in ids if i.strip())), []
+        valid, invalid = [], []
+        for i in dict.fromkeys(ids):
+            try:
+                valid.append(str(uuid_module.UUID(i)))
+            except (ValueError, AttributeError, TypeError):
+                invalid.append({"id": i, "status": "invalid"})
+        return valid, invalid
+    if flt is None:
+        raise HTTPException(status_code=400, detail="Provide ids or filter")
+    if flt.date_iso is not None and submission_type != "bookings":
+        raise HTTPException(status_code=400, detail="date_iso filter only applies to bookings")
+    args = []
+    where = _submission_filters(args, flt.start, flt.end, flt.email, flt.date_iso)
+    if not where:
+        raise HTTPException(status_code=400, detail="Filter must set at least one field")
+    rows = await conn.fetch(
+        f"SELECT {key} AS k FROM {table} WHERE {' AND '.join(where)} LIMIT {ADMIN_BULK_MAX_BATCH + 1}",
+        *args,
+    )
+    if len(rows) > ADMIN_BULK_MAX_BATCH:
+        raise HTTPException(status_code=400, detail=f"Filter matches more than {ADMIN_BULK_MAX_BATCH} rows")
+    return [str(r["k"]) for r in rows], []
+
+
+@api_router.post("/admin/submissions/{submission_type}/bulk-delete")
+async def bulk_delete_submissions(submission_type: str, data: BulkDeleteBody, _: str = Depends(require_admin)):
+    """Delete many submissions in one transaction. Returns a status per id."""
+    if submission_type not in _SUBMISSION_TYPES:
+        raise HTTPException(status_code=400, detail="Invalid type")
+    table = _SUBMISSION_TYPES[submission_type][0]
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            keys, results = await _resolve_bulk_targets(conn, submission_type, data.ids, data.filter)
+            if submission_type == "unsubscribed":
+                # Same matching as delete_unsubscribed
+                match = {k: _normalize_email(k) for k in keys}
+                rows = await conn.fetch(
+                    "DELETE FROM unsubscribed_emails WHERE email_norm = ANY($1::text[]) RETURNING email_norm AS k, email",
+                    list(set(match.values())),
+                )
+            else:
+                match = {k: k for k in keys}
+                rows = await conn.fetch(f"DELETE FROM {table} WHERE id = ANY($1::uuid[]) RETURNING id AS k, email", keys)
+                await _refresh_contacts(conn, [r["email"] for r in rows])
+    deleted = {str(r["k"]) for r in rows}
+    results += [{"id": k, "status": "deleted" if match[k] in deleted else "not_found"} for k in keys]
+    return {"deleted": len(deleted), "results": results}
+
+
+@api_router.post("/admin/submissions/{submission_type}/bulk-update")
+async def bulk_update_submissions(submission_type: str, data: BulkUpdateBody, _: str = Depends(require_admin)):
+    """Apply the same field changes to many bookings or contact submissions in one statement."""
+    models = {"bookings": BookingUpdate, "contact": ContactUpdate}
+    if submission_type not in models:
+        raise HTTPException(status_code=400, detail="Bulk update supports bookings and contact")
+    try:
+        changes = models[submission_type](**data.changes).model_dump(exclude_unset=True)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", "changes", *err["loc"])} for err in e.errors(include_url=False, include_context=False)]
         )
-    return {"status": "updated"}
+    if not changes:
+        raise HTTPException(status_code=400, detail="No changes given")
+    if "email" in changes:
+        raise HTTPException(status_code=400, detail="Email cannot be changed in bulk")
+    _require_fields(changes, ("name",), "Name is required")
+    if submission_type == "contact":
+        _require_fields(changes, ("message",), "Message is required")
+    table = _SUBMISSION_TYPES[submission_type][0]
+    columns = list(changes)
+    assignments = ", ".join(f"{col} = ${i + 2}" for i, col in enumerate(columns))
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            keys, results = await _resolve_bulk_targets(conn, submission_type, data.ids, data.filter)
+            rows = await conn.fetch(
+                f"UPDATE {table} SET {assignments}, version = version + 1, updated_at = NOW() "
+                "WHERE id = ANY($1::uuid[]) RETURNING id",
+                keys,
+                *(changes[c] for c in columns),
+            )
+    updated = {str(r["id"]) for r in rows}
+    results += [{"id": k, "status": "updated" if k in updated else "not_found"} for k in keys]
+    return {"updated": len(updated), "results": results}
+
+
+# Newsletter CSV import: the upload is streamed into a temp table with COPY, then
+# validated, normalized, deduplicated and merged in a single statement.
+_IMPORT_EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+_IMPORT_CHUNK_SIZE = 64 * 1024
+
+
+async def _csv_upload_source(file: UploadFile, first: bytes):
+    yield first
+    while True:
+        chunk = await file.read(_IMPORT_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def _read_csv_header(file: UploadFile) -> tuple[bytes, List[str]]:
+    """Read up to the end of the first line; returns (bytes read, first row cells)."""
+    buf = b""
+    while b"\n" not in buf and len(buf) < 1024 * 1024:
+        chunk = await file.read(_IMPORT_CHUNK_SIZE)
+        if not chunk:
+            break
+        buf += chunk
+    if buf.startswith(b"\xef\xbb\xbf"):
+        buf = buf[3:]
+    line = buf.split(b"\n", 1)[0].decode("utf-8", "replace")
+    return buf, next(csv.reader([line]), [])
+
+
+@api_router.post("/admin/submissions/newsletter/import")
+async def import_newsletter_csv(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    send_welcome: bool = Form(False),
+    _: str = Depends(require_admin),
+):
+    """Import subscribers from a CSV upload. Uses the "email" column, or the first column holding an address
+    when there is no header row. Unsubscribed addresses are skipped; welcome emails only with send_welcome."""
+    first, cells = await _read_csv_header(file)
+    if not cells:
+        raise HTTPException(status_code=400, detail="CSV file is empty")
+    names = [c.strip().lower() for c in cells]
+    header = not any("@" in c for c in cells)
+    if header:
+        if "email" not in names:
+            raise HTTPException(status_code=400, detail='CSV header has no "email" column')
+        email_col = names.index("email")
+    else:
+        email_col = next(i for i, c in enumerate(cells) if "@" in c)
+    columns = [f"c{i}" for i in range(len(cells))]
+    email_norm = _normalize_email_sql("email")
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(
+                f"CREATE TEMP TABLE newsletter_import ({', '.join(c + ' text' for c in columns)}) ON COMMIT DROP"
+            )
+            try:
+                await conn.copy_to_table(
+                    "newsletter_import",
+                    source=_csv_upload_source(file, first),
+                    columns=columns,
+                    format="csv",
+                    header=header,
+                )
+            except asyncpg.DataError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid CSV: {e}")
+            counts = await conn.fetchrow(
+                f"""
+                WITH src AS (
+                    SELECT BTRIM(c{email_col}) AS email FROM newsletter_import
+                    WHERE BTRIM(COALESCE(c{email_col}, '')) <> ''
+                ),
+                checked AS (
+                    SELECT email, email ~ $1 AND LENGTH(email) <= 255 AS valid FROM src
+                ),
+                normed AS (
+                    SELECT DISTINCT ON (email_norm) email, email_norm
+                    FROM (SELECT email, {email_norm} AS email_norm FROM checked WHERE valid) v
+                    ORDER BY email_norm
+                ),
+                allowed AS (
+                    SELECT n.email, n.email_norm FROM normed n
+                    WHERE NOT EXISTS (SELECT 1 FROM unsubscribed_emails u WHERE u.email_norm = n.email_norm)
+                ),
+                ins AS (
+                    INSERT INTO newsletter_subscribers (email, email_norm)
+                    SELECT email, email_norm FROM allowed
+                    ON CONFLICT (email_norm) DO NOTHING
+                    RETURNING email, email_norm
+                ),
+                merged AS (
+                    INSERT INTO contacts (email_norm, email, in_newsletter)
+                    SELECT email_norm, email, TRUE FROM ins
+                    """ + _CONTACT_ON_CONFLICT + """
+                )
+                SELECT
+                    (SELECT COUNT(*) FROM checked) AS rows,
+                    (SELECT COUNT(*) FROM checked WHERE NOT valid) AS invalid,
+                    (SELECT COUNT(*) FROM checked WHERE valid) AS valid,
+                    (SELECT COUNT(*) FROM normed) - (SELECT COUNT(*) FROM allowed) AS suppressed,
+                    (SELECT COUNT(*) FROM ins) AS inserted,
+                    CASE WHEN $2 THEN (SELECT ARRAY_AGG(email) FROM ins) END AS emails
+                """,
+                _IMPORT_EMAIL_PATTERN,
+                send_welcome,
+            )
+    inserted = counts["inserted"]
+    result = {
+        "rows": counts["rows"],
+        "inserted": inserted,
+        "duplicate": counts["valid"] - counts["suppressed"] - inserted,
+        "invalid": counts["invalid"],
+        "suppressed": counts["suppressed"],
+        "welcome_emails": 0,
+    }
+    if send_welcome and inserted:
+        smtp_config = _smtp_config()
+        if smtp_config:
+            from_email = (os.environ.get("EMAIL_FROM") or "").strip() or "noreply@example.com"
+            _add_task(
+                background_tasks,
+                "campaign",
+                _send_campaign_task,
+                "newsletter",
+                counts["emails"],
+                "Welcome to SyllaTech — You're In!",
+                _newsletter_welcome_html(),
+                from_email,
+                smtp_config,
+            )
+            result["welcome_emails"] = inserted
+    return result
 
 
 # Email campaign models
@@ -1083,8 +3801,9 @@ async def unsubscribe_get(email: str):
         )
     async with pool.acquire() as conn:
         await conn.execute(
-            "INSERT INTO unsubscribed_emails (email) VALUES ($1) ON CONFLICT (email) DO NOTHING",
+            "INSERT INTO unsubscribed_emails (email, email_norm) VALUES ($1, $2) ON CONFLICT DO NOTHING",
             email_clean,
+            _normalize_email(email_clean),
         )
     return HTMLResponse(
         content="<html><body style='font-family:sans-serif;max-width:480px;margin:80px auto;text-align:center;background:#030712;color:#e2e8f0;padding:40px;'><h2 style='color:#22d3ee;'>You're unsubscribed</h2><p>You won't receive marketing emails from us anymore.</p></body></html>"
@@ -1103,8 +3822,9 @@ async def unsubscribe_post(data: UnsubscribeRequest):
         raise HTTPException(status_code=400, detail="Invalid email")
     async with pool.acquire() as conn:
         await conn.execute(
-            "INSERT INTO unsubscribed_emails (email) VALUES ($1) ON CONFLICT (email) DO NOTHING",
+            "INSERT INTO unsubscribed_emails (email, email_norm) VALUES ($1, $2) ON CONFLICT DO NOTHING",
             email_clean,
+            _normalize_email(email_clean),
         )
     return {"status": "unsubscribed"}
 
@@ -1130,6 +3850,20 @@ def _inject_unsubscribe(html_body: str, to_email: str) -> str:
     return html_body.rstrip() + footer
 
 
+def _smtp_config() -> Optional[dict]:
+    """SMTP settings from env, or None when SMTP_HOST is not set. SMTP_TLS=0 skips STARTTLS."""
+    smtp_host = (os.environ.get("SMTP_HOST") or "").strip()
+    if not smtp_host:
+        return None
+    return {
+        "host": smtp_host,
+        "port": int(os.environ.get("SMTP_PORT") or "587"),
+        "user": (os.environ.get("SMTP_USER") or "").strip() or None,
+        "password": (os.environ.get("SMTP_PASSWORD") or "").strip() or None,
+        "tls": (os.environ.get("SMTP_TLS") or "1").strip().lower() not in ("0", "false", "no"),
+    }
+
+
 def _send_email_sync(to_email: str, subject: str, html_body: str, from_email: str, smtp_config: dict, append_unsubscribe: bool = False):
     """Sync email send via SMTP. Run in thread."""
     if append_unsubscribe:
@@ -1139,12 +3873,19 @@ def _send_email_sync(to_email: str, subject: str, html_body: str, from_email: st
     msg["From"] = from_email
     msg["To"] = to_email
     msg.attach(MIMEText(html_body, "html"))
-    with smtplib.SMTP(smtp_config.get("host", "localhost"), smtp_config.get("port", 587)) as smtp:
-        if smtp_config.get("tls", True):
-            smtp.starttls()
-        if smtp_config.get("user") and smtp_config.get("password"):
-            smtp.login(smtp_config["user"], smtp_config["password"])
-        smtp.sendmail(from_email, to_email, msg.as_string())
+    start = time.perf_counter()
+    try:
+        with smtplib.SMTP(smtp_config.get("host", "localhost"), smtp_config.get("port", 587)) as smtp:
+            if smtp_config.get("tls", True):
+                smtp.starttls()
+            if smtp_config.get("user") and smtp_config.get("password"):
+                smtp.login(smtp_config["user"], smtp_config["password"])
+            smtp.sendmail(from_email, to_email, msg.as_string())
+    except Exception:
+        _EMAIL_FAILURES.inc()
+        raise
+    finally:
+        _EMAIL_LATENCY.observe(time.perf_counter() - start)
 
 
 @api_router.post("/admin/email/reply")
@@ -1158,16 +3899,9 @@ async def send_reply_email(
     if not to_email or "@" not in to_email:
         raise HTTPException(status_code=400, detail="Invalid recipient email")
     from_email = (os.environ.get("EMAIL_FROM") or "").strip() or "noreply@example.com"
-    smtp_host = (os.environ.get("SMTP_HOST") or "").strip()
-    if not smtp_host:
+    smtp_config = _smtp_config()
+    if not smtp_config:
         raise HTTPException(status_code=503, detail="Email not configured. Set SMTP_HOST in .env")
-    smtp_config = {
-        "host": smtp_host,
-        "port": int(os.environ.get("SMTP_PORT") or "587"),
-        "user": (os.environ.get("SMTP_USER") or "").strip(),
-        "password": (os.environ.get("SMTP_PASSWORD") or "").strip(),
-        "tls": True,
-    }
     subject = (data.subject or "").strip() or "Message from SyllaTech"
     raw_body = (data.html_body or "").strip() or "No content."
     # If no HTML tags, treat as plain text
@@ -1183,82 +3917,154 @@ async def send_reply_email(
             logger.exception("Failed to send reply to %s: %s", to_email, e)
             raise
 
-    background_tasks.add_task(run_send)
+    _add_task(background_tasks, "email", run_send)
     return {"status": "sent", "to": to_email}
 
 
+# Recipient resolution. Audiences are read from the contacts table, unsubscribed
+# addresses are removed with an anti-join in Postgres and results are streamed
+# through a server-side cursor in batches. Campaign sends page through the audience
+# by email_norm instead, holding a connection only while each page is fetched.
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE") or "500")
+
+_NOT_UNSUBSCRIBED = """
+    NOT EXISTS (SELECT 1 FROM unsubscribed_emails u WHERE u.email_norm = c.email_norm)
+"""
+
+_AUDIENCE_FLAGS = {
+    "newsletter": "c.in_newsletter",
+    "bookings": "c.in_bookings",
+    "contact": "c.in_contact",
+    "all": "TRUE",
+}
+
+_AUDIENCE_QUERIES = {
+    audience: f"""
+        SELECT c.email, c.name FROM contacts c
+        WHERE {flag} AND {_NOT_UNSUBSCRIBED}
+        ORDER BY c.last_seen DESC
+    """
+    for audience, flag in _AUDIENCE_FLAGS.items()
+}
+
+
+def _audience_query(audience: str, only: Optional[List[str]] = None) -> tuple[str, list]:
+    """Build (sql, args) for an audience, optionally restricted to selected emails."""
+    sql = _AUDIENCE_QUERIES.get(audience)
+    if sql is None:
+        raise HTTPException(status_code=400, detail="Invalid audience")
+    if only is None:
+        return sql, []
+    flag = _AUDIENCE_FLAGS[audience]
+    return (
+        f"""
+        SELECT c.email, c.name FROM contacts c
+        WHERE c.email_norm = ANY($1::text[]) AND {flag} AND {_NOT_UNSUBSCRIBED}
+        """,
+        [[_normalize_email(e) for e in only if _normalize_email(e)]],
+    )
+
+
+async def _iter_audience(conn, audience: str, only: Optional[List[str]] = None, batch_size: int = EMAIL_BATCH_SIZE):
+    """Yield recipient rows in batches from a server-side cursor."""
+    sql, args = _audience_query(audience, only)
+    async for rows in _iter_cursor(conn, sql, *args, batch_size=batch_size):
+        yield rows
+
+
+async def _audience_pages(audience: str, only: Optional[List[str]] = None, batch_size: int = EMAIL_BATCH_SIZE):
+    """Yield recipient rows in keyset pages, acquiring a connection per page (for long-running sends)."""
+    _, args = _audience_query(audience, only)
+    only_clause = " AND c.email_norm = ANY($2::text[])" if only is not None else ""
+    sql = f"""
+        SELECT c.email, c.name, c.email_norm FROM contacts c
+        WHERE c.email_norm > $1{only_clause} AND {_AUDIENCE_FLAGS[audience]} AND {_NOT_UNSUBSCRIBED}
+        ORDER BY c.email_norm LIMIT {int(batch_size)}
+    """
+    after = ""
+    while True:
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(sql, after, *args)
+        if rows:
+            yield rows
+        if len(rows) < batch_size:
+            break
+        after = rows[-1]["email_norm"]
+
+
+async def _count_audience(conn, audience: str, only: Optional[List[str]] = None) -> int:
+    sql, args = _audience_query(audience, only)
+    return await conn.fetchval(f"SELECT COUNT(*) FROM ({sql}) c", *args)
+
+
 @api_router.get("/admin/email/recipients")
 async def get_email_recipients(
     audience: str,
     _: str = Depends(require_admin),
 ):
     """Return list of recipients for an audience (email + optional name). Excludes unsubscribed."""
-    if audience not in ("newsletter", "bookings", "contact", "all"):
+    if audience not in _AUDIENCE_QUERIES:
         raise HTTPException(status_code=400, detail="Invalid audience")
-    async with pool.acquire() as conn:
-        unsub_rows = await conn.fetch("SELECT email FROM unsubscribed_emails")
-        unsub_set = {r["email"].lower() for r in unsub_rows if r["email"]}
-        if audience == "newsletter":
-            rows = await conn.fetch("SELECT email FROM newsletter_subscribers ORDER BY timestamp DESC")
-            recipients = [{"email": r["email"], "name": None} for r in rows if (r["email"] or "").strip() and (r["email"] or "").strip().lower() not in unsub_set]
-        elif audience == "bookings":
-            rows = await conn.fetch(
-                "SELECT DISTINCT ON (email) email, name FROM bookings ORDER BY email, timestamp DESC"
-            )
-            recipients = [
-                {"email": r["email"], "name": (r["name"] or "").strip() or None}
-                for r in rows if (r["email"] or "").strip() and (r["email"] or "").strip().lower() not in unsub_set
-            ]
-        elif audience == "contact":
-            rows = await conn.fetch(
-                "SELECT email, name FROM contact_submissions ORDER BY timestamp DESC"
-            )
-            recipients = [
-                {"email": r["email"], "name": (r["name"] or "").strip() or None}
-                for r in rows if (r["email"] or "").strip() and (r["email"] or "").strip().lower() not in unsub_set
-            ]
-        else:
-            rows = await conn.fetch(
-                """
-                SELECT DISTINCT email FROM (
-                    SELECT email FROM newsletter_subscribers
-                    UNION SELECT email FROM bookings
-                    UNION SELECT email FROM contact_submissions
-                ) u
-                """
-            )
-            recipients = [{"email": r["email"], "name": None} for r in rows if (r["email"] or "").strip() and (r["email"] or "").strip().lower() not in unsub_set]
-    return {"recipients": recipients}
+    return StreamingResponse(_recipients_json(audience), media_type="application/json")
+
+
+async def _recipients_json(audience: str):
+    """{"recipients": [...]} written one cursor batch at a time; the connection lives as long as the stream."""
+    yield b'{"recipients":['
+    separator = b""
+    async with _ReadAcquire() as conn:
+        async for rows in _iter_audience(conn, audience):
+            # Encode the batch as a list and drop its brackets, so batches concatenate into one array
+            chunk = _json_dumps([{"email": r["email"], "name": (r["name"] or "").strip() or None} for r in rows])[1:-1]
+            if chunk:
+                yield separator + chunk
+                separator = b","
+    yield b"]}"
 
 
 @api_router.get("/admin/email/audiences")
 async def get_email_audiences(_: str = Depends(require_admin)):
-    """Return available email audiences with recipient counts."""
-    async with pool.acquire() as conn:
-        news_count = await conn.fetchval("SELECT COUNT(*) FROM newsletter_subscribers")
-        book_count = await conn.fetchval("SELECT COUNT(*) FROM bookings")
-        contact_count = await conn.fetchval("SELECT COUNT(*) FROM contact_submissions")
-        # All = unique emails across newsletter + bookings + contact
-        all_rows = await conn.fetch(
-            """
-            SELECT DISTINCT email FROM (
-                SELECT email FROM newsletter_subscribers
-                UNION SELECT email FROM bookings
-                UNION SELECT email FROM contact_submissions
-            ) u
+    """Return available email audiences with recipient counts (unique, excluding unsubscribed)."""
+    async with _ReadAcquire() as conn:
+        row = await conn.fetchrow(
+            f"""
+            SELECT
+                COUNT(*) FILTER (WHERE c.in_newsletter) AS newsletter,
+                COUNT(*) FILTER (WHERE c.in_bookings) AS bookings,
+                COUNT(*) FILTER (WHERE c.in_contact) AS contact,
+                COUNT(*) AS total
+            FROM contacts c
+            WHERE {_NOT_UNSUBSCRIBED}
             """
         )
-        all_count = len(all_rows)
     return {
         "audiences": [
-            {"id": "newsletter", "label": "Newsletter Subscribers", "count": news_count},
-            {"id": "bookings", "label": "Past Bookings", "count": book_count},
-            {"id": "contact", "label": "Contact Form Submissions", "count": contact_count},
-            {"id": "all", "label": "All (Unique Emails)", "count": all_count},
+            {"id": "newsletter", "label": "Newsletter Subscribers", "count": row["newsletter"]},
+            {"id": "bookings", "label": "Past Bookings", "count": row["bookings"]},
+            {"id": "contact", "label": "Contact Form Submissions", "count": row["contact"]},
+            {"id": "all", "label": "All (Unique Emails)", "count": row["total"]},
         ]
     }
 
 
+async def _send_campaign_task(audience: str, only: Optional[List[str]], subject: str, html_body: str, from_email: str, smtp_config: dict):
+    """Background task: page through the audience and send each batch in a thread."""
+
+    def send_batch(emails: List[str]):
+        for to_email in emails:
+            try:
+                _send_email_sync(to_email, subject, html_body, from_email, smtp_config, append_unsubscribe=True)
+            except Exception as e:
+                logger.exception("Failed to send email to %s: %s", to_email, e)
+
+    try:
+        # No connection or transaction is held while a batch is being sent
+        async for rows in _audience_pages(audience, only):
+            await asyncio.to_thread(send_batch, [r["email"] for r in rows])
+    except Exception as e:
+        logger.exception("Campaign send to %s failed: %s", audience, e)
+
+
 @api_router.post("/admin/email/send")
 async def send_email_campaign(
     data: EmailCampaign,
@@ -1267,76 +4073,71 @@ async def send_email_campaign(
 ):
     """Send HTML email to selected audience."""
     from_email = (os.environ.get("EMAIL_FROM") or "").strip() or "noreply@example.com"
-    smtp_host = (os.environ.get("SMTP_HOST") or "").strip()
-    smtp_port = int(os.environ.get("SMTP_PORT") or "587")
-    smtp_user = (os.environ.get("SMTP_USER") or "").strip()
-    smtp_pass = (os.environ.get("SMTP_PASSWORD") or "").strip()
-
-    if not smtp_host:
+    smtp_config = _smtp_config()
+    if not smtp_config:
         raise HTTPException(
             status_code=503,
             detail="Email not configured. Set SMTP_HOST, SMTP_USER, SMTP_PASSWORD in .env",
         )
 
+    only = data.recipients or None
     async with pool.acquire() as conn:
-        unsubscribed = await conn.fetch("SELECT email FROM unsubscribed_emails")
-        unsub_set = {r["email"].lower() for r in unsubscribed if r["email"]}
-        if data.audience == "newsletter":
-            rows = await conn.fetch("SELECT email FROM newsletter_subscribers")
-        elif data.audience == "bookings":
-            rows = await conn.fetch("SELECT DISTINCT email FROM bookings")
-        elif data.audience == "contact":
-            rows = await conn.fetch("SELECT DISTINCT email FROM contact_submissions")
-        elif data.audience == "all":
-            rows = await conn.fetch(
-                """
-                SELECT DISTINCT email FROM (
-                    SELECT email FROM newsletter_subscribers
-                    UNION SELECT email FROM bookings
-                    UNION SELECT email FROM contact_submissions
-                ) u
-                """
-            )
-        else:
-            raise HTTPException(status_code=400, detail="Invalid audience")
-
-    all_emails = [r["email"] for r in rows if (r["email"] or "").strip() and (r["email"] or "").strip().lower() not in unsub_set]
-    if data.recipients:
-        valid = set(all_emails)
-        recipients = [e for e in data.recipients if (e or "").strip() in valid]
-        if not recipients:
+        count = await _count_audience(conn, data.audience, only)
+    if not count:
+        if only:
             raise HTTPException(status_code=400, detail="No valid recipients in selection")
-    else:
-        recipients = all_emails
-    if not recipients:
         raise HTTPException(status_code=400, detail="No recipients in selected audience")
 
-    smtp_config = {
-        "host": smtp_host,
-        "port": smtp_port,
-        "user": smtp_user or None,
-        "password": smtp_pass or None,
-        "tls": True,
+    _add_task(
+        background_tasks, "campaign", _send_campaign_task, data.audience, only, data.subject, data.html_body, from_email, smtp_config
+    )
+    return {
+        "status": "sending",
+        "recipients": count,
+        "message": f"Email queued for {count} recipient(s)",
     }
 
-    def run_send():
-        for to_email in recipients:
-            try:
-                _send_email_sync(to_email, data.subject, data.html_body, from_email, smtp_config, append_unsubscribe=True)
-            except Exception as e:
-                logger.exception("Failed to send email to %s: %s", to_email, e)
 
-    background_tasks.add_task(run_send)
+async def require_metrics_auth(
+    x_api_key: Optional[str] = Header(None, alias="x-api-key"),
+    authorization: Optional[str] = Header(None),
+):
+    """Admin key via x-api-key, or as a bearer token (what Prometheus scrape configs send)."""
+    if not x_api_key and (authorization or "").lower().startswith("bearer "):
+        x_api_key = authorization[7:]
+    return await require_admin(x_api_key)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(_: str = Depends(require_metrics_auth)):
+    return Response(_render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@api_router.get("/admin/db/queries")
+async def get_query_profile(limit: int = 50, _: str = Depends(require_admin)):
+    """Query fingerprints for this worker, by total time, plus the recent slow-query log."""
+    ranked = sorted(_query_stats.items(), key=lambda kv: kv[1][1], reverse=True)[: max(1, limit)]
     return {
-        "status": "sending",
-        "recipients": len(recipients),
-        "message": f"Email queued for {len(recipients)} recipient(s)",
+        "queries": [
+            {
+                "fingerprint": fingerprint,
+                "calls": calls,
+                "total_ms": round(total * 1000, 2),
+                "mean_ms": round(total * 1000 / calls, 3) if calls else 0.0,
+                "max_ms": round(longest * 1000, 2),
+                "rows": rows,
+            }
+            for fingerprint, (calls, total, longest, rows) in ranked
+        ],
+        "slow": list(reversed(_slow_queries)),
+        "slow_query_ms": SLOW_QUERY_MS,
     }
 
 
 # Include the router in the main app
 app.include_router(api_router)
 
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
@@ -1344,6 +4145,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+if DATABASE_READ_URL:
+    app.add_middleware(ReadAfterWriteMiddleware)
+app.add_middleware(QueryProfileMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -0,0 +1,145 @@
+"""Local SMTP sink for development and benchmarks.
+
+Accepts mail on localhost and discards it, with optional artificial latency and
+failure injection. Run standalone:
+
+    python smtp_sink.py --port 1025 --latency-ms 20 --failure-rate 0.01
+
+then point the backend at it with SMTP_HOST=localhost, SMTP_PORT=1025 and
+SMTP_TLS=0 in backend/.env (STARTTLS and AUTH are not supported).
+"""
+import argparse
+import random
+import socket
+import socketserver
+import threading
+import time
+from typing import Optional
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        # Multi-line replies would otherwise stall on Nagle + delayed ACK
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def reply(self, line: str):
+        self.wfile.write((line + "\r\n").encode("ascii"))
+
+    def handle(self):
+        sink: "SMTPSink" = self.server.sink
+        self.reply("220 syllatech-sink ESMTP")
+        rcpts = 0
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            verb = line[:4].decode("ascii", "replace").upper()
+            if verb == "EHLO":
+                self.reply("250-syllatech-sink")
+                self.reply("250-8BITMIME")
+                self.reply("250 SIZE 52428800")
+            elif verb == "HELO":
+                self.reply("250 syllatech-sink")
+            elif verb == "MAIL":
+                rcpts = 0
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                rcpts += 1
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                while True:
+                    chunk = self.rfile.readline()
+                    if not chunk or chunk == b".\r\n":
+                        break
+                    size += len(chunk)
+                if sink.latency_ms:
+                    time.sleep(sink.latency_ms / 1000.0)
+                if sink.failure_rate and random.random() < sink.failure_rate:
+                    sink._record(0, size, failed=True)
+                    self.reply("451 Injected failure")
+                else:
+                    sink._record(rcpts, size)
+                    self.reply("250 OK queued")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                break
+            else:
+                self.reply("502 Command not implemented")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+
+class SMTPSink:
+    """Threaded SMTP server that counts messages instead of delivering them."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0, failure_rate: float = 0.0):
+        self.host = host
+        self.port = port
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self.messages = 0
+        self.recipients = 0
+        self.failures = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _record(self, rcpts: int, size: int, failed: bool = False):
+        with self._lock:
+            if failed:
+                self.failures += 1
+            else:
+                self.messages += 1
+                self.recipients += rcpts
+                self.bytes += size
+
+    def start(self) -> "SMTPSink":
+        self._server = _Server((self.host, self.port), _SMTPHandler)
+        self._server.sink = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-sink", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "SMTPSink":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local SMTP sink (discards mail)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay before acknowledging each message")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Fraction of messages rejected with 451")
+    args = parser.parse_args()
+    sink = SMTPSink(args.host, args.port, args.latency_ms, args.failure_rate).start()
+    print(f"SMTP sink listening on {sink.host}:{sink.port}")
+    try:
+        while True:
+            time.sleep(5)
+            print(f"messages={sink.messages} failures={sink.failures} bytes={sink.bytes}")
+    except KeyboardInterrupt:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    main()
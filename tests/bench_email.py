@@ -0,0 +1,215 @@
+"""Email path throughput benchmark against the local SMTP sink.
+
+Drives the real send paths of backend/server.py (booking confirmation + owner
+notification, admin replies and campaigns) into backend/smtp_sink.py and
+reports messages/sec, p50/p99 per-message latency and peak thread count.
+
+    python -m tests.bench_email --scenario booking --messages 1000 --concurrency 20
+    python -m tests.bench_email --scenario reply --latency-ms 20 --failure-rate 0.01
+    python -m tests.bench_email --scenario campaign --messages 5000 \\
+        --database-url postgresql://localhost:5432/syllatech_bench
+
+The campaign scenario seeds bench-N@example.test contacts into the given
+database and removes them afterwards; use a disposable database.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from smtp_sink import SMTPSink  # noqa: E402
+
+
+class _SendTimer:
+    """Wraps server._send_email_sync to record per-message latency."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.samples = []
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        failed = False
+        try:
+            return self.fn(*args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - t0
+            with self._lock:
+                self.samples.append(elapsed)
+                self.errors += failed
+
+
+class _ThreadSampler:
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _percentile(samples, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def _run_booking(server, args):
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int):
+        async with sem:
+            tasks = server.BackgroundTasks()
+            data = server.BookingSubmit(
+                date="Monday, January 5, 2026",
+                date_iso="2026-01-05",
+                time="10:00 AM",
+                name=f"Bench {i}",
+                email=f"bench-{i}@example.test",
+                phone="555-0100",
+                business="Bench Co",
+                message="Benchmark booking",
+            )
+            server._queue_booking_emails(tasks, data)
+            try:
+                await tasks()
+            except Exception:
+                pass
+
+    # Each booking sends a confirmation and an owner notification
+    await asyncio.gather(*(one(i) for i in range(max(1, args.messages // 2))))
+
+
+async def _run_reply(server, args):
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def one(i: int):
+        async with sem:
+            tasks = server.BackgroundTasks()
+            body = server.ReplyEmailBody(
+                to=f"bench-{i}@example.test",
+                subject="Re: your enquiry",
+                html_body="Thanks for reaching out.\nWe'll be in touch.",
+            )
+            await server.send_reply_email(body, tasks, _="bench")
+            try:
+                await tasks()
+            except Exception:
+                pass
+
+    await asyncio.gather(*(one(i) for i in range(args.messages)))
+
+
+async def _run_campaign(server, args):
+    import asyncpg
+
+    if not args.database_url:
+        raise SystemExit("--database-url is required for the campaign scenario")
+    server.pool = await asyncpg.create_pool(args.database_url, min_size=1, max_size=4)
+    emails = [f"bench-{i}@example.test" for i in range(args.messages)]
+    try:
+        async with server.pool.acquire() as conn:
+            await server.init_db(conn)
+            await conn.execute(
+                """
+                INSERT INTO contacts (email_norm, email, in_newsletter)
+                SELECT e, e, TRUE FROM UNNEST($1::text[]) AS e
+                ON CONFLICT (email_norm) DO UPDATE SET in_newsletter = TRUE
+                """,
+                emails,
+            )
+        smtp_config = server._smtp_config()
+        await server._send_campaign_task(
+            "newsletter", emails, "Bench campaign", "<p>Hello {{UNSUBSCRIBE_URL}}</p>",
+            "bench@example.test", smtp_config,
+        )
+    finally:
+        async with server.pool.acquire() as conn:
+            await conn.execute("DELETE FROM contacts WHERE email_norm = ANY($1::text[])", emails)
+        await server.pool.close()
+
+
+SCENARIOS = {"booking": _run_booking, "reply": _run_reply, "campaign": _run_campaign}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the email send path against a local SMTP sink")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="booking")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    args = parser.parse_args()
+
+    with SMTPSink(latency_ms=args.latency_ms, failure_rate=args.failure_rate) as sink:
+        os.environ.update({
+            "SMTP_HOST": sink.host,
+            "SMTP_PORT": str(sink.port),
+            "SMTP_TLS": "0",
+            "SMTP_USER": "",
+            "SMTP_PASSWORD": "",
+            "EMAIL_FROM": "bench@example.test",
+            "OWNER_NOTIFICATION_EMAIL": "owner@example.test",
+        })
+        import server
+
+        # Failure injection would otherwise print a traceback per message
+        logging.getLogger(server.__name__).setLevel(logging.CRITICAL)
+        timer = _SendTimer(server._send_email_sync)
+        server._send_email_sync = timer
+
+        with _ThreadSampler() as threads:
+            t0 = time.perf_counter()
+            asyncio.run(SCENARIOS[args.scenario](server, args))
+            elapsed = time.perf_counter() - t0
+
+    report = {
+        "scenario": args.scenario,
+        "messages": len(timer.samples),
+        "delivered": sink.messages,
+        "failed": timer.errors,
+        "elapsed_s": round(elapsed, 3),
+        "messages_per_s": round(len(timer.samples) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(timer.samples, 50) * 1000, 2),
+        "p99_ms": round(_percentile(timer.samples, 99) * 1000, 2),
+        "peak_threads": threads.peak,
+        "sink_latency_ms": args.latency_ms,
+        "failure_rate": args.failure_rate,
+        "concurrency": args.concurrency,
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
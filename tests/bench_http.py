@@ -0,0 +1,338 @@
+"""HTTP load benchmark for the API against a disposable local Postgres.
+
+Seeds realistic volumes, starts backend/server.py under uvicorn and drives a
+weighted mix of public and admin endpoints at one or more concurrency levels.
+Reports requests/sec, p50/p95/p99 latency and DB time (from the Server-Timing
+header, DB_PROFILE=1) overall and per endpoint as JSON.
+
+    python -m tests.bench_http --database-url postgresql://localhost:5432/syllatech_bench
+    python -m tests.bench_http --database-url ... --workload admin --concurrency 5,20 \\
+        --duration 30 --output after.json --baseline before.json
+
+Seeding is skipped when the tables already hold data; --reseed truncates them
+first. Everything is written to the given database, so use a disposable one.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import re
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+from tests.bench_email import _percentile  # noqa: E402
+
+ADMIN_KEY = "bench-admin-key"
+_SERVER_TIMING_DB = re.compile(r"db;dur=([0-9.]+)")
+
+# endpoint name -> relative weight
+WORKLOADS = {
+    "public": {"track": 60, "availability": 30, "booking": 10},
+    "admin": {"analytics": 35, "submissions": 45, "export": 20},
+    "mixed": {
+        "track": 40,
+        "availability": 25,
+        "booking": 5,
+        "analytics": 10,
+        "submissions": 15,
+        "export": 5,
+    },
+}
+
+# Shared across levels so bookings never collide on a slot (409s would skew results)
+_BOOKING_SEQ = itertools.count(1)
+
+_BENCH_TABLES = ("visits", "bookings", "newsletter_subscribers", "contact_submissions", "contacts")
+
+
+async def _seed(database_url: str, args):
+    """Create the schema with server.init_db and bulk-load rows with generate_series."""
+    import asyncpg
+    import server
+
+    conn = await asyncpg.connect(database_url)
+    try:
+        await server.init_db(conn)
+        if args.reseed:
+            await conn.execute(f"TRUNCATE {', '.join(_BENCH_TABLES)}")
+        if await conn.fetchval("SELECT EXISTS (SELECT 1 FROM visits)"):
+            print("Tables already seeded; pass --reseed to start over", file=sys.stderr)
+            return
+        t0 = time.perf_counter()
+        chunk = 500_000
+        for start in range(0, args.visits, chunk):
+            await conn.execute(
+                """
+                INSERT INTO visits (path, country, region, city, timestamp)
+                SELECT (ARRAY['/', '/services', '/about', '/contact', '/pricing', '/blog'])[1 + g % 6],
+                       (ARRAY['United States', 'Canada', 'France', 'Senegal', 'Germany', 'Unknown'])[1 + (g / 7) % 6],
+                       (ARRAY['California', 'Ontario', 'Ile-de-France', 'Dakar', 'Berlin', ''])[1 + (g / 7) % 6],
+                       (ARRAY['San Francisco', 'Toronto', 'Paris', 'Dakar', 'Berlin', ''])[1 + (g / 7) % 6],
+                       NOW() - (g % (86400 * 90)) * INTERVAL '1 second'
+                FROM generate_series($1::int, $2::int) AS g
+                """,
+                start + 1,
+                min(args.visits, start + chunk),
+            )
+            print(f"  visits {min(args.visits, start + chunk):,}/{args.visits:,}", file=sys.stderr)
+        # 12 slots a day from five years back (about 4.5 years of days at the default
+        # 20,000 bookings) keeps (date_iso, time) unique
+        await conn.execute(
+            """
+            INSERT INTO bookings (date, date_iso, time, name, email, email_norm, phone, business, message, timestamp)
+            SELECT to_char(d, 'FMDay, FMMonth FMDD, YYYY'), to_char(d, 'YYYY-MM-DD'),
+                   (ARRAY['09:00 AM', '09:30 AM', '10:00 AM', '10:30 AM', '11:00 AM', '11:30 AM',
+                          '02:00 PM', '02:30 PM', '03:00 PM', '03:30 PM', '04:00 PM', '04:30 PM'])[1 + g % 12],
+                   'Bench Booking ' || g, 'bench-booking-' || g || '@example.test',
+                   'bench-booking-' || g || '@example.test', '555-0100', 'Bench Co',
+                   'Looking for help with our website and automation, request ' || g,
+                   NOW() - (g % 86400) * INTERVAL '1 minute'
+            FROM generate_series(1, $1::int) AS g, LATERAL (SELECT CURRENT_DATE - 1825 + g / 12 AS d) day
+            """,
+            args.bookings,
+        )
+        await conn.execute(
+            """
+            INSERT INTO newsletter_subscribers (email, email_norm, timestamp)
+            SELECT 'bench-sub-' || g || '@example.test', 'bench-sub-' || g || '@example.test',
+                   NOW() - (g % 86400) * INTERVAL '1 minute'
+            FROM generate_series(1, $1::int) AS g
+            """,
+            args.subscribers,
+        )
+        await conn.execute(
+            """
+            INSERT INTO contact_submissions (name, email, email_norm, business, message, timestamp)
+            SELECT 'Bench Contact ' || g, 'bench-contact-' || g || '@example.test',
+                   'bench-contact-' || g || '@example.test', 'Bench Co',
+                   'Question about pricing and timelines, message ' || g,
+                   NOW() - (g % 86400) * INTERVAL '1 minute'
+            FROM generate_series(1, $1::int) AS g
+            """,
+            args.bookings // 2,
+        )
+        # init_db rebuilds contacts from the source tables when it is empty
+        await conn.execute("TRUNCATE contacts")
+        await server.init_db(conn)
+        await conn.execute(f"ANALYZE {', '.join(_BENCH_TABLES)}")
+        print(f"Seeded in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+    finally:
+        await conn.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_server(args, port: int) -> subprocess.Popen:
+    env = dict(
+        os.environ,
+        DATABASE_URL=args.database_url,
+        ADMIN_SECRET_KEY=ADMIN_KEY,
+        DB_PROFILE="1",
+        RATE_LIMITS="off",
+        # Every tracked visit is written: httpx is classified as a bot and the
+        # benchmark repeats the same (IP, path) pairs
+        VISIT_BOT_FILTER="0",
+        VISIT_DEDUP_SECONDS="0",
+        SMTP_HOST="",
+    )
+    cmd = [
+        sys.executable, "-m", "uvicorn", "server:app",
+        "--host", "127.0.0.1", "--port", str(port),
+        "--workers", str(args.workers), "--log-level", "warning",
+    ]
+    # Per-request DB_PROFILE log lines would dominate the benchmark's own output
+    return subprocess.Popen(cmd, cwd=BACKEND_DIR, env=env, stderr=subprocess.DEVNULL)
+
+
+async def _wait_ready(client, proc: subprocess.Popen, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"Server exited with code {proc.returncode}")
+        try:
+            if (await client.get("/api/booking/config")).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    raise SystemExit("Server did not become ready")
+
+
+class _Requests:
+    """Builds one request per endpoint name from a seeded RNG."""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+
+    def build(self, name: str) -> tuple:
+        rng = self.rng
+        admin = {"x-api-key": ADMIN_KEY}
+        if name == "track":
+            return "POST", "/api/track", {"json": {"path": rng.choice(["/", "/services", "/about", "/contact"])}}
+        if name == "availability":
+            day = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            return "GET", "/api/availability", {"params": {"date": day}}
+        if name == "booking":
+            seq = next(_BOOKING_SEQ)
+            return "POST", "/api/submissions/bookings", {"json": {
+                "date_iso": f"2099-{1 + seq % 12:02d}-{1 + seq % 28:02d}",
+                "time": f"bench-{os.getpid()}-{seq}",
+                "name": "Load Test",
+                "email": f"load-{seq}@example.test",
+                "message": "Benchmark booking",
+            }}
+        if name == "analytics":
+            return "GET", "/api/admin/analytics", {"headers": admin}
+        if name == "submissions":
+            params = {"type": rng.choice(["bookings", "contact", "newsletter"]), "limit": 100}
+            if rng.random() < 0.3:
+                params["email"] = f"bench-{rng.choice(['booking', 'contact', 'sub'])}-{rng.randint(1, 99)}"
+            return "GET", "/api/admin/submissions", {"params": params, "headers": admin}
+        if name == "export":
+            path = rng.choice(["/api/admin/export/bookings", "/api/admin/export/newsletter"])
+            return "GET", path, {"headers": {**admin, "accept-encoding": "gzip"}}
+        raise ValueError(name)
+
+
+def _summarize(samples: list, elapsed: float) -> dict:
+    latencies = [s[0] for s in samples]
+    db = [s[2] for s in samples if s[2] is not None]
+    return {
+        "requests": len(samples),
+        "errors": sum(1 for s in samples if s[1] >= 500 or s[1] == 0),
+        "rps": round(len(samples) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(_percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 99) * 1000, 2),
+        "db_ms_mean": round(sum(db) / len(db), 2) if db else None,
+        "db_ms_p95": round(_percentile(db, 95), 2) if db else None,
+    }
+
+
+async def _run_level(client, weights: dict, concurrency: int, duration: float, seed: int) -> dict:
+    rng = random.Random(seed + concurrency)
+    builder = _Requests(rng)
+    names, cum = list(weights), list(itertools.accumulate(weights.values()))
+    samples = {name: [] for name in names}
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        while time.monotonic() < deadline:
+            name = rng.choices(names, cum_weights=cum)[0]
+            method, path, kwargs = builder.build(name)
+            t0 = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+                await response.aread()
+                status = response.status_code
+                match = _SERVER_TIMING_DB.search(response.headers.get("server-timing", ""))
+                db_ms = float(match.group(1)) if match else None
+            except Exception:
+                status, db_ms = 0, None
+            samples[name].append((time.perf_counter() - t0, status, db_ms))
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    everything = [s for group in samples.values() for s in group]
+    return {
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "total": _summarize(everything, elapsed),
+        "endpoints": {name: _summarize(group, elapsed) for name, group in samples.items() if group},
+    }
+
+
+def _compare(report: dict, baseline: dict) -> list:
+    """Per level and endpoint: rps and p95 change vs. a previous report."""
+    lines = []
+    old_levels = {lvl["concurrency"]: lvl for lvl in baseline.get("levels", [])}
+    for level in report["levels"]:
+        old = old_levels.get(level["concurrency"])
+        if not old:
+            continue
+        rows = [("total", level["total"], old["total"])]
+        rows += [(n, s, old["endpoints"][n]) for n, s in level["endpoints"].items() if n in old["endpoints"]]
+        for name, new, prev in rows:
+            rps = (new["rps"] - prev["rps"]) / prev["rps"] * 100 if prev["rps"] else 0.0
+            p95 = (new["p95_ms"] - prev["p95_ms"]) / prev["p95_ms"] * 100 if prev["p95_ms"] else 0.0
+            lines.append(f"c={level['concurrency']:<4} {name:<12} rps {rps:+6.1f}%  p95 {p95:+6.1f}%")
+    return lines
+
+
+async def _run(args) -> dict:
+    import httpx
+
+    if not args.skip_seed:
+        await _seed(args.database_url, args)
+    port = _free_port()
+    proc = _start_server(args, port)
+    limits = httpx.Limits(max_connections=max(args.concurrency) + 10)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=60.0, limits=limits) as client:
+            await _wait_ready(client, proc)
+            weights = WORKLOADS[args.workload]
+            if args.warmup:
+                await _run_level(client, weights, min(args.concurrency), args.warmup, args.seed)
+            levels = []
+            for concurrency in args.concurrency:
+                levels.append(await _run_level(client, weights, concurrency, args.duration, args.seed))
+                print(f"  c={concurrency}: {levels[-1]['total']['rps']} rps", file=sys.stderr)
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+    return {
+        "workload": args.workload,
+        "weights": WORKLOADS[args.workload],
+        "duration_s": args.duration,
+        "workers": args.workers,
+        "seed": args.seed,
+        "levels": levels,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-benchmark the API against a local Postgres")
+    parser.add_argument("--database-url", default=os.environ.get("BENCH_DATABASE_URL"))
+    parser.add_argument("--workload", choices=sorted(WORKLOADS), default="mixed")
+    parser.add_argument("--concurrency", default="10,50", help="Comma-separated levels, run in order")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per concurrency level")
+    parser.add_argument("--warmup", type=float, default=3.0, help="Unmeasured seconds before the first level")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--visits", type=int, default=2_000_000)
+    parser.add_argument("--bookings", type=int, default=20_000)
+    parser.add_argument("--subscribers", type=int, default=20_000)
+    parser.add_argument("--reseed", action="store_true", help="Truncate and reseed the benchmark tables")
+    parser.add_argument("--skip-seed", action="store_true")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request mix")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--baseline", help="Previous JSON report to compare against")
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("--database-url (or BENCH_DATABASE_URL) is required")
+    args.concurrency = [int(c) for c in args.concurrency.split(",") if c.strip()]
+
+    report = asyncio.run(_run(args))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    if args.baseline:
+        for line in _compare(report, json.loads(Path(args.baseline).read_text())):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
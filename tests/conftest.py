@@ -0,0 +1,55 @@
+"""Shared setup for the backend tests.
+
+Tests that need Postgres use TEST_DATABASE_URL (a disposable database; tables
+are created on startup) and are skipped when it is not set:
+
+    TEST_DATABASE_URL=postgresql://localhost:5432/syllatech_test python -m pytest tests
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Set before server is imported: it reads its configuration at import time
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ.setdefault("ADMIN_SECRET_KEY", "test-secret")
+os.environ["RATE_LIMITS"] = "off"
+os.environ["SMTP_HOST"] = ""
+os.environ["BOOKING_REMINDERS"] = "0"
+os.environ.pop("DATABASE_READ_URL", None)
+os.environ.pop("ARCHIVE_DIR", None)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """TestClient with the app started against TEST_DATABASE_URL."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL not set")
+    from fastapi.testclient import TestClient
+
+    import server
+
+    with TestClient(server.app) as c:
+        c.headers["x-api-key"] = c.portal.call(server._get_admin_secret)
+        yield c
+
+
+@pytest.fixture
+def db(client):
+    """Run a coroutine function against a pooled connection: db(lambda conn: ...)."""
+    import server
+
+    def run(fn):
+        async def call():
+            async with server.pool.acquire() as conn:
+                return await fn(conn)
+
+        return client.portal.call(call)
+
+    return run
@@ -0,0 +1,55 @@
+"""Admin bulk-delete / bulk-update endpoints."""
+import uuid
+
+
+def _create_booking(db, name: str) -> str:
+    return db(
+        lambda conn: conn.fetchval(
+            "INSERT INTO bookings (date_iso, time, name, email) VALUES ('2030-01-07', '09:00 AM', $1, $2) RETURNING id::text",
+            name,
+            f"{uuid.uuid4().hex[:12]}@example.test",
+        )
+    )
+
+
+def test_bulk_update_rejects_invalid_changes(client, db):
+    booking_id = _create_booking(db, "Bulk invalid")
+    r = client.post("/api/admin/submissions/bookings/bulk-update", json={"ids": [booking_id], "changes": {"name": 123}})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "changes", "name"]
+    assert db(lambda conn: conn.fetchval("SELECT name FROM bookings WHERE id = $1", booking_id)) == "Bulk invalid"
+
+
+def test_bulk_update_and_delete_report_per_id_results(client, db):
+    booking_id = _create_booking(db, "Bulk before")
+    missing = str(uuid.uuid4())
+    r = client.post(
+        "/api/admin/submissions/bookings/bulk-update",
+        json={"ids": [booking_id, missing, "not-a-uuid"], "changes": {"name": "Bulk after"}},
+    )
+    assert r.status_code == 200
+    assert r.json()["updated"] == 1
+    assert {x["id"]: x["status"] for x in r.json()["results"]} == {
+        booking_id: "updated",
+        missing: "not_found",
+        "not-a-uuid": "invalid",
+    }
+
+    r = client.post("/api/admin/submissions/bookings/bulk-delete", json={"ids": [booking_id, missing]})
+    assert r.status_code == 200
+    assert {x["id"]: x["status"] for x in r.json()["results"]} == {booking_id: "deleted", missing: "not_found"}
+    assert db(lambda conn: conn.fetchval("SELECT count(*) FROM bookings WHERE id = $1", booking_id)) == 0
+
+
+def test_bulk_delete_unsubscribed_matches_normalized_email(client, db):
+    import server
+
+    email = f"Mixed.{uuid.uuid4().hex[:8]}@Example.test"
+    db(
+        lambda conn: conn.execute(
+            "INSERT INTO unsubscribed_emails (email, email_norm) VALUES ($1, $2)", email, server._normalize_email(email)
+        )
+    )
+    r = client.post("/api/admin/submissions/unsubscribed/bulk-delete", json={"ids": [email, "nobody@example.test"]})
+    assert r.status_code == 200
+    assert {x["id"]: x["status"] for x in r.json()["results"]} == {email: "deleted", "nobody@example.test": "not_found"}
@@ -0,0 +1,37 @@
+"""GET /api/status keeps the StatusCheck response format."""
+import uuid
+from datetime import datetime, timezone
+
+import server
+
+
+def test_status_checks_match_response_model_format(client, db):
+    name = f"fmt-{uuid.uuid4().hex[:8]}"
+    stamps = [
+        datetime(2030, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+        datetime(2030, 1, 2, 3, 4, 6, 500000, tzinfo=timezone.utc),
+        datetime(2030, 1, 2, 3, 4, 7, tzinfo=timezone.utc),
+    ]
+    ids = [str(uuid.uuid4()) for _ in stamps]
+    db(
+        lambda conn: conn.executemany(
+            "INSERT INTO status_checks (id, client_name, timestamp) VALUES ($1, $2, $3)",
+            [(i, name, ts) for i, ts in zip(ids, stamps)],
+        )
+    )
+    try:
+        r = client.get("/api/status")
+        assert r.status_code == 200
+        got = [item for item in r.json() if item["client_name"] == name]
+        expected = [
+            server.StatusCheck(id=i, client_name=name, timestamp=ts).model_dump(mode="json")
+            for i, ts in sorted(zip(ids, stamps), key=lambda p: p[1], reverse=True)
+        ]
+        assert got == expected
+        assert [item["timestamp"] for item in got] == [
+            "2030-01-02T03:04:07Z",
+            "2030-01-02T03:04:06.500000Z",
+            "2030-01-02T03:04:05.678901Z",
+        ]
+    finally:
+        db(lambda conn: conn.execute("DELETE FROM status_checks WHERE client_name = $1", name))